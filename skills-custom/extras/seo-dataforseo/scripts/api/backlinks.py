@@ -9,14 +9,34 @@ from dataforseo_client.rest import ApiException
 from dataforseo_client.api.backlinks_api import BacklinksApi
 
 from core.client import get_client
+from core.executor import run_concurrent
+from core.items import iter_items, iter_results
 from core.storage import save_result
 from config.settings import settings
 
+# Max targets per bulk_* request
+BULK_TARGETS_LIMIT = 1000
+
+# Metric field -> bulk endpoint that returns it (items are {"target": ..., field: ...})
+BULK_METRIC_ENDPOINTS = {
+    "rank": "bulk_ranks_live",
+    "backlinks": "bulk_backlinks_live",
+    "referring_domains": "bulk_referring_domains_live",
+    "spam_score": "bulk_spam_score_live",
+}
+
+# Metric field -> name of the same value in a backlinks/summary result
+SUMMARY_METRIC_FIELDS = {
+    "rank": "rank",
+    "backlinks": "backlinks",
+    "referring_domains": "referring_domains",
+    "spam_score": "backlinks_spam_score",
+}
+
 
 def _get_backlinks_api() -> BacklinksApi:
-    """Get BacklinksApi instance from the shared api_client."""
-    client = get_client()
-    return BacklinksApi(client.api_client)
+    """Get BacklinksApi instance from the shared client."""
+    return get_client().backlinks
 
 
 def get_backlinks_summary(
@@ -239,3 +259,104 @@ def get_domain_pages(
     except ApiException as e:
         print(f"API Exception (domain pages {domain}): {e}")
         raise
+
+
+def _normalize_target(target: str) -> str:
+    target = (target or "").strip().lower()
+    return target[4:] if target.startswith("www.") else target
+
+
+def _bulk_metric(endpoint: str, field: str, targets: List[str]) -> Dict[str, Any]:
+    """Call one bulk_* endpoint and map {normalized target: field value}.
+
+    Every target the endpoint returned is in the map, with None for a null value.
+    """
+    api = _get_backlinks_api()
+    try:
+        response = getattr(api, endpoint)([{"targets": targets}])
+    except ApiException as e:
+        print(f"API Exception ({endpoint}, {len(targets)} targets): {e}")
+        raise
+
+    values = {}
+    for item in iter_items(response):
+        values[_normalize_target(item.get("target", ""))] = item.get(field)
+    return values
+
+
+def get_backlink_metrics(
+    domains: List[str],
+    fields: Optional[List[str]] = None,
+    chunk_size: int = BULK_TARGETS_LIMIT,
+    fallback: bool = True
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get rank / backlinks / referring domains / spam score for many domains.
+
+    Domains are chunked to the bulk endpoint limit and every (metric, chunk)
+    request runs concurrently. A failed bulk request is retried once; if it
+    fails again its domains get no value for that metric. Domains a successful
+    bulk response left out are filled from a per-domain summary call, and only
+    for those - a domain the endpoint returned with a null value is not looked
+    up again.
+
+    Args:
+        domains: Domains to look up
+        fields: Metrics to fetch (default: all of BULK_METRIC_ENDPOINTS)
+        chunk_size: Targets per bulk request (max 1000)
+        fallback: Fill gaps with per-domain get_backlinks_summary calls
+
+    Returns:
+        Dict of domain -> {field: value}; a domain whose lookups all failed maps to {}
+
+    Cost: one request per metric per 1000 domains, plus any per-domain fallbacks
+
+    Example:
+        >>> metrics = get_backlink_metrics(["site1.com", "site2.com"])
+        >>> metrics["site1.com"]["rank"]
+    """
+    fields = list(fields or BULK_METRIC_ENDPOINTS)
+    domains = list(dict.fromkeys(domains))
+    chunk_size = max(1, min(chunk_size, BULK_TARGETS_LIMIT))
+    chunks = [domains[i:i + chunk_size] for i in range(0, len(domains), chunk_size)]
+
+    def fetch(job):
+        return _bulk_metric(BULK_METRIC_ENDPOINTS[job[0]], job[0], job[1])
+
+    jobs = [(field, chunk) for field in fields for chunk in chunks]
+    results = run_concurrent(fetch, jobs)
+
+    # Retry failed chunks once - a per-domain fallback for a whole chunk costs ~1000x the bulk call
+    failed = [i for i, (_, error) in enumerate(results) if error is not None]
+    if failed:
+        print(f"   Retrying {len(failed)} failed bulk requests...")
+        for i, outcome in zip(failed, run_concurrent(fetch, [jobs[i] for i in failed])):
+            results[i] = outcome
+
+    metrics: Dict[str, Dict[str, Any]] = {d: {} for d in domains}
+    omitted: Dict[str, List[str]] = {}
+    for (field, chunk), (values, error) in zip(jobs, results):
+        if error is not None:
+            print(f"   ⚠️  {BULK_METRIC_ENDPOINTS[field]} failed for {len(chunk)} domains: {error}")
+            continue
+        for domain in chunk:
+            target = _normalize_target(domain)
+            if target not in values:
+                omitted.setdefault(domain, []).append(field)
+            elif values[target] is not None:
+                metrics[domain][field] = values[target]
+
+    missing = [d for d in domains if d in omitted]
+    if fallback and missing:
+        print(f"   Per-domain fallback for {len(missing)} domains...")
+        summaries = run_concurrent(lambda d: get_backlinks_summary(d, save=False), missing)
+        for domain, (raw, error) in zip(missing, summaries):
+            if error is not None:
+                continue
+            for result in iter_results(raw):
+                for field in omitted[domain]:
+                    value = result.get(SUMMARY_METRIC_FIELDS[field])
+                    if field not in metrics[domain] and value is not None:
+                        metrics[domain][field] = value
+
+    return metrics
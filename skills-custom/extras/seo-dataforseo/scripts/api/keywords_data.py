@@ -8,6 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dataforseo_client.rest import ApiException
 
+from core.batching import run_chunked
 from core.client import get_client
 from core.storage import save_result
 from config.settings import settings
@@ -23,7 +24,7 @@ def get_search_volume(
     Get search volume, CPC, and competition data for keywords.
 
     Args:
-        keywords: List of keywords to analyze (max 700)
+        keywords: List of keywords to analyze (any length, sent in concurrent chunks of 700)
         location_name: Target location (default: United States)
         language_name: Target language (default: English)
         save: Whether to save results to JSON file
@@ -39,13 +40,14 @@ def get_search_volume(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.keywords_data.google_ads_search_volume_live([{
-            "keywords": keywords[:700],
-            "location_name": location,
-            "language_name": language
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.keywords_data.google_ads_search_volume_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language
+            }]),
+            keywords, settings.MAX_KEYWORDS_SEARCH_VOLUME
+        )
 
         if save:
             keyword_preview = keywords[0] if keywords else "bulk"
@@ -124,7 +126,7 @@ def get_ad_traffic_by_keywords(
     Estimate advertising traffic potential for keywords.
 
     Args:
-        keywords: List of keywords to analyze
+        keywords: List of keywords to analyze (any length, sent in concurrent chunks of 1000)
         location_name: Target location
         language_name: Target language
         bid: Maximum CPC bid for estimation
@@ -141,14 +143,15 @@ def get_ad_traffic_by_keywords(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.keywords_data.google_ads_ad_traffic_by_keywords_live([{
-            "keywords": keywords,
-            "location_name": location,
-            "language_name": language,
-            "bid": bid
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.keywords_data.google_ads_ad_traffic_by_keywords_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language,
+                "bid": bid
+            }]),
+            keywords, settings.MAX_KEYWORDS_AD_TRAFFIC
+        )
 
         if save:
             save_result(
@@ -8,6 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dataforseo_client.rest import ApiException
 
+from core.batching import run_chunked
 from core.client import get_client
 from core.storage import save_result
 from config.settings import settings
@@ -24,7 +25,7 @@ def get_keyword_overview(
     Get comprehensive keyword data including search volume, CPC, competition, and search intent.
 
     Args:
-        keywords: List of keywords (max 700)
+        keywords: List of keywords (any length, sent in concurrent chunks of 700)
         location_name: Target location
         language_name: Target language
         include_serp_info: Include SERP features data
@@ -41,14 +42,15 @@ def get_keyword_overview(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.labs.google_keyword_overview_live([{
-            "keywords": keywords[:700],
-            "location_name": location,
-            "language_name": language,
-            "include_serp_info": include_serp_info
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.labs.google_keyword_overview_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language,
+                "include_serp_info": include_serp_info
+            }]),
+            keywords, settings.MAX_KEYWORDS_OVERVIEW
+        )
 
         if save:
             save_result(
@@ -265,7 +267,7 @@ def get_bulk_keyword_difficulty(
     Difficulty score (0-100) indicates how hard it is to rank in top-10 organic results.
 
     Args:
-        keywords: List of keywords (max 1000)
+        keywords: List of keywords (any length, sent in concurrent chunks of 1000)
         location_name: Target location
         language_name: Target language
         save: Whether to save results
@@ -281,13 +283,14 @@ def get_bulk_keyword_difficulty(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.labs.google_bulk_keyword_difficulty_live([{
-            "keywords": keywords[:1000],
-            "location_name": location,
-            "language_name": language
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.labs.google_bulk_keyword_difficulty_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language
+            }]),
+            keywords, settings.MAX_KEYWORDS_DIFFICULTY
+        )
 
         if save:
             save_result(
@@ -318,7 +321,7 @@ def get_historical_search_volume(
     Returns monthly search volume data since 2019.
 
     Args:
-        keywords: List of keywords (max 700)
+        keywords: List of keywords (any length, sent in concurrent chunks of 700)
         location_name: Target location
         language_name: Target language
         include_serp_info: Include SERP features
@@ -335,14 +338,15 @@ def get_historical_search_volume(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.labs.google_historical_search_volume_live([{
-            "keywords": keywords[:700],
-            "location_name": location,
-            "language_name": language,
-            "include_serp_info": include_serp_info
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.labs.google_historical_search_volume_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language,
+                "include_serp_info": include_serp_info
+            }]),
+            keywords, settings.MAX_KEYWORDS_HISTORICAL
+        )
 
         if save:
             save_result(
@@ -372,7 +376,7 @@ def get_search_intent(
     Classifies keywords as informational, navigational, transactional, or commercial.
 
     Args:
-        keywords: List of keywords (max 1000)
+        keywords: List of keywords (any length, sent in concurrent chunks of 1000)
         location_name: Target location
         language_name: Target language
         save: Whether to save results
@@ -388,13 +392,14 @@ def get_search_intent(
     language = language_name or settings.DEFAULT_LANGUAGE_NAME
 
     try:
-        response = client.labs.google_search_intent_live([{
-            "keywords": keywords[:1000],
-            "location_name": location,
-            "language_name": language
-        }])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        result = run_chunked(
+            lambda chunk: client.labs.google_search_intent_live([{
+                "keywords": chunk,
+                "location_name": location,
+                "language_name": language
+            }]),
+            keywords, settings.MAX_KEYWORDS_INTENT
+        )
 
         if save:
             save_result(
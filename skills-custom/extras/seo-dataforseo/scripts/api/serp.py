@@ -132,7 +132,8 @@ def get_google_maps_serp(
     location_code: int = None,
     language_code: str = "en",
     depth: int = 100,
-    save: bool = True
+    save: bool = True,
+    location_coordinate: str = None
 ) -> Dict[str, Any]:
     """
     Get Google Maps/Local search results for a keyword.
@@ -148,6 +149,8 @@ def get_google_maps_serp(
         language_code: Language code (default "en")
         depth: Number of results (max 100 per request)
         save: Whether to save results
+        location_coordinate: Search from a point instead of a location code,
+            as "latitude,longitude,zoom" (e.g. "44.9778,-93.2650,15z")
 
     Returns:
         Dict containing local business listings
@@ -159,12 +162,16 @@ def get_google_maps_serp(
     loc_code = location_code or settings.DEFAULT_LOCATION_CODE
 
     try:
-        response = client.serp.google_maps_live_advanced([{
+        task = {
             "keyword": keyword,
-            "location_code": loc_code,
             "language_code": language_code,
             "depth": min(depth, 100)
-        }])
+        }
+        if location_coordinate:
+            task["location_coordinate"] = location_coordinate
+        else:
+            task["location_code"] = loc_code
+        response = client.serp.google_maps_live_advanced([task])
 
         result = response.to_dict() if hasattr(response, 'to_dict') else response
 
@@ -8,7 +8,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dataforseo_client.rest import ApiException
 
+from core.batching import merge_responses, normalize_keyword, run_chunked
 from core.client import get_client
+from core.items import iter_items
 from core.storage import save_result
 from config.settings import settings
 
@@ -21,13 +23,19 @@ def get_trends_explore(
     date_from: str = None,
     date_to: str = None,
     category_code: int = None,
+    anchor: str = None,
     save: bool = True
 ) -> Dict[str, Any]:
     """
     Get Google Trends data for keywords.
 
+    Trends values are relative (0-100) within one request, and a request takes
+    at most 5 keywords. Longer lists are sent as concurrent batches that all
+    include the same anchor keyword; each batch's graph is rescaled by the
+    anchor's volume so every keyword lands on one comparable 0-100 scale.
+
     Args:
-        keywords: List of keywords to compare (max 5)
+        keywords: List of keywords to compare (any length, see above)
         location_name: Target location (defaults to worldwide if not specified)
         search_type: Type of search - "web", "news", "youtube", "images", "froogle" (shopping)
         time_range: Preset time range - "past_hour", "past_4_hours", "past_day",
@@ -36,6 +44,9 @@ def get_trends_explore(
         date_from: Custom start date (yyyy-mm-dd), overrides time_range
         date_to: Custom end date (yyyy-mm-dd)
         category_code: Google Trends category filter
+        anchor: Keyword shared by every batch when there are more than 5
+            (default: the first keyword). A mid-popularity keyword works best:
+            it should register in every batch without dwarfing the others.
         save: Whether to save results
 
     Returns:
@@ -49,7 +60,6 @@ def get_trends_explore(
     location = location_name or settings.DEFAULT_LOCATION_NAME
 
     request_params = {
-        "keywords": keywords[:5],  # API limit
         "location_name": location,
         "type": search_type
     }
@@ -65,9 +75,15 @@ def get_trends_explore(
         request_params["category_code"] = category_code
 
     try:
-        response = client.keywords_data.google_trends_explore_live([request_params])
-
-        result = response.to_dict() if hasattr(response, 'to_dict') else response
+        anchor = anchor or (keywords[0] if keywords else None)
+        result = run_chunked(
+            lambda batch: client.keywords_data.google_trends_explore_live([
+                dict(request_params, keywords=batch)
+            ]),
+            keywords, settings.MAX_TRENDS_KEYWORDS,
+            anchor=anchor,
+            merge=lambda responses: _merge_trend_batches(responses, anchor)
+        )
 
         if save:
             save_result(
@@ -85,6 +101,96 @@ def get_trends_explore(
         raise
 
 
+def _graph_item(response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    return next(iter_items(response, types={"google_trends_graph"}), None)
+
+
+def _merge_trend_batches(responses: List[Dict[str, Any]], anchor: str) -> Dict[str, Any]:
+    """
+    Merge anchored Trends batches into one response with a single rescaled graph.
+
+    Each batch's values are multiplied by (anchor total in the first batch /
+    anchor total in this batch), then the whole graph is renormalized so its
+    peak is 100. Map and related topics/queries items are kept per batch
+    (duplicates of the anchor's are dropped) - only the graph is comparable.
+    """
+    merged = merge_responses(responses)
+    graphs = [g for g in (_graph_item(r) for r in responses) if g and g.get("data")]
+    if not graphs:
+        return merged
+
+    def anchor_index(graph):
+        names = [normalize_keyword(kw) for kw in graph.get("keywords") or []]
+        return names.index(normalize_keyword(anchor)) if normalize_keyword(anchor) in names else None
+
+    def anchor_total(graph, idx):
+        return sum((row.get("values") or [])[idx] or 0 for row in graph["data"]
+                   if idx is not None and len(row.get("values") or []) > idx)
+
+    base_idx = anchor_index(graphs[0])
+    base_total = anchor_total(graphs[0], base_idx)
+
+    keywords = [anchor]
+    rows = {}  # timestamp -> first row seen (dates, missing_data flags)
+    columns = []  # (graph, kept column indexes, scale factor) per batch
+    for graph in graphs:
+        idx = anchor_index(graph)
+        total = anchor_total(graph, idx)
+        factor = base_total / total if base_total and total else 1.0
+        keep = [i for i in range(len(graph.get("keywords") or [])) if i != idx]
+        keywords.extend(graph["keywords"][i] for i in keep)
+        columns.append((graph, keep, factor))
+        for row in graph["data"]:
+            rows.setdefault(row.get("timestamp"), row)
+
+    def pick(values, i, factor):
+        return values[i] * factor if i < len(values) and values[i] is not None else None
+
+    by_timestamp = [{row.get("timestamp"): row.get("values") or [] for row in graph["data"]}
+                    for graph, _, _ in columns]
+    data = []
+    for timestamp, row in rows.items():
+        base_values = by_timestamp[0].get(timestamp) or []
+        values = [pick(base_values, base_idx, 1.0) if base_idx is not None else None]
+        for (graph, keep, factor), batch_rows in zip(columns, by_timestamp):
+            batch_values = batch_rows.get(timestamp) or []
+            values.extend(pick(batch_values, i, factor) for i in keep)
+        data.append((row, values))
+
+    base_avgs = graphs[0].get("averages") or []
+    averages = [pick(base_avgs, base_idx, 1.0) if base_idx is not None else None]
+    for graph, keep, factor in columns:
+        avgs = graph.get("averages") or []
+        averages.extend(pick(avgs, i, factor) for i in keep)
+
+    peak = max((v for _, values in data for v in values if v is not None), default=0)
+    scale = 100.0 / peak if peak else 1.0
+
+    def rescale(v):
+        return round(v * scale, 2) if v is not None else None
+
+    graph = dict(graphs[0])
+    graph["keywords"] = keywords
+    graph["data"] = [dict(row, values=[rescale(v) for v in values]) for row, values in data]
+    graph["averages"] = [rescale(v) for v in averages]
+    graph["anchor"] = anchor
+    graph["batch_scale_factors"] = [round(factor, 4) for _, _, factor in columns]
+
+    items, seen = [graph], set()
+    result = (merged.get("tasks") or [{}])[0].get("result") or [{}]
+    for item in result[0].get("items") or []:
+        if not isinstance(item, dict) or item.get("type") == "google_trends_graph":
+            continue
+        key = (item.get("type"), tuple(normalize_keyword(kw) for kw in item.get("keywords") or []))
+        if key not in seen:
+            seen.add(key)
+            items.append(item)
+    result[0]["items"] = items
+    result[0]["items_count"] = len(items)
+    result[0]["keywords"] = keywords
+    return merged
+
+
 def get_youtube_trends(
     keywords: List[str],
     location_name: str = None,
@@ -0,0 +1,104 @@
+"""
+Startup-time regression check for `import main`.
+
+Each run imports main in a fresh interpreter and reports how long the import
+took and which heavy modules it dragged in. Importing main must not load the
+SDK, dotenv/settings, aiohttp or any api/play module - those are bound lazily
+and only imported on first call.
+
+Usage:
+    python3 bench_startup.py                 # 5 runs, fail above 150 ms
+    python3 bench_startup.py --runs 10 --max-ms 100
+    python3 bench_startup.py --importtime    # also show the slowest imports
+
+Exits non-zero if the median import time exceeds --max-ms or a heavy module
+was loaded eagerly, so it can run as a CI/pre-commit gate.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+
+# Top-level packages that must stay out of sys.modules after `import main`
+HEAVY_PACKAGES = {
+    "dataforseo_client",
+    "pydantic",
+    "pydantic_core",
+    "urllib3",
+    "dotenv",
+    "aiohttp",
+    "config",
+    "core",
+    "api",
+}
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=SCRIPTS_DIR,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _eager_heavy(modules) -> list:
+    return [m for m in modules if m.split(".")[0] in HEAVY_PACKAGES or m.startswith("play")]
+
+
+def _importtime(top: int):
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"], cwd=SCRIPTS_DIR,
+        capture_output=True, text=True, check=True
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    print("\nSlowest imports (cumulative us):")
+    for cumulative, name in sorted(rows, reverse=True)[:top]:
+        print(f"  {cumulative:>8}  {name}")
+
+
+def bench(runs: int, max_ms: float) -> bool:
+    _run_once()  # warm the bytecode cache
+    samples = [_run_once() for _ in range(runs)]
+    times = [s["ms"] for s in samples]
+    median = statistics.median(times)
+    heavy = _eager_heavy(samples[-1]["modules"])
+
+    print(f"import main: median {median:.1f} ms  (min {min(times):.1f}, max {max(times):.1f}, "
+          f"{runs} runs, limit {max_ms:.0f} ms)")
+    ok = median <= max_ms
+    if heavy:
+        ok = False
+        print(f"Loaded eagerly ({len(heavy)}): {', '.join(heavy[:15])}"
+              f"{' ...' if len(heavy) > 15 else ''}")
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="import main startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=150.0)
+    parser.add_argument("--importtime", action="store_true", help="Show slowest imports")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    passed = bench(args.runs, args.max_ms)
+    if args.importtime:
+        _importtime(args.top)
+    sys.exit(0 if passed else 1)
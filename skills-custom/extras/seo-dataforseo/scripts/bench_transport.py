@@ -0,0 +1,120 @@
+"""
+Benchmark the raw JSON transport against the SDK model path on recorded payloads.
+
+Each payload is replayed through a real SDK ApiClient whose HTTP layer returns
+the recorded bytes, so both paths run exactly the code they run in production:
+    sdk: <Api>.<method>(body).to_dict()
+    raw: RawApi(<Api>).<method>(body)   (optionally with validation)
+
+Usage:
+    python3 bench_transport.py results/serp/*.json results/labs/*keyword_ideas*.json
+    python3 bench_transport.py --repeat 20 some_raw_response.json
+
+Accepts files written by save_result (any storage format) or bare API responses.
+The endpoint is taken from the response's tasks[0].path.
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from dataforseo_client import configuration as dfs_config
+from dataforseo_client import api_client as dfs_api_provider
+from dataforseo_client import rest
+from dataforseo_client.api.serp_api import SerpApi
+from dataforseo_client.api.keywords_data_api import KeywordsDataApi
+from dataforseo_client.api.dataforseo_labs_api import DataforseoLabsApi
+from dataforseo_client.api.backlinks_api import BacklinksApi
+
+from core.client import RawApi
+from core.storage import load_result
+
+API_CLASSES = {
+    "serp": SerpApi,
+    "keywords_data": KeywordsDataApi,
+    "dataforseo_labs": DataforseoLabsApi,
+    "backlinks": BacklinksApi,
+}
+
+
+class _Recorded:
+    """Stands in for a urllib3 response carrying a recorded body."""
+
+    def __init__(self, body: bytes):
+        self.status = 200
+        self.reason = "OK"
+        self.data = body
+        self.headers = {"content-type": "application/json; charset=utf-8"}
+
+
+class _ReplayRest:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def request(self, *args, **kwargs):
+        return rest.RESTResponse(_Recorded(self.body))
+
+
+def _load_payload(path: Path) -> dict:
+    data = load_result(path)
+    if isinstance(data, dict) and "metadata" in data and "data" in data:
+        data = data["data"]
+    return data
+
+
+def _time(fn, repeat: int):
+    fn()  # warm up imports and pydantic validators
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    # Measured separately: tracemalloc slows allocation-heavy code several-fold
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_file(path: Path, repeat: int):
+    payload = _load_payload(path)
+    task = (payload.get("tasks") or [{}])[0]
+    api_path = task.get("path") or []
+    if len(api_path) < 3 or api_path[1] not in API_CLASSES:
+        print(f"{path.name}: skipped (unknown endpoint {api_path})")
+        return None
+
+    body = json.dumps(payload).encode("utf-8")
+    api_client = dfs_api_provider.ApiClient(dfs_config.Configuration(username="bench", password="bench"))
+    api_client.rest_client = _ReplayRest(body)
+    api = API_CLASSES[api_path[1]](api_client)
+    method = "_".join(api_path[2:])
+    request = [task.get("data") or {}]
+
+    sdk = lambda: getattr(api, method)(request).to_dict()
+    raw = lambda: getattr(RawApi(api), method)(request)
+    checked = lambda: getattr(RawApi(api, validate=True), method)(request)
+
+    results = {name: _time(fn, repeat) for name, fn in
+               (("sdk", sdk), ("raw", raw), ("raw+validate", checked))}
+    sdk_time = results["sdk"][0]
+    print(f"{path.name} ({method}, {len(body) / 1024:.0f} KB)")
+    for name, (elapsed, peak) in results.items():
+        print(f"  {name:<13} {elapsed * 1000:8.2f} ms  peak {peak / 1024 / 1024:6.1f} MB  "
+              f"{sdk_time / elapsed:5.1f}x")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SDK vs raw transport benchmark")
+    parser.add_argument("files", nargs="+", help="Recorded responses / saved results")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    for f in args.files:
+        bench_file(Path(f), args.repeat)
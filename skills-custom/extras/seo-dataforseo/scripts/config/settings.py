@@ -24,13 +24,42 @@ class Settings:
     # Results storage (saves to current working directory)
     RESULTS_DIR: Path = Path.cwd() / "results"
 
-    # API limits (for reference)
+    # Transport: "sdk" returns SDK response models; "raw" posts the SDK's request and
+    # returns parsed JSON (skips model deserialization). VALIDATE checks raw
+    # responses against the SDK models anyway.
+    TRANSPORT: str = os.getenv("DATAFORSEO_TRANSPORT", "sdk")
+    VALIDATE_RESPONSES: bool = os.getenv("DATAFORSEO_VALIDATE", "0").lower() in ("1", "true", "yes")
+
+    # Saved result format: "json" (pretty), "json.gz" or "json.zst" (compact + compressed)
+    STORAGE_FORMAT: str = os.getenv("DATAFORSEO_STORAGE_FORMAT", "json")
+
+    # Response cache (DATAFORSEO_CACHE=0 disables it)
+    CACHE_ENABLED: bool = os.getenv("DATAFORSEO_CACHE", "1").lower() not in ("0", "false", "no")
+    CACHE_DIR: Path = RESULTS_DIR / ".cache"
+    CACHE_MAX_MB: int = int(os.getenv("DATAFORSEO_CACHE_MAX_MB", "512"))
+
+    # API limits per task - longer keyword lists are split into chunks of this size
     MAX_KEYWORDS_SEARCH_VOLUME: int = 700
+    MAX_KEYWORDS_AD_TRAFFIC: int = 1000
     MAX_KEYWORDS_OVERVIEW: int = 700
+    MAX_KEYWORDS_HISTORICAL: int = 700
     MAX_KEYWORDS_DIFFICULTY: int = 1000
+    MAX_KEYWORDS_INTENT: int = 1000
     MAX_KEYWORDS_IDEAS: int = 200
     MAX_TRENDS_KEYWORDS: int = 5
 
+    # Request concurrency - DataForSEO allows 2000 calls/minute per account
+    MAX_CALLS_PER_MINUTE: int = int(os.getenv("DATAFORSEO_CALLS_PER_MINUTE", "2000"))
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv("DATAFORSEO_MAX_CONCURRENCY", "10"))
+    # fan_out(): seconds one call of a composite workflow may take before it's given up on
+    CALL_TIMEOUT_SECONDS: float = float(os.getenv("DATAFORSEO_CALL_TIMEOUT", "120"))
+
+    # Default dollar cap for each metered play run (0 = no cap); a play's budget= overrides it
+    RUN_BUDGET: float = float(os.getenv("DATAFORSEO_RUN_BUDGET", "0"))
+
+    # Standard queue (task_post/task_get) jobs: how long to wait for results before giving up
+    QUEUE_TIMEOUT_MINUTES: int = int(os.getenv("DATAFORSEO_QUEUE_TIMEOUT", "60"))
+
     @classmethod
     def validate(cls) -> bool:
         """Validate required settings are present."""
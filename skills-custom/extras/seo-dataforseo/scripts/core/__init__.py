@@ -1,5 +1,11 @@
 """Core module with client and storage utilities."""
+from .batching import keyword_table
+from .cache import cache_report
 from .client import get_client
+from .clustering import cluster_keywords
+from .executor import fan_out, run_concurrent
 from .storage import save_result, load_result, list_results
+from .task_queue import run_queued
+from .usage import usage_report
 
-__all__ = ["get_client", "save_result", "load_result", "list_results"]
+__all__ = ["keyword_table", "cache_report", "get_client", "cluster_keywords", "fan_out", "run_concurrent", "run_queued", "usage_report", "save_result", "load_result", "list_results"]
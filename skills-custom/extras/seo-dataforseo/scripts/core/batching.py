@@ -0,0 +1,182 @@
+"""Split keyword lists to endpoint limits, dispatch chunks concurrently, merge the responses."""
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.executor import run_concurrent
+from core.items import Field, iter_results
+
+# keyword_table() columns -> where each response shape keeps the value
+_TABLE_FIELDS = {
+    "search_volume": Field("search_volume", "keyword_info.search_volume"),
+    "cpc": Field("cpc", "keyword_info.cpc"),
+    "keyword_difficulty": Field("keyword_difficulty", "keyword_properties.keyword_difficulty"),
+    "intent": Field("keyword_intent.label", "search_intent_info.main_intent"),
+}
+
+
+def normalize_keyword(keyword: Any) -> str:
+    """Case/whitespace-insensitive form of a keyword, for matching."""
+    return " ".join(str(keyword or "").lower().split())
+
+
+def unique_keywords(keywords: Iterable[str]) -> List[str]:
+    """Drop blanks and case/whitespace duplicates, keeping first-seen order and spelling."""
+    seen = set()
+    unique = []
+    for kw in keywords:
+        norm = normalize_keyword(kw)
+        if norm and norm not in seen:
+            seen.add(norm)
+            unique.append(str(kw).strip())
+    return unique
+
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    size = max(1, size)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _as_dict(response: Any) -> Dict[str, Any]:
+    return response.to_dict() if hasattr(response, "to_dict") else response
+
+
+def merge_responses(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-chunk responses into one response shaped like a single call.
+
+    The first chunk's task is the template: its result gets every chunk's rows
+    (Labs-style `result[0].items` are concatenated into one result; flat
+    per-keyword results, as from search volume, are concatenated as-is), and
+    `data.keywords`, counts and cost cover all chunks.
+    """
+    responses = [r for r in responses if isinstance(r, dict)]
+    if not responses:
+        return {}
+    if len(responses) == 1:
+        return responses[0]
+
+    merged = dict(responses[0])
+    tasks = [t for r in responses for t in (r.get("tasks") or []) if isinstance(t, dict)]
+    if not tasks:
+        return merged
+
+    task = dict(tasks[0])
+    results = [res for t in tasks for res in (t.get("result") or []) if isinstance(res, dict)]
+    if results and "items" in results[0]:
+        first = dict(results[0])
+        first["items"] = [item for res in results for item in (res.get("items") or [])]
+        first["items_count"] = len(first["items"])
+        if "total_count" in first:
+            first["total_count"] = sum(res.get("total_count") or 0 for res in results)
+        task["result"] = [first]
+    else:
+        task["result"] = results
+    task["result_count"] = len(task["result"])
+    task["cost"] = sum(t.get("cost") or 0 for t in tasks)
+
+    data = dict(task.get("data") or {})
+    if "keywords" in data:
+        data["keywords"] = [kw for t in tasks for kw in ((t.get("data") or {}).get("keywords") or [])]
+    task["data"] = data
+
+    merged["tasks"] = [task]
+    merged["tasks_count"] = 1
+    merged["tasks_error"] = sum(r.get("tasks_error") or 0 for r in responses)
+    merged["cost"] = sum(r.get("cost") or 0 for r in responses)
+    return merged
+
+
+def run_chunked(
+    call: Callable[[List[str]], Any],
+    keywords: List[str],
+    limit: int,
+    max_workers: Optional[int] = None,
+    anchor: Optional[str] = None,
+    merge: Callable[[List[Dict[str, Any]]], Dict[str, Any]] = merge_responses
+) -> Dict[str, Any]:
+    """
+    Call an endpoint for any number of keywords, `limit` at a time, and merge the results.
+
+    Chunks go out concurrently through run_concurrent. If some chunks fail the
+    merged result keeps the rest and lists the failures under "chunk_errors";
+    if all of them fail the first error is raised.
+
+    Args:
+        call: Function taking one keyword chunk and returning the API response
+        keywords: Keywords of any length (duplicates/blanks are dropped)
+        limit: Endpoint's max keywords per task (see settings.MAX_KEYWORDS_*)
+        max_workers: Concurrent chunks (default: settings.MAX_CONCURRENT_REQUESTS)
+        anchor: Keyword to put first in every chunk (chunks then carry limit - 1
+            other keywords), for endpoints whose values are only relative
+            within one task and must be rescaled by `merge`
+        merge: Combines the successful chunk responses (default: merge_responses)
+
+    Returns:
+        One merged response
+
+    Example:
+        >>> run_chunked(lambda chunk: client.labs.google_keyword_overview_live([{"keywords": chunk}]),
+        ...             keywords, settings.MAX_KEYWORDS_OVERVIEW)
+    """
+    keywords = unique_keywords(keywords)
+    if anchor and len(keywords) > limit:
+        others = [kw for kw in keywords if normalize_keyword(kw) != normalize_keyword(anchor)]
+        chunks = [[anchor] + chunk for chunk in chunked(others, limit - 1)]
+    else:
+        chunks = chunked(keywords, limit)
+    if len(chunks) <= 1:
+        return _as_dict(call(chunks[0] if chunks else []))
+
+    outcomes = run_concurrent(lambda chunk: _as_dict(call(chunk)), chunks, max_workers=max_workers)
+    errors = [(chunk, error) for chunk, (_, error) in zip(chunks, outcomes) if error is not None]
+    if len(errors) == len(chunks):
+        raise errors[0][1]
+
+    merged = merge([value for value, error in outcomes if error is None])
+    if errors:
+        print(f"   ⚠️  {len(errors)}/{len(chunks)} keyword chunks failed")
+        merged["chunk_errors"] = [
+            {"keywords": len(chunk), "first_keyword": chunk[0], "error": str(error)}
+            for chunk, error in errors
+        ]
+    return merged
+
+
+def _keyword_rows(response: Dict[str, Any]):
+    # Labs responses keep rows under result[].items, Google Ads ones are flat per-keyword results
+    for res in iter_results(response):
+        if "items" in res:
+            yield from (item for item in res.get("items") or [] if isinstance(item, dict))
+        elif res.get("keyword"):
+            yield res
+
+
+def keyword_table(*results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Join keyword responses (search volume, overview, difficulty, intent, ...) into one table.
+
+    Returns:
+        One row per keyword, in first-seen order, with keyword, search_volume,
+        cpc, keyword_difficulty and intent (None where no response had the value)
+
+    Example:
+        >>> keyword_table(get_keyword_overview(kws), get_bulk_keyword_difficulty(kws))
+    """
+    table: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for row in _keyword_rows(result):
+            keyword = row.get("keyword")
+            if not keyword:
+                continue
+            entry = table.setdefault(normalize_keyword(keyword), {
+                "keyword": keyword, **{field: None for field in _TABLE_FIELDS}
+            })
+            for field, lookup in _TABLE_FIELDS.items():
+                if entry[field] is None:
+                    entry[field] = lookup(row)
+    return list(table.values())
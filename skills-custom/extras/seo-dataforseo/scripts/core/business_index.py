@@ -0,0 +1,177 @@
+"""Persistent dedupe index for scraped local businesses.
+
+Every listing local_business_scraper() keeps is registered in SQLite under
+each identity key it has - Maps place_id, website, phone number and a fuzzy
+name + street address hash. A listing matching any key of a known business
+is that business, even when Maps gives it a second place_id or drops the
+website. The index outlives the run, so re-scraping a state weeks later
+tells which businesses are new.
+"""
+import hashlib
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.db import connect
+from core.domains import split_target
+
+BUSINESS_DB_NAME = "businesses.sqlite3"
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Words that don't tell two businesses apart ("St. Mark's Church, Inc." = "st marks church")
+_NAME_NOISE = frozenset({"the", "of", "and", "inc", "llc", "ltd", "co", "corp", "company"})
+
+# USPS-style street abbreviations, so "123 North Main Street" = "123 N Main St"
+_ADDRESS_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "av": "ave", "road": "rd", "boulevard": "blvd",
+    "drive": "dr", "lane": "ln", "court": "ct", "place": "pl", "parkway": "pkwy",
+    "highway": "hwy", "circle": "cir", "terrace": "ter", "square": "sq", "trail": "trl",
+    "north": "n", "south": "s", "east": "e", "west": "w",
+    "northeast": "ne", "northwest": "nw", "southeast": "se", "southwest": "sw",
+}
+# Unit designators - the rest of the street line is the suite, not the building
+_ADDRESS_UNITS = frozenset({"suite", "ste", "unit", "apt", "fl", "floor", "rm", "room"})
+
+# Toll-free area codes - chains share one across every branch
+_TOLL_FREE = frozenset({"800", "833", "844", "855", "866", "877", "888"})
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS businesses (
+        id INTEGER PRIMARY KEY,
+        scope TEXT NOT NULL,
+        name TEXT,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        created_at REAL NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS business_keys (
+        scope TEXT NOT NULL,
+        key TEXT NOT NULL,
+        business_id INTEGER NOT NULL,
+        PRIMARY KEY (scope, key)
+    ) WITHOUT ROWID;
+"""
+
+_db_lock = threading.Lock()
+
+
+def _db() -> sqlite3.Connection:
+    return connect(BUSINESS_DB_NAME, _SCHEMA)
+
+
+def _scope(business_type: str) -> str:
+    return " ".join(str(business_type).lower().split())
+
+
+def _street(address: str) -> str:
+    """Building part of the first address line: number and street, abbreviated, unit dropped."""
+    line = str(address or "").lower().split(",")[0].split("#")[0]
+    words = []
+    for word in _WORD_RE.findall(line):
+        if word in _ADDRESS_UNITS:
+            break
+        words.append(_ADDRESS_ABBREVIATIONS.get(word, word))
+    return " ".join(words)
+
+
+def business_keys(biz: Dict[str, Any]) -> List[str]:
+    """
+    Identity keys of a scraped business, strongest first.
+
+    - place:<Maps place_id>
+    - site:<website without scheme/www/query>|<zip or city> - a bare homepage
+      is the domain; the ZIP keeps chain branches that share one apart
+    - phone:<last 10 digits> (not toll-free numbers)
+    - name_addr:<hash of sorted name words + normalized street address>, so
+      "The Grace Church, 12 North Main Street, Suite 4" = "Grace Church, 12 N Main St"
+    """
+    keys = []
+    if biz.get("place_id"):
+        keys.append(f"place:{biz['place_id']}")
+
+    host, path = split_target(str(biz.get("website") or "").split("?")[0].split("#")[0])
+    if host:
+        area = str(biz.get("zip") or biz.get("city") or "").strip().lower()
+        keys.append(f"site:{host}{path}|{area}")
+
+    digits = re.sub(r"\D", "", str(biz.get("phone") or ""))
+    if len(digits) >= 7 and digits[-10:-7] not in _TOLL_FREE:
+        keys.append(f"phone:{digits[-10:]}")
+
+    name = " ".join(sorted(set(_WORD_RE.findall(str(biz.get("name") or "").lower().replace("'", ""))) - _NAME_NOISE))
+    street = _street(biz.get("address"))
+    if name and street:
+        digest = hashlib.sha1(f"{name}|{street}".encode("utf-8")).hexdigest()[:16]
+        keys.append(f"name_addr:{digest}")
+    return keys
+
+
+def register_businesses(business_type: str, businesses: Iterable[Dict[str, Any]], seen_on=None) -> List[Dict[str, Any]]:
+    """
+    Match each business against the index, adding the unknown ones.
+
+    A business that matches any known key gets that business's id, and any
+    keys it brings that weren't indexed yet (a new phone, a second place_id)
+    are added too. Two listings of one business in the same batch get the
+    same id. Businesses of different types are indexed separately.
+
+    Args:
+        business_type: Index scope (e.g. "church") - case/whitespace-insensitive
+        businesses: Scraped business dicts (place_id, website, phone, name, address, zip, city)
+        seen_on: Day of the scrape (date or "YYYY-MM-DD", default today)
+
+    Returns:
+        One dict per business, in order: business_id, is_new (not in the
+        index before this call), first_seen (day it was first indexed)
+
+    Example:
+        >>> entries = register_businesses("church", businesses)
+        >>> new = [biz for biz, entry in zip(businesses, entries) if entry["is_new"]]
+    """
+    scope = _scope(business_type)
+    day = seen_on.isoformat() if isinstance(seen_on, date) else str(seen_on or date.today().isoformat())[:10]
+    now = time.time()
+    created = set()
+    entries = []
+
+    db = _db()
+    with _db_lock:
+        for biz in businesses:
+            keys = business_keys(biz)
+            business_id = None
+            for key in keys:
+                row = db.execute(
+                    "SELECT business_id FROM business_keys WHERE scope = ? AND key = ?", (scope, key)
+                ).fetchone()
+                if row:
+                    business_id = row[0]
+                    break
+            if business_id is None:
+                business_id = db.execute(
+                    "INSERT INTO businesses (scope, name, first_seen, last_seen, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (scope, biz.get("name") or "", day, day, now)
+                ).lastrowid
+                created.add(business_id)
+            else:
+                db.execute("UPDATE businesses SET last_seen = MAX(last_seen, ?) WHERE id = ?", (day, business_id))
+            db.executemany(
+                "INSERT OR IGNORE INTO business_keys VALUES (?, ?, ?)",
+                [(scope, key, business_id) for key in keys]
+            )
+            first_seen = db.execute("SELECT first_seen FROM businesses WHERE id = ?", (business_id,)).fetchone()[0]
+            entries.append({
+                "business_id": business_id,
+                "is_new": business_id in created,
+                "first_seen": first_seen,
+            })
+        db.commit()
+    return entries
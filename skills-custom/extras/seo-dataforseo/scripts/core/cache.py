@@ -0,0 +1,297 @@
+"""Content-addressed response cache for DataForSEO live endpoints."""
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.db import connect
+from core.usage import record_call
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# TTL by endpoint prefix ("<api group>.<sdk method>"), first match wins
+ENDPOINT_TTLS = [
+    ("serp.", 6 * HOUR),
+    ("backlinks.", 7 * DAY),
+    ("keywords_data.google_trends_trending_now", 1 * HOUR),
+    ("keywords_data.google_trends", 1 * DAY),
+    ("keywords_data.", 14 * DAY),
+    ("labs.google_ranked_keywords", 3 * DAY),
+    ("labs.google_competitors", 3 * DAY),
+    ("labs.google_keywords_for_site", 3 * DAY),
+    ("labs.", 14 * DAY),
+]
+DEFAULT_TTL = 1 * DAY
+
+# Request fields whose string values are case/whitespace-insensitive
+_NORMALIZED_FIELDS = {"keyword", "keywords", "target", "targets"}
+
+_local = threading.local()
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        endpoint TEXT NOT NULL,
+        body BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at);
+    CREATE TABLE IF NOT EXISTS stats (
+        endpoint TEXT PRIMARY KEY,
+        hits INTEGER NOT NULL DEFAULT 0,
+        misses INTEGER NOT NULL DEFAULT 0,
+        evictions INTEGER NOT NULL DEFAULT 0
+    );
+"""
+
+
+def ttl_for(endpoint: str) -> int:
+    """Get the cache TTL in seconds for an endpoint."""
+    for prefix, ttl in ENDPOINT_TTLS:
+        if endpoint.startswith(prefix):
+            return ttl
+    return DEFAULT_TTL
+
+
+def _normalize(value: Any, field: Optional[str] = None) -> Any:
+    if isinstance(value, dict):
+        return {k: _normalize(v, k) for k, v in value.items() if v is not None}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, field) for v in value]
+    if isinstance(value, str) and field in _NORMALIZED_FIELDS:
+        return " ".join(value.lower().split())
+    if hasattr(value, "to_dict"):
+        return _normalize(value.to_dict(), field)
+    return value
+
+
+def cache_key(endpoint: str, params: Any) -> str:
+    """Hash an endpoint plus canonicalized request params."""
+    canonical = json.dumps(_normalize(params), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{endpoint}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Only keep fully successful responses."""
+    if not isinstance(result, dict) or result.get("status_code") != 20000:
+        return False
+    tasks = result.get("tasks") or []
+    return bool(tasks) and all(isinstance(t, dict) and t.get("status_code") == 20000 for t in tasks)
+
+
+@contextmanager
+def cache_bypass():
+    """Skip cache reads on this thread (fresh responses are still stored)."""
+    previous = getattr(_local, "bypass", False)
+    _local.bypass = True
+    try:
+        yield
+    finally:
+        _local.bypass = previous
+
+
+class ResponseCache:
+    """SQLite-backed response store with per-endpoint TTLs and LRU eviction."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        return connect(self.path.name, _SCHEMA, directory=self.path.parent)
+
+    def _count(self, db: sqlite3.Connection, endpoint: str, column: str, n: int = 1):
+        db.execute("INSERT OR IGNORE INTO stats (endpoint) VALUES (?)", (endpoint,))
+        db.execute(f"UPDATE stats SET {column} = {column} + ? WHERE endpoint = ?", (n, endpoint))
+
+    def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """Return a cached response, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                "SELECT body, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row and row[1] > now:
+                db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._count(db, endpoint, "hits")
+                db.commit()
+                return json.loads(zlib.decompress(row[0]))
+            self._count(db, endpoint, "misses")
+            db.commit()
+        return None
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Return a cached response without counting a hit/miss or touching its LRU slot."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT body FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else None
+
+    def put(self, endpoint: str, key: str, body: bytes, ttl: int):
+        """Store an encoded response and evict LRU entries over the size cap."""
+        blob = zlib.compress(body)
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, blob, len(blob), now, now + ttl, now)
+            )
+            self._evict(db, now)
+            db.commit()
+
+    def _evict(self, db: sqlite3.Connection, now: float):
+        db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted: Dict[str, int] = {}
+        for key, endpoint, size in db.execute(
+            "SELECT key, endpoint, size FROM entries ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            evicted[endpoint] = evicted.get(endpoint, 0) + 1
+            total -= size
+        for endpoint, n in evicted.items():
+            self._count(db, endpoint, "evictions", n)
+
+    def report(self) -> Dict[str, Any]:
+        """Get hit/miss counts per endpoint plus current cache size."""
+        with self._lock:
+            db = self._db()
+            stats = db.execute(
+                "SELECT endpoint, hits, misses, evictions FROM stats ORDER BY hits + misses DESC"
+            ).fetchall()
+            entries, size = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+        endpoints: List[Dict[str, Any]] = []
+        for endpoint, hits, misses, evictions in stats:
+            lookups = hits + misses
+            endpoints.append({
+                "endpoint": endpoint,
+                "hits": hits,
+                "misses": misses,
+                "evictions": evictions,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0
+            })
+        hits = sum(e["hits"] for e in endpoints)
+        lookups = hits + sum(e["misses"] for e in endpoints)
+        return {
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "endpoints": endpoints
+        }
+
+    def clear(self):
+        """Drop all cached responses and stats."""
+        with self._lock:
+            db = self._db()
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM stats")
+            db.commit()
+
+
+class CachedApi:
+    """Proxy around an SDK API object that serves *_live calls from the cache.
+
+    Cached calls return the response as a plain dict (what `to_dict()` would
+    give), so callers that do `response.to_dict() if hasattr(...)` work unchanged.
+    """
+
+    def __init__(self, api: Any, group: str, cache: ResponseCache):
+        self._api = api
+        self._group = group
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if not callable(attr) or "_live" not in name:
+            return attr
+
+        endpoint = f"{self._group}.{name}"
+        cache = self._cache
+
+        def call(*args, **kwargs):
+            key = cache_key(endpoint, [args, kwargs])
+            if not getattr(_local, "bypass", False):
+                cached = cache.get(endpoint, key)
+                if cached is not None:
+                    record_call(endpoint, cached=True)
+                    return cached
+
+            response = attr(*args, **kwargs)
+            result = response.to_dict() if hasattr(response, "to_dict") else response
+            if not _is_cacheable(result):
+                return response
+            body = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+            cache.put(endpoint, key, body, ttl_for(endpoint))
+            return json.loads(body)
+
+        return call
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """Get or create the shared response cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    settings.CACHE_DIR / "responses.sqlite3",
+                    settings.CACHE_MAX_MB * 1024 * 1024
+                )
+    return _cache
+
+
+def wrap_api(api: Any, group: str) -> Any:
+    """Wrap an SDK API object with the response cache if caching is enabled."""
+    if not settings.CACHE_ENABLED:
+        return api
+    return CachedApi(api, group, get_cache())
+
+
+def cache_report(verbose: bool = True) -> Dict[str, Any]:
+    """
+    Get (and optionally print) the cache hit-rate report.
+
+    Returns:
+        Dict with overall and per-endpoint hits, misses, evictions and hit rate
+    """
+    report = get_cache().report()
+    if verbose:
+        print(f"Response cache: {report['entries']} entries, "
+              f"{report['size_bytes'] / 1024 / 1024:.1f}/{report['max_bytes'] / 1024 / 1024:.0f} MB")
+        print(f"Hit rate: {report['hit_rate']:.0%} ({report['hits']}/{report['lookups']} lookups)")
+        for e in report["endpoints"]:
+            print(f"  {e['endpoint']:<55} {e['hit_rate']:>5.0%}  "
+                  f"hits={e['hits']} misses={e['misses']} evicted={e['evictions']}")
+    return report
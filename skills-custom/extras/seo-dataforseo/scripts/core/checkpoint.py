@@ -0,0 +1,104 @@
+"""Append-only JSONL journals that let long-running plays resume after a crash."""
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.cache import cache_key
+
+CHECKPOINT_DIR_NAME = ".checkpoints"
+
+
+class Checkpoint:
+    """
+    Journal of finished work units (a city, a domain, a keyword...) for one play run.
+
+    Each unit is appended as one JSON line and flushed as soon as it finishes,
+    so a crash or Ctrl-C loses at most the unit in flight. Running the play
+    again with the same params finds the journal: finished units are read back
+    instead of being paid for again. Call complete() once the merged result is
+    saved; a run that still has failed units keeps its journal for the next try.
+
+    Example:
+        >>> checkpoint = Checkpoint("local_scraper", {"business_type": "church", "cities": cities})
+        >>> for city in checkpoint.pending(cities):
+        ...     checkpoint.record(city, scrape(city))
+        >>> merged = [checkpoint.get(city) for city in cities]
+        >>> checkpoint.complete()
+    """
+
+    def __init__(self, play: str, params: Any):
+        self.play = play
+        self.run_id = cache_key(f"checkpoint.{play}", params)[:16]
+        self.path = settings.RESULTS_DIR / CHECKPOINT_DIR_NAME / f"{play}__{self.run_id}.jsonl"
+        self._lock = threading.Lock()
+        self._file = None
+        self._done: Dict[str, Any] = {}
+        self._torn = False
+        self._load()
+        self.resumed = len(self._done)
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        text = self.path.read_text(encoding="utf-8")
+        for line in text.splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # last line cut off by a crash
+            self._done[entry["unit"]] = entry.get("value")
+        self._torn = bool(text) and not text.endswith("\n")
+
+    def __contains__(self, unit: str) -> bool:
+        return unit in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def get(self, unit: str, default: Any = None) -> Any:
+        """Get the recorded value of a finished unit."""
+        return self._done.get(unit, default)
+
+    def pending(self, units: Iterable[str]) -> List[str]:
+        """Units not finished yet, in the given order."""
+        return [unit for unit in units if unit not in self._done]
+
+    def record(self, unit: str, value: Any = None):
+        """Mark a unit finished and journal its value (must be JSON-serializable)."""
+        line = json.dumps({"unit": unit, "value": value}, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+                if self._torn:
+                    self._file.write("\n")
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._done[unit] = value
+
+    def close(self):
+        """Close the journal file, keeping it for a later resume."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def complete(self):
+        """The run's result is saved - drop the journal."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def list_checkpoints(play: Optional[str] = None) -> List[Path]:
+    """List unfinished run journals, newest first."""
+    directory = settings.RESULTS_DIR / CHECKPOINT_DIR_NAME
+    if not directory.exists():
+        return []
+    pattern = f"{play}__*.jsonl" if play else "*.jsonl"
+    return sorted(directory.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
@@ -1,5 +1,12 @@
 """DataForSEO API client initialization."""
+import functools
+import importlib
+import inspect
+import json
 import sys
+import threading
+import time
+from collections import deque
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -10,21 +17,219 @@ from dataforseo_client import api_client as dfs_api_provider
 from dataforseo_client.api.serp_api import SerpApi
 from dataforseo_client.api.keywords_data_api import KeywordsDataApi
 from dataforseo_client.api.dataforseo_labs_api import DataforseoLabsApi
+from dataforseo_client.api.backlinks_api import BacklinksApi
+from dataforseo_client.rest import ApiException
 
 from config.settings import settings
+from core.cache import wrap_api
+from core.usage import record_call, reserve_call
+
+
+class RateLimiter:
+    """Sliding-window limiter for the account-wide calls-per-minute cap."""
+
+    def __init__(self, calls_per_minute: int, window: float = 60.0):
+        self.calls_per_minute = max(1, calls_per_minute)
+        self.window = window
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until another call fits in the current window."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.window:
+                    self._calls.popleft()
+                if len(self._calls) < self.calls_per_minute:
+                    self._calls.append(now)
+                    return
+                wait = self.window - (now - self._calls[0])
+            time.sleep(wait)
+
+
+class _GovernedApiClient(dfs_api_provider.ApiClient):
+    """SDK ApiClient that waits on the shared rate limiter before each call."""
+
+    def __init__(self, configuration, limiter: RateLimiter):
+        super().__init__(configuration)
+        self._limiter = limiter
+
+    def call_api(self, *args, **kwargs):
+        self._limiter.acquire()
+        return super().call_api(*args, **kwargs)
+
+
+def _response_model(result: dict):
+    """Find the SDK response model for a raw response from its task path.
+
+    e.g. ["v3", "serp", "google", "organic", "live", "advanced"]
+    -> dataforseo_client.models.serp_google_organic_live_advanced_response_info
+    """
+    for task in result.get("tasks") or []:
+        path = task.get("path") if isinstance(task, dict) else None
+        if path and len(path) > 1:
+            module_name = "_".join(path[1:]) + "_response_info"
+            class_name = "".join(part.capitalize() for part in module_name.split("_"))
+            try:
+                module = importlib.import_module(f"dataforseo_client.models.{module_name}")
+                return getattr(module, class_name, None)
+            except ImportError:
+                return None
+    return None
+
+
+def validate_response(result: dict) -> dict:
+    """Validate a raw response against its SDK model; raises on mismatch."""
+    model = _response_model(result)
+    if model is not None:
+        model.from_dict(result)
+    return result
+
+
+# Endpoint kinds served by the raw transport: live calls and the standard queue
+RAW_METHOD_MARKERS = ("_live", "_task_post", "_tasks_ready", "_task_get")
+
+# Trailing parameters of the SDK's generated _<method>_serialize helpers
+SERIALIZER_TAIL = ("_request_auth", "_content_type", "_headers", "_host_index")
+
+# The ones DataForSEO charges for - tasks_ready / task_get polls are free
+CHARGED_METHOD_MARKERS = ("_live", "_task_post")
+
+
+@functools.lru_cache(maxsize=None)
+def _serializer_arity(func) -> int:
+    """Request params a generated serializer function takes between self and
+    SERIALIZER_TAIL, or -1 if its signature is not the one RawApi knows how to call."""
+    params = list(inspect.signature(func).parameters.values())[1:]
+    if tuple(p.name for p in params[-len(SERIALIZER_TAIL):]) != SERIALIZER_TAIL:
+        return -1
+    if any(p.kind not in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in params):
+        return -1
+    return len(params) - len(SERIALIZER_TAIL)
+
+
+class RawApi:
+    """Wraps an SDK API object so live and task calls return parsed JSON dicts.
+
+    The request is built by the SDK's own serializer (same URL, auth and body)
+    and sent through the same ApiClient, but the response body goes straight
+    to json.loads instead of being deserialized into models and back with
+    to_dict(). Methods without a generated serializer, or with one whose
+    signature differs from what this SDK version generates, fall back to the SDK.
+    """
+
+    def __init__(self, api, validate: bool = False):
+        self._api = api
+        self._validate = validate
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._api, name)
+        serialize = getattr(self._api, f"_{name}_serialize", None)
+        if serialize is None or not any(marker in name for marker in RAW_METHOD_MARKERS):
+            return attr
+        # Serializers take the request params (body or task id, if any) followed by
+        # _request_auth, _content_type, _headers and _host_index
+        n_params = _serializer_arity(serialize.__func__)
+        if n_params < 0:
+            return attr
+
+        api_client = self._api.api_client
+        validate = self._validate
+
+        def call(*args, _request_timeout=None):
+            params = (list(args) + [None] * n_params)[:n_params]
+            param = serialize(*params, None, None, None, 0)
+            response = api_client.call_api(*param, _request_timeout=_request_timeout)
+            data = response.read()
+            text = data.decode("utf-8") if data else ""
+            if not 200 <= response.status <= 299:
+                raise ApiException.from_response(http_resp=response, body=text, data=None)
+            result = json.loads(text) if text else {}
+            return validate_response(result) if validate else result
+
+        return call
+
+
+def _field(obj, name: str):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _call_stats(response) -> dict:
+    """Cost, status and task counts of a response (raw dict or SDK model)."""
+    tasks = _field(response, "tasks") or []
+    return {
+        "status_code": _field(response, "status_code"),
+        "cost": float(_field(response, "cost") or 0),
+        "tasks": len(tasks),
+        "task_errors": sum(1 for t in tasks if _field(t, "status_code") not in (20000, None)),
+    }
+
+
+class MeteredApi:
+    """Wraps an SDK API object so every live and queue call goes into the usage ledger.
+
+    Records what DataForSEO charged (the response's `cost`), latency and
+    status codes against the open run, and refuses a chargeable call with
+    BudgetExceeded once the run's budget is spent. Free queue calls
+    (tasks_ready, task_get) are recorded but never refused, so a run whose
+    tasks used up the budget can still collect them. Sits under the response
+    cache, so only calls that actually reach the API are charged; the cache
+    records its own hits.
+    """
+
+    def __init__(self, api, group: str):
+        self._api = api
+        self._group = group
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._api, name)
+        if not callable(attr) or not any(marker in name for marker in RAW_METHOD_MARKERS):
+            return attr
+
+        endpoint = f"{self._group}.{name}"
+        charged = any(marker in name for marker in CHARGED_METHOD_MARKERS)
+
+        def call(*args, **kwargs):
+            runs = reserve_call() if charged else None
+            start = time.monotonic()
+            try:
+                response = attr(*args, **kwargs)
+            except Exception as e:
+                record_call(endpoint, time.monotonic() - start, status_code=getattr(e, "status", None),
+                            error=str(e)[:500], runs=runs)
+                raise
+            record_call(endpoint, time.monotonic() - start, runs=runs, **_call_stats(response))
+            return response
+
+        return call
+
+
+def _transport(api):
+    """Apply the configured transport to an SDK API object."""
+    if settings.TRANSPORT == "raw":
+        return RawApi(api, validate=settings.VALIDATE_RESPONSES)
+    return api
 
 
 class DataForSEOClient:
-    """Singleton client manager for DataForSEO APIs."""
+    """Singleton client manager for DataForSEO APIs.
+
+    Safe to share across threads: each thread gets its own SDK ApiClient,
+    and all of them draw from one rate limiter.
+    """
 
     _instance = None
-    _api_client = None
+    _instance_lock = threading.Lock()
     _configuration = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize()
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
         return cls._instance
 
     def _initialize(self):
@@ -34,32 +239,54 @@ class DataForSEOClient:
             username=settings.DATAFORSEO_LOGIN,
             password=settings.DATAFORSEO_PASSWORD
         )
-        self._api_client = dfs_api_provider.ApiClient(self._configuration)
+        self._limiter = RateLimiter(settings.MAX_CALLS_PER_MINUTE)
+        self._local = threading.local()
+        self._clients = []
+        self._clients_lock = threading.Lock()
 
     @property
     def serp(self) -> SerpApi:
-        """Get SERP API instance."""
-        return SerpApi(self._api_client)
+        """Get SERP API instance (metered; live calls go through the response cache)."""
+        return wrap_api(MeteredApi(_transport(SerpApi(self.api_client)), "serp"), "serp")
 
     @property
     def keywords_data(self) -> KeywordsDataApi:
-        """Get Keywords Data API instance."""
-        return KeywordsDataApi(self._api_client)
+        """Get Keywords Data API instance (metered; live calls go through the response cache)."""
+        return wrap_api(MeteredApi(_transport(KeywordsDataApi(self.api_client)), "keywords_data"), "keywords_data")
 
     @property
     def labs(self) -> DataforseoLabsApi:
-        """Get DataForSEO Labs API instance."""
-        return DataforseoLabsApi(self._api_client)
+        """Get DataForSEO Labs API instance (metered; live calls go through the response cache)."""
+        return wrap_api(MeteredApi(_transport(DataforseoLabsApi(self.api_client)), "labs"), "labs")
+
+    @property
+    def backlinks(self) -> BacklinksApi:
+        """Get Backlinks API instance (metered; live calls go through the response cache)."""
+        return wrap_api(MeteredApi(_transport(BacklinksApi(self.api_client)), "backlinks"), "backlinks")
 
     @property
     def api_client(self):
-        """Get raw API client for custom requests."""
-        return self._api_client
+        """Get raw API client for custom requests (one per thread)."""
+        api_client = getattr(self._local, "api_client", None)
+        if api_client is None:
+            api_client = _GovernedApiClient(self._configuration, self._limiter)
+            self._local.api_client = api_client
+            with self._clients_lock:
+                self._clients.append(api_client)
+        return api_client
+
+    @property
+    def limiter(self) -> RateLimiter:
+        """Get the shared calls-per-minute governor."""
+        return self._limiter
 
     def close(self):
-        """Close the API client connection."""
-        if self._api_client:
-            self._api_client.close()
+        """Close all API client connections."""
+        with self._clients_lock:
+            clients, self._clients = self._clients, []
+        for api_client in clients:
+            api_client.close()
+        self._local = threading.local()
 
 
 def get_client() -> DataForSEOClient:
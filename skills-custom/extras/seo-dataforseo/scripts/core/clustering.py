@@ -0,0 +1,253 @@
+"""Group keyword variants into topics: token normalization, MinHash/LSH and optional SERP overlap.
+
+"best dog bed", "dog beds best" and "best dog bed 2026" are one post, not
+three. cluster_keywords() collapses exact variants by their normalized token
+set, finds near-duplicates with MinHash signatures bucketed by LSH bands (so
+only keywords that share a band are ever compared) and can merge clusters
+whose cached SERPs rank the same pages. Thousands of keywords cluster in
+roughly linear time.
+"""
+import random
+import re
+import sys
+import zlib
+from collections import Counter, defaultdict
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.cache import cache_key, get_cache
+from core.items import iter_items
+
+# Function words that never change what a post is about
+STOP_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "for", "of", "in", "on", "to", "with", "at", "by",
+    "is", "are", "my", "your", "our",
+})
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+_YEAR_RE = re.compile(r"^(19|20)\d\d$")
+
+# MinHash signature length = LSH bands x rows per band. Keywords with
+# Jaccard 0.6 share a band ~95% of the time, keywords at 0.2 ~9%.
+LSH_BANDS = 12
+LSH_ROWS = 3
+
+# Leaders kept per LSH bucket - keeps a bucket every keyword falls into
+# (the niche word) from turning each lookup into a scan
+MAX_BUCKET = 64
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20240601)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(LSH_BANDS * LSH_ROWS)
+]
+
+
+def _stem(token: str) -> str:
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def keyword_tokens(keyword: str) -> Tuple[str, ...]:
+    """
+    Normalized, order-free tokens of a keyword.
+
+    Lowercased, punctuation and stop words dropped, years dropped, plurals
+    folded, sorted and deduplicated.
+
+    Example:
+        >>> keyword_tokens("Best Dog Beds 2026") == keyword_tokens("dog bed best")
+        True
+    """
+    tokens = {
+        _stem(token.replace("'", ""))
+        for token in _TOKEN_RE.findall(str(keyword).lower())
+        if token not in STOP_WORDS and not _YEAR_RE.match(token)
+    }
+    return tuple(sorted(tokens))
+
+
+def _shingles(tokens: Sequence[str]) -> set:
+    """Whole tokens plus character 3-grams, so typos and compounds still overlap."""
+    shingles = set(tokens)
+    for token in tokens:
+        padded = f"#{token}#"
+        shingles.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return shingles
+
+
+def _signature(shingles: Iterable[str]) -> List[int]:
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def cluster_keywords(
+    rows: Iterable[Any],
+    key: str = "keyword",
+    score: Optional[Callable[[Any], float]] = None,
+    threshold: float = 0.6,
+    serp_urls: Optional[Mapping[str, Iterable[str]]] = None,
+    min_shared_urls: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Group keyword rows into topic clusters.
+
+    Args:
+        rows: Keyword dicts (the text under `key`) or plain keyword strings
+        key: Field holding the keyword text
+        score: Picks each cluster's representative (highest wins) and orders
+            the clusters; default keeps input order
+        threshold: Shingle Jaccard similarity at which two keywords are the same topic
+        serp_urls: Optional {keyword: top ranking URLs} - keywords whose SERPs
+            share `min_shared_urls` URLs are merged too (see cached_serp_urls)
+        min_shared_urls: SERP overlap needed to merge
+
+    Returns:
+        Clusters, best first, each a dict with:
+            - keyword: the representative keyword
+            - representative: its row
+            - variants: the other keywords in the cluster
+            - rows: every row, representative first
+            - size: number of rows
+
+    Example:
+        >>> clusters = cluster_keywords(keywords, score=lambda k: k["volume"])
+        >>> [(c["keyword"], len(c["variants"])) for c in clusters[:3]]
+    """
+    rows = list(rows)
+    text = lambda row: row if isinstance(row, str) else row.get(key) or ""
+
+    # 1. Exact variants: same normalized token set
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for i, row in enumerate(rows):
+        groups.setdefault(keyword_tokens(text(row)), []).append(i)
+    members = list(groups.values())
+    if score is not None:
+        for m in members:
+            m.sort(key=lambda i: (-score(rows[i]), i))
+    order = sorted(range(len(members)), key=lambda g: (-score(rows[members[g][0]]), members[g][0])
+                   if score is not None else members[g][0])
+
+    urls_of: Dict[int, set] = {}
+    if serp_urls:
+        group_of = {tokens: g for g, tokens in enumerate(groups)}
+        for kw, urls in serp_urls.items():
+            g = group_of.get(keyword_tokens(kw))
+            if g is not None:
+                urls_of.setdefault(g, set()).update(urls)
+
+    # 2. Best group first: join the most similar existing leader or lead a new cluster.
+    # Leaders are found through LSH buckets and the SERP URL index, never by scanning.
+    shingles = [_shingles(tokens) for tokens in groups]
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    by_url: Dict[str, List[int]] = defaultdict(list)
+    leader_of: Dict[int, int] = {}
+    for g in order:
+        sh = shingles[g]
+        bands = []
+        if sh:
+            sig = _signature(sh)
+            bands = [(band, tuple(sig[band * LSH_ROWS:(band + 1) * LSH_ROWS])) for band in range(LSH_BANDS)]
+
+        best, best_sim = None, threshold
+        for leader in {l for band in bands for l in buckets.get(band, ())}:
+            sl = shingles[leader]
+            sim = len(sh & sl) / len(sh | sl)
+            if sim >= best_sim:
+                best, best_sim = leader, sim
+        if best is None and g in urls_of:
+            shared = Counter(l for url in urls_of[g] for l in by_url.get(url, ()))
+            if shared:
+                leader, count = shared.most_common(1)[0]
+                if count >= min_shared_urls:
+                    best = leader
+        if best is not None:
+            leader_of[g] = best
+            continue
+
+        leader_of[g] = g
+        for band in bands:
+            if len(buckets[band]) < MAX_BUCKET:
+                buckets[band].append(g)
+        for url in urls_of.get(g, ()):
+            by_url[url].append(g)
+
+    # 3. Collect clusters in leader order; the leader's best row represents the cluster
+    merged: Dict[int, List[int]] = {}
+    for g in order:
+        merged.setdefault(leader_of[g], []).extend(members[g])
+
+    clusters = []
+    for indexes in merged.values():
+        cluster_rows = [rows[i] for i in indexes]
+        keywords = list(dict.fromkeys(text(row) for row in cluster_rows))
+        clusters.append({
+            "keyword": keywords[0],
+            "representative": cluster_rows[0],
+            "variants": keywords[1:],
+            "rows": cluster_rows,
+            "size": len(cluster_rows),
+        })
+    return clusters
+
+
+def collapse_variants(rows: Iterable[Dict[str, Any]], score: Callable[[Dict[str, Any]], float], **kwargs) -> List[Dict[str, Any]]:
+    """
+    One row per cluster: a copy of its best row plus the keywords it stands for.
+
+    Each returned row gets `variants` (the other keywords) and `cluster_volume`
+    (summed `volume` of every row in the cluster). Keyword arguments go to
+    cluster_keywords().
+
+    Example:
+        >>> posts = collapse_variants(keywords, score=lambda k: k["priority"])[:24]
+    """
+    collapsed = []
+    for cluster in cluster_keywords(rows, score=score, **kwargs):
+        row = dict(cluster["representative"])
+        row["variants"] = cluster["variants"]
+        row["cluster_volume"] = sum(r.get("volume") or 0 for r in cluster["rows"])
+        collapsed.append(row)
+    return collapsed
+
+
+def cached_serp_urls(
+    keywords: Iterable[str],
+    location_name: str = None,
+    language_name: str = None,
+    top: int = 10,
+    depths: Sequence[int] = (10, 100)
+) -> Dict[str, List[str]]:
+    """
+    Top organic URLs per keyword, read only from the response cache.
+
+    Looks up the Google organic SERPs get_google_serp() already paid for (at
+    any of `depths`, desktop) - nothing is fetched, keywords without a fresh
+    cached SERP are left out. Feed the result to cluster_keywords(serp_urls=...).
+    """
+    if not settings.CACHE_ENABLED:
+        return {}
+    cache = get_cache()
+    endpoint = "serp.google_organic_live_advanced"
+    location = location_name or settings.DEFAULT_LOCATION_NAME
+    language = language_name or settings.DEFAULT_LANGUAGE_NAME
+
+    urls: Dict[str, List[str]] = {}
+    for keyword in keywords:
+        for depth in depths:
+            task = {"keyword": keyword, "location_name": location, "language_name": language,
+                    "depth": depth, "device": "desktop"}
+            cached = cache.peek(cache_key(endpoint, [([task],), {}]))
+            if cached is not None:
+                organic = (item["url"] for item in iter_items(cached, types={"organic"}) if item.get("url"))
+                urls[keyword] = list(islice(organic, top))
+                break
+    return urls
@@ -0,0 +1,64 @@
+"""Shared SQLite connections for the on-disk stores (queue, ledger, history...).
+
+Each store keeps one long-lived connection per database file, opened the same
+way everywhere: WAL journal with synchronous=NORMAL (readers never block the
+writer, commits skip the per-transaction fsync), check_same_thread off so
+worker threads can use it, and the store's schema applied on first open.
+Connections are only created here - callers still serialize their queries
+with a lock of their own.
+"""
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+
+_conns: Dict[str, sqlite3.Connection] = {}
+_conns_lock = threading.Lock()
+
+
+def connect(
+    db_name: str,
+    schema: str,
+    directory: Optional[Path] = None,
+    on_create: Optional[Callable[[sqlite3.Connection], object]] = None
+) -> sqlite3.Connection:
+    """
+    Get the cached connection to a SQLite database, opening it on first use.
+
+    Args:
+        db_name: Database file name (e.g. "queue.sqlite3")
+        schema: CREATE ... IF NOT EXISTS script run when the connection opens
+        directory: Where the file lives (default: settings.RESULTS_DIR, looked up
+            on every call so a changed results dir gets its own database)
+        on_create: Called with the new connection when the file did not exist yet
+
+    Example:
+        >>> db = connect(QUEUE_DB_NAME, _SCHEMA)
+        >>> with _db_lock:
+        ...     db.execute("SELECT ...")
+    """
+    path = Path(directory if directory is not None else settings.RESULTS_DIR) / db_name
+    key = str(path)
+    conn = _conns.get(key)
+    if conn is not None:
+        return conn
+
+    with _conns_lock:
+        conn = _conns.get(key)
+        if conn is None:
+            is_new = not path.exists()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(key, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(schema)
+            if is_new and on_create is not None:
+                on_create(conn)
+            _conns[key] = conn
+        return conn
@@ -0,0 +1,69 @@
+"""Match SERP URLs/domains against tracked domains on label boundaries, not substrings."""
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def split_target(value: str) -> Tuple[str, str]:
+    """
+    Split a domain / URL / "domain.com/path" into (host, path prefix).
+
+    The host is lowercased without scheme, port, trailing dot or "www."; the
+    path prefix is "" for a bare domain.
+    """
+    value = (value or "").strip().lower()
+    parts = urlsplit(value if "//" in value else f"//{value}")
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host, parts.path.rstrip("/")
+
+
+def normalize_domain(value: str) -> str:
+    """Bare host of a domain or URL ("https://www.Site.com/x" -> "site.com")."""
+    return split_target(value)[0]
+
+
+class DomainIndex:
+    """
+    Finds which tracked domain a URL belongs to with a few dict lookups.
+
+    A tracked "site.com" matches site.com and any subdomain (blog.site.com)
+    but not "mysite.com" or "site.com.evil.net". A tracked "site.com/pets"
+    only matches URLs under that path. When several tracked entries match,
+    the most specific one (longest host, then longest path) wins.
+
+    Example:
+        >>> index = DomainIndex(["yourblog.com", "rival.com"])
+        >>> index.match(url="https://shop.rival.com/item")
+        'rival.com'
+        >>> index.match(domain="notrival.com") is None
+        True
+    """
+
+    def __init__(self, domains: Iterable[str]):
+        self.domains = list(dict.fromkeys(domains))
+        self._by_host: Dict[str, List[Tuple[str, str]]] = {}
+        for domain in self.domains:
+            host, path = split_target(domain)
+            if host:
+                entries = self._by_host.setdefault(host, [])
+                entries.append((path, domain))
+                entries.sort(key=lambda e: len(e[0]), reverse=True)
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def match(self, url: str = "", domain: str = "") -> Optional[str]:
+        """Return the tracked domain (as given to the index) that a result belongs to, or None."""
+        host, path = split_target(url) if url else ("", "")
+        if not host:
+            host = normalize_domain(domain)
+        labels = host.split(".")
+        for start in range(len(labels) - 1):
+            entries = self._by_host.get(".".join(labels[start:]))
+            if not entries:
+                continue
+            for prefix, tracked in entries:
+                if not prefix or path == prefix or path.startswith(prefix + "/"):
+                    return tracked
+        return None
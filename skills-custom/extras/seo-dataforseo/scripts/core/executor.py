@@ -0,0 +1,140 @@
+"""Bounded-concurrency fan-out for DataForSEO calls."""
+import contextvars
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+
+
+def run_concurrent(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[int, Any, Any, Optional[Exception]], None]] = None
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Call func(item) for every item on a bounded thread pool.
+
+    Calls go through the shared client, so the account-wide calls-per-minute
+    limit is respected no matter how many workers run.
+
+    Args:
+        func: Function to call with each item (usually wraps one *_live call)
+        items: Inputs to fan out over
+        max_workers: Concurrent calls (default: settings.MAX_CONCURRENT_REQUESTS)
+        on_result: Optional callback(index, item, value, error), invoked on the
+            calling thread as each call finishes - handy for progress output
+
+    Returns:
+        List of (value, error) tuples in input order; error is None on success
+
+    Example:
+        >>> results = run_concurrent(lambda kw: get_google_serp(kw, save=False), keywords)
+        >>> for kw, (serp, err) in zip(keywords, results): ...
+    """
+    items = list(items)
+    results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(items)
+    if not items:
+        return results
+
+    workers = max(1, min(max_workers or settings.MAX_CONCURRENT_REQUESTS, len(items)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Each call runs in a copy of this context, so it is metered with the caller's run
+        futures = {pool.submit(contextvars.copy_context().run, func, item): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                value, error = future.result(), None
+            except Exception as e:
+                value, error = None, e
+            results[i] = (value, error)
+            if on_result:
+                on_result(i, items[i], value, error)
+
+    return results
+
+
+def fan_out(
+    calls: Dict[str, Optional[Callable[[], Any]]],
+    timeout: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    on_result: Optional[Callable[[str, Any, Optional[Exception]], None]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Run a set of independent, named calls at once and collect whatever finishes.
+
+    For composite workflows (overview + difficulty + intent + ...) that should
+    take about as long as their slowest call. A call that raises or runs longer
+    than `timeout` seconds ends up in the errors dict; the others are not
+    affected. A timed-out request can't be interrupted - its thread is left to
+    finish in the background and its result is dropped.
+
+    Args:
+        calls: Name -> zero-argument callable; None entries are skipped, so
+            optional steps can be written inline
+        timeout: Per-call limit in seconds, counted from when the call starts
+            (default: settings.CALL_TIMEOUT_SECONDS, 0 = no limit)
+        max_workers: Concurrent calls (default: one per call)
+        on_result: Optional callback(name, value, error), invoked on the
+            calling thread as each call finishes or times out
+
+    Returns:
+        (values, errors) - name -> return value for calls that succeeded (in
+        the order of `calls`), name -> exception for calls that failed or timed out
+
+    Example:
+        >>> values, errors = fan_out({
+        ...     "overview": lambda: get_keyword_overview(keywords),
+        ...     "difficulty": lambda: get_bulk_keyword_difficulty(keywords),
+        ...     "trends": (lambda: get_trends_explore(keywords[:5])) if with_trends else None,
+        ... }, timeout=60)
+    """
+    calls = {name: call for name, call in calls.items() if call is not None}
+    values: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+    if not calls:
+        return values, errors
+
+    timeout = settings.CALL_TIMEOUT_SECONDS if timeout is None else timeout
+    started: Dict[str, float] = {}
+
+    def run(name):
+        started[name] = time.monotonic()
+        return calls[name]()
+
+    def finish(name, value, error):
+        if error is None:
+            values[name] = value
+        else:
+            errors[name] = error
+        if on_result:
+            on_result(name, value, error)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers or len(calls), len(calls))))
+    futures = {pool.submit(contextvars.copy_context().run, run, name): name for name in calls}
+    pending = set(futures)
+    try:
+        while pending:
+            deadlines = [started[futures[f]] + timeout for f in pending if futures[f] in started]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if timeout and deadlines else None
+            done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    finish(futures[future], future.result(), None)
+                except Exception as e:
+                    finish(futures[future], None, e)
+            if timeout:
+                now = time.monotonic()
+                for future in [f for f in pending if now - started.get(futures[f], now) >= timeout]:
+                    pending.discard(future)
+                    finish(futures[future], None, TimeoutError(f"{futures[future]} timed out after {timeout:g}s"))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return {name: values[name] for name in calls if name in values}, errors
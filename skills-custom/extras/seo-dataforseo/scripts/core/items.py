@@ -0,0 +1,169 @@
+"""Stream items out of DataForSEO responses (tasks -> result -> items) and project their fields."""
+from typing import Any, Callable, Collection, Dict, Iterator, Optional
+
+
+def iter_results(response: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every result of every task in a response, lazily.
+
+    Anything not shaped as expected (no tasks, None results, non-dict entries)
+    is skipped instead of raising, so callers need no try/except of their own.
+    SDK models are converted with to_dict() first.
+    """
+    if hasattr(response, "to_dict"):
+        response = response.to_dict()
+    if not isinstance(response, dict):
+        return
+    for task in response.get("tasks") or []:
+        if not isinstance(task, dict):
+            continue
+        for result in task.get("result") or []:
+            if isinstance(result, dict):
+                yield result
+
+
+def iter_items(
+    response: Any,
+    types: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield every item of every result of every task in a response, lazily.
+
+    Args:
+        response: API response (dict or SDK model)
+        types: Only yield items of these types (e.g. {"organic"})
+        exclude: Skip items of these types (e.g. {"maps_search_ad"})
+
+    Example:
+        >>> for item in iter_items(serp_raw, types={"organic"}):
+        ...     print(item["rank_group"], item["domain"])
+    """
+    for result in iter_results(response):
+        for item in result.get("items") or []:
+            if not isinstance(item, dict):
+                continue
+            if types is not None and item.get("type") not in types:
+                continue
+            if exclude is not None and item.get("type") in exclude:
+                continue
+            yield item
+
+
+class Field:
+    """
+    A field lookup compiled once and applied to many items.
+
+    Paths are dotted ("keyword_info.cpc") and tried in order: the first that
+    resolves to a non-None value wins. `cast` converts that value (one that
+    can't be converted counts as missing) and `default` is returned when no
+    path resolves.
+
+    Example:
+        >>> cpc = Field("keyword_info.cpc", "cpc", default=0.0, cast=float)
+        >>> cpc({"keyword_info": {"cpc": "1.2"}})
+        1.2
+    """
+
+    __slots__ = ("paths", "default", "cast")
+
+    def __init__(self, *paths: str, default: Any = None, cast: Optional[Callable[[Any], Any]] = None):
+        self.paths = tuple(tuple(path.split(".")) for path in paths)
+        self.default = default
+        self.cast = cast
+
+    def __call__(self, item: Any) -> Any:
+        for path in self.paths:
+            value = item
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+            if value is None:
+                continue
+            if self.cast is None:
+                return value
+            try:
+                return self.cast(value)
+            except (TypeError, ValueError):
+                continue
+        return self.default
+
+    def with_default(self, default: Any) -> "Field":
+        """The same lookup with a different default."""
+        field = Field(default=default, cast=self.cast)
+        field.paths = self.paths
+        return field
+
+    def __repr__(self) -> str:
+        return f"Field({', '.join(repr('.'.join(p)) for p in self.paths)}, default={self.default!r})"
+
+
+class Projection:
+    """
+    Named Fields applied together: item -> {name: value}.
+
+    Values may be Field objects or dotted path strings.
+
+    Example:
+        >>> row = Projection(keyword="keyword", cpc=Field("keyword_info.cpc", default=0.0))
+        >>> rows = (row(item) for item in iter_items(ideas_raw))
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, **fields: Any):
+        self.fields = tuple(
+            (name, spec if isinstance(spec, Field) else Field(spec)) for name, spec in fields.items()
+        )
+
+    def __call__(self, item: Any) -> Dict[str, Any]:
+        return {name: field(item) for name, field in self.fields}
+
+
+def iter_rows(
+    response: Any,
+    projection: Callable[[Dict[str, Any]], Dict[str, Any]],
+    where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    types: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Project every item of a response, keeping the rows `where` accepts.
+
+    Feed the result straight into heapq.nlargest / a filter / a dict so no
+    intermediate list of raw items is built.
+
+    Example:
+        >>> top = heapq.nlargest(20, iter_rows(ideas_raw, LABS_KEYWORD, where=lambda r: r["volume"] > 0),
+        ...                      key=lambda r: r["volume"])
+    """
+    for item in iter_items(response, types=types, exclude=exclude):
+        row = projection(item)
+        if where is None or where(row):
+            yield row
+
+
+# Labs keyword items come flat (ideas, suggestions) or wrapped in keyword_data (ranked keywords)
+KEYWORD = Field("keyword_data.keyword", "keyword", default="")
+SEARCH_VOLUME = Field(
+    "keyword_data.keyword_info.search_volume", "keyword_info.search_volume", "search_volume",
+    default=0, cast=int
+)
+CPC = Field("keyword_data.keyword_info.cpc", "keyword_info.cpc", "cpc", default=0.0, cast=float)
+KEYWORD_DIFFICULTY = Field(
+    "keyword_data.keyword_properties.keyword_difficulty", "keyword_properties.keyword_difficulty",
+    "keyword_difficulty", cast=int
+)
+COMPETITION_LEVEL = Field(
+    "keyword_data.keyword_info.competition_level", "keyword_info.competition_level", "competition",
+    default=""
+)
+
+LABS_KEYWORD = Projection(
+    keyword=KEYWORD,
+    volume=SEARCH_VOLUME,
+    cpc=CPC,
+    kd=KEYWORD_DIFFICULTY,
+    competition=COMPETITION_LEVEL,
+)
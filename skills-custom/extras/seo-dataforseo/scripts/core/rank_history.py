@@ -0,0 +1,252 @@
+"""Rank-tracking history: one row per domain/location/keyword/day in SQLite.
+
+rank_check() records every position it finds here, so tracking hundreds of
+keywords daily needs no old result files: movement reports and per-keyword
+history are single indexed queries. Keywords can be put on their own check
+schedule (every N days) and a run only re-checks the ones that are due.
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.db import connect
+
+RANK_DB_NAME = "rank_history.sqlite3"
+
+# Check interval for keywords without a schedule of their own
+DEFAULT_EVERY_DAYS = 1
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS rankings (
+        domain TEXT NOT NULL,
+        location TEXT NOT NULL,
+        keyword TEXT NOT NULL,
+        checked_on TEXT NOT NULL,
+        checked_at REAL NOT NULL,
+        position INTEGER,
+        url TEXT,
+        features TEXT,
+        PRIMARY KEY (domain, location, keyword, checked_on)
+    );
+    CREATE INDEX IF NOT EXISTS idx_rankings_day ON rankings(domain, location, checked_on);
+    CREATE TABLE IF NOT EXISTS schedules (
+        domain TEXT NOT NULL,
+        location TEXT NOT NULL,
+        keyword TEXT NOT NULL,
+        every_days INTEGER NOT NULL,
+        PRIMARY KEY (domain, location, keyword)
+    );
+"""
+
+_db_lock = threading.Lock()
+
+
+def _db() -> sqlite3.Connection:
+    return connect(RANK_DB_NAME, _SCHEMA)
+
+
+def _norm(keyword: str) -> str:
+    return " ".join(str(keyword).lower().split())
+
+
+def _day(value: Optional[Any] = None) -> str:
+    if value is None:
+        return date.today().isoformat()
+    return value.isoformat() if isinstance(value, date) else str(value)[:10]
+
+
+def record_rankings(domain: str, location: str, rankings: Iterable[Dict[str, Any]], checked_on=None) -> int:
+    """
+    Store one check per keyword (a second check on the same day replaces the first).
+
+    Args:
+        domain: Tracked domain
+        location: Location the SERPs were pulled for
+        rankings: Dicts with keyword, position (-1/None = not in results),
+            optional url and features (list of SERP feature types)
+        checked_on: Day of the check (date or "YYYY-MM-DD", default today)
+
+    Returns:
+        Number of rows written
+    """
+    day, now = _day(checked_on), time.time()
+    rows = [
+        (domain, location, _norm(r["keyword"]), day, now,
+         r["position"] if r.get("position") not in (None, -1) else None,
+         r.get("url") or None, json.dumps(r.get("features") or []))
+        for r in rankings
+    ]
+    db = _db()
+    with _db_lock:
+        db.executemany("INSERT OR REPLACE INTO rankings VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        db.commit()
+    return len(rows)
+
+
+def set_schedule(domain: str, keywords: List[str], every_days: int, location: Optional[str] = None):
+    """
+    Check these keywords every `every_days` days (1 = daily) instead of on every run.
+
+    Example:
+        >>> set_schedule("yourblog.com", long_tail_keywords, every_days=7)
+    """
+    location = location or settings.DEFAULT_LOCATION_NAME
+    db = _db()
+    with _db_lock:
+        db.executemany(
+            "INSERT OR REPLACE INTO schedules VALUES (?, ?, ?, ?)",
+            [(domain, location, _norm(kw), max(1, int(every_days))) for kw in keywords]
+        )
+        db.commit()
+
+
+def due_keywords(domain: str, keywords: List[str], location: Optional[str] = None, today=None) -> List[str]:
+    """
+    Keywords whose last check is at least their schedule's interval old (or never checked).
+
+    Returns:
+        The due keywords, in the given order
+    """
+    location = location or settings.DEFAULT_LOCATION_NAME
+    today = date.fromisoformat(_day(today))
+    db = _db()
+    with _db_lock:
+        last = dict(db.execute(
+            "SELECT keyword, MAX(checked_on) FROM rankings WHERE domain = ? AND location = ? GROUP BY keyword",
+            (domain, location)
+        ).fetchall())
+        every = dict(db.execute(
+            "SELECT keyword, every_days FROM schedules WHERE domain = ? AND location = ?", (domain, location)
+        ).fetchall())
+
+    due = []
+    for kw in keywords:
+        norm = _norm(kw)
+        checked = last.get(norm)
+        interval = every.get(norm, DEFAULT_EVERY_DAYS)
+        if checked is None or (today - date.fromisoformat(checked)).days >= interval:
+            due.append(kw)
+    return due
+
+
+def _row(keyword, checked_on, position, url, features) -> Dict[str, Any]:
+    return {
+        "keyword": keyword,
+        "checked_on": checked_on,
+        "position": position,
+        "url": url,
+        "features": json.loads(features) if features else [],
+    }
+
+
+def latest_rankings(domain: str, keywords: List[str], location: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Most recent stored check per keyword: {keyword: {checked_on, position, url, features}}."""
+    location = location or settings.DEFAULT_LOCATION_NAME
+    by_norm = {_norm(kw): kw for kw in keywords}
+    db = _db()
+    with _db_lock:
+        rows = db.execute("""
+            SELECT r.keyword, r.checked_on, r.position, r.url, r.features
+            FROM rankings r
+            JOIN (SELECT keyword, MAX(checked_on) AS day FROM rankings
+                  WHERE domain = ? AND location = ? GROUP BY keyword) latest
+              ON r.keyword = latest.keyword AND r.checked_on = latest.day
+            WHERE r.domain = ? AND r.location = ?
+        """, (domain, location, domain, location)).fetchall()
+    return {by_norm[row[0]]: _row(by_norm[row[0]], *row[1:]) for row in rows if row[0] in by_norm}
+
+
+def keyword_history(domain: str, keyword: str, location: Optional[str] = None, days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Every stored check of one keyword, oldest first (optionally only the last `days` days)."""
+    location = location or settings.DEFAULT_LOCATION_NAME
+    since = (date.today() - timedelta(days=days)).isoformat() if days else ""
+    db = _db()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT keyword, checked_on, position, url, features FROM rankings "
+            "WHERE domain = ? AND location = ? AND keyword = ? AND checked_on >= ? ORDER BY checked_on",
+            (domain, location, _norm(keyword), since)
+        ).fetchall()
+    return [_row(keyword, *row[1:]) for row in rows]
+
+
+def movement_report(domain: str, days: int = 7, location: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    """
+    Compare each keyword's latest position with where it stood `days` days ago.
+
+    The baseline is the last check on or before the cutoff day, so keywords
+    on a weekly schedule still get a comparison.
+
+    Returns:
+        Dict with:
+            - winners / losers: biggest moves up / down (change > 0 = moved up)
+            - new: keywords that entered the results, lost: keywords that dropped out
+            - unchanged: count of keywords that held their position
+            - tracked: keywords with a check in the window
+    """
+    location = location or settings.DEFAULT_LOCATION_NAME
+    cutoff = (date.today() - timedelta(days=days)).isoformat()
+    db = _db()
+    with _db_lock:
+        rows = db.execute("""
+            WITH latest AS (
+                SELECT keyword, MAX(checked_on) AS day FROM rankings
+                WHERE domain = :domain AND location = :location AND checked_on > :cutoff
+                GROUP BY keyword
+            ), baseline AS (
+                SELECT keyword, MAX(checked_on) AS day FROM rankings
+                WHERE domain = :domain AND location = :location AND checked_on <= :cutoff
+                GROUP BY keyword
+            )
+            SELECT latest.keyword, now.position, now.url, now.checked_on, before.position, before.checked_on
+            FROM latest
+            JOIN rankings now
+              ON now.domain = :domain AND now.location = :location
+             AND now.keyword = latest.keyword AND now.checked_on = latest.day
+            LEFT JOIN baseline ON baseline.keyword = latest.keyword
+            LEFT JOIN rankings before
+              ON before.domain = :domain AND before.location = :location
+             AND before.keyword = baseline.keyword AND before.checked_on = baseline.day
+        """, {"domain": domain, "location": location, "cutoff": cutoff}).fetchall()
+
+    winners, losers, new, lost = [], [], [], []
+    unchanged = 0
+    for keyword, position, url, checked_on, previous, previous_on in rows:
+        entry = {"keyword": keyword, "position": position, "previous": previous, "url": url,
+                 "checked_on": checked_on, "previous_on": previous_on}
+        if previous_on is None:
+            continue  # no baseline yet
+        if previous is None and position is not None:
+            new.append(entry)
+        elif previous is not None and position is None:
+            lost.append(entry)
+        elif previous is not None and position != previous:
+            entry["change"] = previous - position
+            (winners if entry["change"] > 0 else losers).append(entry)
+        else:
+            unchanged += 1
+
+    winners.sort(key=lambda e: e["change"], reverse=True)
+    losers.sort(key=lambda e: e["change"])
+    new.sort(key=lambda e: e["position"])
+    lost.sort(key=lambda e: e["previous"])
+    return {
+        "domain": domain,
+        "location": location,
+        "days": days,
+        "tracked": len(rows),
+        "winners": winners[:limit],
+        "losers": losers[:limit],
+        "new": new[:limit],
+        "lost": lost[:limit],
+        "unchanged": unchanged,
+    }
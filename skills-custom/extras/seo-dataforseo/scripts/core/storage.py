@@ -1,6 +1,9 @@
 """Result storage utilities for persisting API responses."""
+import gzip
 import json
+import sqlite3
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -9,6 +12,38 @@ from typing import Any, Dict, List, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config.settings import settings
+from core.db import connect
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# File suffix per storage format
+STORAGE_SUFFIXES = {"json": ".json", "json.gz": ".json.gz", "json.zst": ".json.zst"}
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# SQLite index of saved results, kept in the results directory
+MANIFEST_NAME = "manifest.sqlite3"
+
+_MANIFEST_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS results (
+        path TEXT PRIMARY KEY,
+        category TEXT NOT NULL,
+        operation TEXT NOT NULL,
+        keyword TEXT,
+        extra_info TEXT,
+        saved_at TEXT NOT NULL,
+        size INTEGER NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_results_saved ON results(saved_at);
+    CREATE INDEX IF NOT EXISTS idx_results_category ON results(category, saved_at);
+    CREATE INDEX IF NOT EXISTS idx_results_operation ON results(category, operation, saved_at);
+    CREATE INDEX IF NOT EXISTS idx_results_op ON results(operation, saved_at);
+"""
+
+_manifest_lock = threading.Lock()
 
 
 def get_timestamp() -> str:
@@ -23,6 +58,47 @@ def sanitize_filename(name: str) -> str:
     return name[:100]  # Limit length
 
 
+def _storage_format() -> str:
+    """Resolve the configured format, falling back to gzip when zstd is missing."""
+    fmt = settings.STORAGE_FORMAT
+    if fmt not in STORAGE_SUFFIXES:
+        raise ValueError(f"Unknown STORAGE_FORMAT '{fmt}' (use one of {list(STORAGE_SUFFIXES)})")
+    if fmt == "json.zst" and zstd is None:
+        return "json.gz"
+    return fmt
+
+
+def _result_stem(filepath: Path) -> str:
+    """Filename without the .json/.json.gz/.json.zst suffix."""
+    name = filepath.name
+    for suffix in (".json.gz", ".json.zst", ".json"):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return filepath.stem
+
+
+def _iter_result_files(base_dir: Path, pattern: str = "*"):
+    for suffix in STORAGE_SUFFIXES.values():
+        yield from base_dir.glob(f"**/{pattern}{suffix}")
+
+
+def _write_result(filepath: Path, payload: Dict[str, Any], fmt: str):
+    if fmt == "json":
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False, default=str)
+        return
+
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str).encode('utf-8')
+    if fmt == "json.zst":
+        raw = zstd.ZstdCompressor(level=10).compress(raw)
+    else:
+        raw = gzip.compress(raw, compresslevel=6)
+    # Write then rename so readers never see a partial file
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    tmp_path.write_bytes(raw)
+    tmp_path.replace(filepath)
+
+
 def save_result(
     data: Any,
     category: str,
@@ -31,7 +107,7 @@ def save_result(
     extra_info: Optional[str] = None
 ) -> Path:
     """
-    Save API result to JSON file.
+    Save API result to a JSON file (compressed if STORAGE_FORMAT says so).
 
     Args:
         data: The API response data to save
@@ -56,7 +132,8 @@ def save_result(
     if extra_info:
         parts.append(sanitize_filename(extra_info))
 
-    filename = "__".join(parts) + ".json"
+    fmt = _storage_format()
+    filename = "__".join(parts) + STORAGE_SUFFIXES[fmt]
     filepath = category_dir / filename
 
     # Prepare data for JSON serialization
@@ -75,17 +152,153 @@ def save_result(
         "data": data
     }
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(result_wrapper, f, indent=2, ensure_ascii=False, default=str)
+    _write_result(filepath, result_wrapper, fmt)
+
+    _index_result(filepath, category, operation, keyword, extra_info,
+                  result_wrapper["metadata"]["saved_at"])
 
     print(f"Results saved to: {filepath}")
     return filepath
 
 
+def _manifest() -> sqlite3.Connection:
+    """Get the manifest connection for the current results directory.
+
+    A new manifest is backfilled from the result files already on disk.
+    Callers must hold _manifest_lock.
+    """
+    return connect(MANIFEST_NAME, _MANIFEST_SCHEMA, on_create=_backfill)
+
+
+def _index_result(
+    filepath: Path,
+    category: str,
+    operation: str,
+    keyword: Optional[str],
+    extra_info: Optional[str],
+    saved_at: str
+):
+    """Record a saved file in the manifest."""
+    rel_path = filepath.relative_to(settings.RESULTS_DIR).as_posix()
+    with _manifest_lock:
+        conn = _manifest()
+        conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (rel_path, category, operation, keyword, extra_info, saved_at, filepath.stat().st_size)
+        )
+        conn.commit()
+
+
+def _backfill(conn: sqlite3.Connection) -> int:
+    base_dir = settings.RESULTS_DIR
+    known = {row[0] for row in conn.execute("SELECT path FROM results")}
+    rows = []
+    for filepath in _iter_result_files(base_dir):
+        rel_path = filepath.relative_to(base_dir).as_posix()
+        if rel_path in known:
+            continue
+        stat = filepath.stat()
+        stem = _result_stem(filepath)
+        parts = stem.split("__")
+        try:
+            saved_at = datetime.strptime(parts[0], "%Y%m%d_%H%M%S").isoformat()
+            parts = parts[1:]
+        except ValueError:
+            saved_at = datetime.fromtimestamp(stat.st_mtime).isoformat()
+            parts = [stem]
+        category = filepath.parent.relative_to(base_dir).as_posix()
+        rows.append((
+            rel_path,
+            "" if category == "." else category,
+            parts[0] if parts else "",
+            parts[1] if len(parts) > 1 else None,
+            "__".join(parts[2:]) or None,
+            saved_at,
+            stat.st_size
+        ))
+    conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    return len(rows)
+
+
+def backfill_manifest() -> int:
+    """
+    Index result files saved before the manifest existed.
+
+    Metadata is parsed from the file path (category/timestamp__operation__keyword...),
+    so files are not opened. Already-indexed files are skipped. A new manifest
+    is backfilled automatically; run this after copying in results from elsewhere.
+
+    Returns:
+        Number of files added to the manifest
+    """
+    if not settings.RESULTS_DIR.exists():
+        return 0
+    with _manifest_lock:
+        return _backfill(_manifest())
+
+
 def load_result(filepath: Path) -> Dict[str, Any]:
-    """Load a previously saved result."""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load a previously saved result (plain, gzip or zstd JSON)."""
+    raw = Path(filepath).read_bytes()
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    elif raw[:4] == _ZSTD_MAGIC:
+        if zstd is None:
+            raise RuntimeError(f"{filepath} is zstd-compressed; pip install zstandard to read it")
+        raw = zstd.ZstdDecompressor().decompressobj().decompress(raw)
+    return json.loads(raw)
+
+
+def compact_results(fmt: Optional[str] = None) -> Dict[str, int]:
+    """
+    Rewrite saved pretty-printed .json results in a compressed format.
+
+    Args:
+        fmt: "json.gz" or "json.zst" (default: STORAGE_FORMAT, or json.gz if that is "json")
+
+    Returns:
+        Dict with files converted and bytes before/after
+    """
+    fmt = fmt or _storage_format()
+    if fmt == "json":
+        fmt = "json.gz"
+    if fmt not in STORAGE_SUFFIXES:
+        raise ValueError(f"Unknown format '{fmt}'")
+    if fmt == "json.zst" and zstd is None:
+        raise RuntimeError("zstandard is not installed; pip install zstandard or use json.gz")
+
+    stats = {"files": 0, "bytes_before": 0, "bytes_after": 0}
+    base_dir = settings.RESULTS_DIR
+    if not base_dir.exists():
+        return stats
+
+    for filepath in base_dir.glob("**/*.json"):
+        try:
+            payload = load_result(filepath)
+        except (OSError, ValueError) as e:
+            print(f"   ⚠️  Skipping {filepath.name}: {e}")
+            continue
+        new_path = filepath.with_name(_result_stem(filepath) + STORAGE_SUFFIXES[fmt])
+        before = filepath.stat().st_size
+        _write_result(new_path, payload, fmt)
+        after = new_path.stat().st_size
+
+        with _manifest_lock:
+            conn = _manifest()
+            conn.execute(
+                "UPDATE results SET path = ?, size = ? WHERE path = ?",
+                (new_path.relative_to(base_dir).as_posix(), after,
+                 filepath.relative_to(base_dir).as_posix())
+            )
+            conn.commit()
+        filepath.unlink()
+
+        stats["files"] += 1
+        stats["bytes_before"] += before
+        stats["bytes_after"] += after
+
+    return stats
 
 
 def list_results(
@@ -105,18 +318,69 @@ def list_results(
         List of file paths, sorted by most recent first
     """
     base_dir = settings.RESULTS_DIR
-
-    if category:
-        base_dir = base_dir / category
-
     if not base_dir.exists():
         return []
 
-    pattern = f"*{operation}*" if operation else "*"
-    files = sorted(base_dir.glob(f"**/{pattern}.json"), reverse=True)
+    files = _query_manifest(category, operation, limit)
+    if files is None:
+        # Manifest unavailable - scan the tree
+        if category:
+            base_dir = base_dir / category
+        pattern = f"*{operation}*" if operation else "*"
+        files = sorted(_iter_result_files(base_dir, pattern), reverse=True)
     return files[:limit]
 
 
+def _query_manifest(
+    category: Optional[str],
+    operation: Optional[str],
+    limit: int
+) -> Optional[List[Path]]:
+    """Look up result paths in the manifest, newest first.
+
+    An exact operation match uses the index; if nothing matches exactly, the
+    operation is matched as a substring of the path (the old glob behaviour).
+    Rows whose files were deleted are pruned. Returns None on database errors.
+    """
+    base_dir = settings.RESULTS_DIR
+    where, params = [], []
+    if category:
+        # Include nested categories (e.g. "plays/..."); ranges keep the index usable
+        where.append("(category = ? OR (category >= ? AND category < ?))")
+        params.extend([category, f"{category}/", f"{category}0"])
+
+    queries = [(where, params)]
+    if operation:
+        queries = [
+            (where + ["operation = ?"], params + [operation]),
+            (where + ["path LIKE ?"], params + [f"%{operation}%"]),
+        ]
+
+    try:
+        with _manifest_lock:
+            conn = _manifest()
+            for clauses, args in queries:
+                sql = "SELECT path FROM results"
+                if clauses:
+                    sql += " WHERE " + " AND ".join(clauses)
+                sql += " ORDER BY saved_at DESC, path DESC LIMIT ?"
+
+                while True:
+                    rows = [row[0] for row in conn.execute(sql, args + [limit])]
+                    stale = [p for p in rows if not (base_dir / p).exists()]
+                    if not stale:
+                        break
+                    conn.executemany("DELETE FROM results WHERE path = ?", [(p,) for p in stale])
+                    conn.commit()
+
+                if rows:
+                    return [base_dir / p for p in rows]
+            return []
+    except sqlite3.Error as e:
+        print(f"Results manifest unavailable ({e}); scanning files")
+        return None
+
+
 def get_latest_result(category: str, operation: Optional[str] = None) -> Optional[Dict]:
     """
     Get the most recent result for a category/operation.
@@ -132,3 +396,25 @@ def get_latest_result(category: str, operation: Optional[str] = None) -> Optiona
     if files:
         return load_result(files[0])
     return None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage the saved-results manifest")
+    parser.add_argument("command", choices=["backfill", "compact"],
+                        help="backfill: index existing result files; "
+                             "compact: compress existing .json results")
+    parser.add_argument("--format", choices=["json.gz", "json.zst"], default=None,
+                        help="Target format for compact (default: STORAGE_FORMAT or json.gz)")
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        added = backfill_manifest()
+        print(f"Indexed {added} result files in {settings.RESULTS_DIR / MANIFEST_NAME}")
+    elif args.command == "compact":
+        stats = compact_results(args.format)
+        saved = stats["bytes_before"] - stats["bytes_after"]
+        print(f"Compacted {stats['files']} files: "
+              f"{stats['bytes_before'] / 1024 / 1024:.1f} MB -> {stats['bytes_after'] / 1024 / 1024:.1f} MB "
+              f"({saved / 1024 / 1024:.1f} MB saved)")
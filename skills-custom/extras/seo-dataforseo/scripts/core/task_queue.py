@@ -0,0 +1,384 @@
+"""Standard-queue (task_post / tasks_ready / task_get) jobs for bulk DataForSEO work.
+
+Live endpoints answer immediately but cost the most. The standard queue is
+much cheaper and takes up to 100 tasks per POST; results are ready after a
+few minutes. A job here posts its tasks in batches, polls tasks_ready with
+backoff, fetches finished tasks concurrently and yields each result as it
+lands. Task ids and fetched results are journaled to SQLite as they come in,
+so re-running the same job after a crash picks up where it left off instead
+of paying for the tasks again.
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dataforseo_client.rest import ApiException
+
+from config.settings import settings
+from core.db import connect
+from core.cache import cache_key
+from core.client import get_client
+from core.executor import run_concurrent
+
+# Queue endpoint -> (api group, task_post, tasks_ready, task_get) SDK methods
+QUEUE_ENDPOINTS = {
+    "google_organic": ("serp", "google_organic_task_post",
+                       "google_organic_tasks_ready", "google_organic_task_get_advanced"),
+    "google_maps": ("serp", "google_maps_task_post",
+                    "google_maps_tasks_ready", "google_maps_task_get_advanced"),
+    "search_volume": ("keywords_data", "google_ads_search_volume_task_post",
+                      "google_ads_search_volume_tasks_ready", "google_ads_search_volume_task_get"),
+}
+
+TASKS_PER_POST = 100
+QUEUE_DB_NAME = "queue.sqlite3"
+
+# tasks_ready poll interval: starts short, backs off while nothing is ready
+POLL_INITIAL = 5.0
+POLL_MAX = 60.0
+POLL_BACKOFF = 1.5
+
+# A batch interrupted mid-POST is matched back to its tasks by tag in tasks_ready.
+# Rows never seen there after this long of polling were not created and are re-posted.
+UNCONFIRMED_POST_WAIT = 30 * 60
+
+# task_get status codes for tasks that are still being worked on
+_IN_PROGRESS = {40601, 40602}  # "Task Handed", "Task In Queue"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_id TEXT PRIMARY KEY,
+        endpoint TEXT NOT NULL,
+        total INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        finished_at REAL
+    );
+    CREATE TABLE IF NOT EXISTS tasks (
+        job_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        request TEXT NOT NULL,
+        task_id TEXT,
+        status TEXT NOT NULL DEFAULT 'new',
+        result BLOB,
+        error TEXT,
+        PRIMARY KEY (job_id, idx)
+    );
+    CREATE INDEX IF NOT EXISTS idx_tasks_task_id ON tasks(task_id);
+"""
+
+_db_lock = threading.Lock()
+
+
+class QueueTaskError(Exception):
+    """A queued task failed or returned an error status."""
+
+
+def _db() -> sqlite3.Connection:
+    return connect(QUEUE_DB_NAME, _SCHEMA)
+
+
+def job_id_for(endpoint: str, requests: List[Dict[str, Any]]) -> str:
+    """Deterministic id for a job, so re-running the same request list resumes it."""
+    return cache_key(f"queue.{endpoint}", requests)[:16]
+
+
+def _api_methods(endpoint: str):
+    if endpoint not in QUEUE_ENDPOINTS:
+        raise ValueError(f"Unknown queue endpoint '{endpoint}'. Options: {', '.join(QUEUE_ENDPOINTS)}")
+    group, post, ready, get = QUEUE_ENDPOINTS[endpoint]
+    api = getattr(get_client(), group)
+    return getattr(api, post), getattr(api, ready), getattr(api, get)
+
+
+def _as_dict(response: Any) -> Dict[str, Any]:
+    return response.to_dict() if hasattr(response, "to_dict") else response
+
+
+def _open_job(endpoint: str, requests: List[Dict[str, Any]], job_id: str) -> bool:
+    """Create the job journal, or reuse an unfinished one. Returns True if resumed."""
+    db = _db()
+    with _db_lock:
+        row = db.execute("SELECT finished_at FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is not None and row[0] is None:
+            return True
+        db.execute("DELETE FROM tasks WHERE job_id = ?", (job_id,))
+        db.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, NULL)",
+                   (job_id, endpoint, len(requests), time.time()))
+        db.executemany(
+            "INSERT INTO tasks (job_id, idx, request) VALUES (?, ?, ?)",
+            [(job_id, i, json.dumps(r, default=str)) for i, r in enumerate(requests)]
+        )
+        db.commit()
+    return False
+
+
+def _post_new(job_id: str, post):
+    """Post every not-yet-posted task of a job, TASKS_PER_POST at a time."""
+    db = _db()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT idx, request FROM tasks WHERE job_id = ? AND status = 'new' ORDER BY idx", (job_id,)
+        ).fetchall()
+
+    for start in range(0, len(rows), TASKS_PER_POST):
+        batch = rows[start:start + TASKS_PER_POST]
+        body = [dict(json.loads(request), tag=f"{job_id}:{idx}") for idx, request in batch]
+        # Journal the batch as 'posting' first: if the POST goes out and the process
+        # dies before the task ids are stored, _collect finds the tasks by tag
+        # instead of a resume paying for them again
+        keys = [(job_id, idx) for idx, _ in batch]
+        with _db_lock:
+            db.executemany("UPDATE tasks SET status = 'posting' WHERE job_id = ? AND idx = ?", keys)
+            db.commit()
+        try:
+            response = _as_dict(post(body))
+        except ApiException:
+            # The API answered with an error status - nothing was created
+            with _db_lock:
+                db.executemany("UPDATE tasks SET status = 'new' WHERE job_id = ? AND idx = ?", keys)
+                db.commit()
+            raise
+
+        updates, errors = [], []
+        tasks = response.get("tasks") or []
+        for (idx, _), task in zip(batch, tasks + [None] * (len(batch) - len(tasks))):
+            if task and task.get("status_code") == 20100 and task.get("id"):
+                updates.append((task["id"], job_id, idx))
+            else:
+                message = (task or {}).get("status_message") or response.get("status_message") or "not created"
+                errors.append((message, job_id, idx))
+        with _db_lock:
+            db.executemany("UPDATE tasks SET task_id = ?, status = 'pending' WHERE job_id = ? AND idx = ?", updates)
+            db.executemany("UPDATE tasks SET status = 'failed', error = ? WHERE job_id = ? AND idx = ?", errors)
+            db.commit()
+
+
+def _fetch(get, task_id: str) -> Optional[Dict[str, Any]]:
+    """task_get one task; None while it is still queued."""
+    result = _as_dict(get(task_id))
+    task = (result.get("tasks") or [{}])[0]
+    code = task.get("status_code")
+    if code in _IN_PROGRESS:
+        return None
+    if code != 20000:
+        raise QueueTaskError(f"Task {task_id}: {task.get('status_message') or result.get('status_message')}")
+    return result
+
+
+def _ready_tasks(ready) -> Dict[str, Optional[str]]:
+    """tasks_ready as {task id: tag}."""
+    response = _as_dict(ready())
+    tasks = {}
+    for task in response.get("tasks") or []:
+        for item in task.get("result") or []:
+            if isinstance(item, dict) and item.get("id"):
+                tasks[item["id"]] = item.get("tag")
+    return tasks
+
+
+def queue_tasks(
+    endpoint: str,
+    requests: List[Dict[str, Any]],
+    job_id: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Run a list of requests through the standard queue, yielding results as they finish.
+
+    Re-running the same endpoint + requests after a crash resumes the job: results
+    already fetched are yielded from the journal, posted tasks are not re-posted.
+
+    Args:
+        endpoint: One of QUEUE_ENDPOINTS ("google_organic", "google_maps", "search_volume")
+        requests: Task bodies, same fields as the matching live call
+        job_id: Journal id (default: derived from endpoint + requests)
+        timeout: Seconds to wait for results (default: settings.QUEUE_TIMEOUT_MINUTES);
+            tasks still pending at the deadline are yielded with a TimeoutError
+            and can be collected later with resume_job()
+
+    Yields:
+        (index, result, error) - index into requests, the full task_get response
+        (same shape as a live response), and the error if the task failed
+
+    Example:
+        >>> reqs = [{"keyword": kw, "location_name": "United States", "depth": 100} for kw in keywords]
+        >>> for i, serp, err in queue_tasks("google_organic", reqs): ...
+    """
+    job_id = job_id or job_id_for(endpoint, requests)
+    post, _, _ = _api_methods(endpoint)
+    resumed = _open_job(endpoint, requests, job_id)
+    if resumed:
+        print(f"   Resuming queue job {job_id}")
+
+    _post_new(job_id, post)
+    yield from _collect(job_id, endpoint, timeout, probe=resumed)
+
+
+def resume_job(job_id: str, timeout: Optional[float] = None) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Continue an unfinished job from its journal (see pending_jobs()).
+
+    Yields:
+        (index, result, error) for every task of the job, like queue_tasks()
+    """
+    db = _db()
+    with _db_lock:
+        row = db.execute("SELECT endpoint FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+    if row is None:
+        raise ValueError(f"No queue job '{job_id}'")
+    post, _, _ = _api_methods(row[0])
+    _post_new(job_id, post)
+    yield from _collect(job_id, row[0], timeout, probe=True)
+
+
+def _collect(job_id: str, endpoint: str, timeout: Optional[float], probe: bool):
+    db = _db()
+    _, ready, get = _api_methods(endpoint)
+
+    with _db_lock:
+        rows = db.execute(
+            "SELECT idx, task_id, status, result, error FROM tasks WHERE job_id = ? ORDER BY idx", (job_id,)
+        ).fetchall()
+    pending: Dict[str, int] = {}
+    posting: Dict[str, int] = {}  # tag -> idx, for batches interrupted mid-POST
+    for idx, task_id, status, blob, error in rows:
+        if status == "done":
+            yield idx, json.loads(zlib.decompress(blob)), None
+        elif status == "failed":
+            yield idx, None, QueueTaskError(error or "failed")
+        elif status == "pending":
+            pending[task_id] = idx
+        elif status == "posting":
+            posting[f"{job_id}:{idx}"] = idx
+
+    def store(task_id: str, result: Optional[Dict], error: Optional[Exception]):
+        with _db_lock:
+            if error is None:
+                body = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+                db.execute("UPDATE tasks SET status = 'done', result = ? WHERE task_id = ?",
+                           (zlib.compress(body), task_id))
+            else:
+                db.execute("UPDATE tasks SET status = 'failed', error = ? WHERE task_id = ?",
+                           (str(error), task_id))
+            db.commit()
+
+    started = time.monotonic()
+    deadline = started + (timeout if timeout is not None else settings.QUEUE_TIMEOUT_MINUTES * 60)
+    delay = POLL_INITIAL
+    # Tasks whose task_get hit a network/HTTP error - the result is paid for, fetch it again
+    retry = set()
+    while pending or posting:
+        ready_tasks = _ready_tasks(ready) if posting or not probe else {}
+        claimed = [(task_id, posting.pop(tag)) for task_id, tag in ready_tasks.items() if tag in posting]
+        if claimed:
+            with _db_lock:
+                db.executemany("UPDATE tasks SET task_id = ?, status = 'pending' WHERE job_id = ? AND idx = ?",
+                               [(task_id, job_id, idx) for task_id, idx in claimed])
+                db.commit()
+            pending.update(claimed)
+
+        if probe:
+            # Tasks fetched before a crash no longer show up in tasks_ready; ask for them directly
+            ids, probe = list(pending), False
+        else:
+            ids = [task_id for task_id in pending if task_id in ready_tasks or task_id in retry]
+
+        fetched = run_concurrent(lambda task_id: _fetch(get, task_id), ids)
+        landed = 0
+        for task_id, (result, error) in zip(ids, fetched):
+            if result is None and error is None:
+                continue
+            if error is not None and not isinstance(error, QueueTaskError):
+                # Still pending in the journal, so a later poll or resume_job() picks it up
+                print(f"   ⚠️  task_get {task_id} failed, retrying: {error}")
+                retry.add(task_id)
+                continue
+            retry.discard(task_id)
+            store(task_id, result, error)
+            landed += 1
+            yield pending.pop(task_id), result, error
+
+        if not pending and not posting:
+            break
+        if time.monotonic() >= deadline:
+            for task_id, idx in pending.items():
+                yield idx, None, TimeoutError(f"Queue job {job_id}: task {task_id} still pending")
+            if posting and time.monotonic() - started >= UNCONFIRMED_POST_WAIT:
+                with _db_lock:
+                    db.executemany("UPDATE tasks SET status = 'new' WHERE job_id = ? AND idx = ?",
+                                   [(job_id, idx) for idx in posting.values()])
+                    db.commit()
+            for tag, idx in posting.items():
+                yield idx, None, TimeoutError(f"Queue job {job_id}: task {tag} not confirmed as posted")
+            return
+        delay = POLL_INITIAL if landed else min(delay * POLL_BACKOFF, POLL_MAX)
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+
+    with _db_lock:
+        db.execute("UPDATE jobs SET finished_at = ? WHERE job_id = ?", (time.time(), job_id))
+        db.commit()
+
+
+def run_queued(
+    endpoint: str,
+    requests: List[Dict[str, Any]],
+    func: Optional[Callable[[int, Dict[str, Any]], Any]] = None,
+    on_result: Optional[Callable[[int, Dict[str, Any], Any, Optional[Exception]], None]] = None,
+    timeout: Optional[float] = None
+) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Standard-queue counterpart of run_concurrent().
+
+    Args:
+        endpoint: Queue endpoint (see QUEUE_ENDPOINTS)
+        requests: Task bodies
+        func: Optional func(index, response) applied to each response as it
+            lands (e.g. extract a rank); exceptions become that task's error
+        on_result: Optional callback(index, request, value, error), invoked as
+            each task finishes - lets a play stream progress
+        timeout: Seconds to wait (default: settings.QUEUE_TIMEOUT_MINUTES)
+
+    Returns:
+        List of (value, error) tuples in request order; error is None on success
+    """
+    results: List[Tuple[Any, Optional[Exception]]] = [(None, None)] * len(requests)
+    for i, response, error in queue_tasks(endpoint, requests, timeout=timeout):
+        value = None
+        if error is None:
+            try:
+                value = func(i, response) if func else response
+            except Exception as e:
+                error = e
+        results[i] = (value, error)
+        if on_result:
+            on_result(i, requests[i], value, error)
+    return results
+
+
+def pending_jobs() -> List[Dict[str, Any]]:
+    """List unfinished queue jobs with per-status task counts."""
+    db = _db()
+    with _db_lock:
+        jobs = db.execute(
+            "SELECT job_id, endpoint, total, created_at FROM jobs WHERE finished_at IS NULL ORDER BY created_at"
+        ).fetchall()
+        counts = db.execute(
+            "SELECT t.job_id, t.status, COUNT(*) FROM tasks t JOIN jobs j ON j.job_id = t.job_id "
+            "WHERE j.finished_at IS NULL GROUP BY t.job_id, t.status"
+        ).fetchall()
+    by_job: Dict[str, Dict[str, int]] = {}
+    for job_id, status, n in counts:
+        by_job.setdefault(job_id, {})[status] = n
+    return [
+        {"job_id": job_id, "endpoint": endpoint, "total": total, "created_at": created_at,
+         **{status: by_job.get(job_id, {}).get(status, 0) for status in ("new", "posting", "pending", "done", "failed")}}
+        for job_id, endpoint, total, created_at in jobs
+    ]
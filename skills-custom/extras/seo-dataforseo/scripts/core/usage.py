@@ -0,0 +1,354 @@
+"""Usage ledger: actual cost, latency, status and cache hits of every API call.
+
+The client meters each live/queue call (see core.client.MeteredApi) and the
+response cache reports its hits, so every call lands here as one row of
+results/usage.sqlite3 - tagged with the play and run it was made for. A run
+(one play invocation, see metered()) keeps a running total of what it spent
+and can carry a budget: a pre-flight estimate over the budget refuses to
+start, and once the money is spent further paid calls raise BudgetExceeded.
+"""
+import contextvars
+import functools
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import settings
+from core.db import connect
+
+USAGE_DB_NAME = "usage.sqlite3"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS calls (
+        id INTEGER PRIMARY KEY,
+        run_id TEXT NOT NULL,
+        play TEXT NOT NULL,
+        endpoint TEXT NOT NULL,
+        called_at REAL NOT NULL,
+        latency_ms REAL NOT NULL,
+        status_code INTEGER,
+        cost REAL NOT NULL,
+        tasks INTEGER NOT NULL,
+        task_errors INTEGER NOT NULL,
+        cached INTEGER NOT NULL,
+        error TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_calls_run ON calls(run_id);
+    CREATE INDEX IF NOT EXISTS idx_calls_play ON calls(play, called_at);
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id TEXT PRIMARY KEY,
+        play TEXT NOT NULL,
+        started_at REAL NOT NULL,
+        finished_at REAL,
+        budget REAL,
+        estimate REAL,
+        spent REAL NOT NULL DEFAULT 0,
+        calls INTEGER NOT NULL DEFAULT 0,
+        cache_hits INTEGER NOT NULL DEFAULT 0,
+        errors INTEGER NOT NULL DEFAULT 0,
+        status TEXT NOT NULL DEFAULT 'running'
+    );
+"""
+
+_db_lock = threading.Lock()
+
+# Runs open in the current context, outermost first. core.executor runs each
+# worker call in a copy of the caller's context, so those calls count too.
+_runs: contextvars.ContextVar = contextvars.ContextVar("usage_runs", default=())
+
+
+class BudgetExceeded(Exception):
+    """A run's estimated or actual spend went over its budget."""
+
+
+def _db() -> sqlite3.Connection:
+    return connect(USAGE_DB_NAME, _SCHEMA)
+
+
+class Run:
+    """Running totals for one play invocation."""
+
+    def __init__(self, play: str, budget: Optional[float] = None):
+        self.run_id = uuid.uuid4().hex[:16]
+        self.play = play
+        self.budget = budget
+        self.estimate: Optional[float] = None
+        self.spent = 0.0
+        self.calls = 0
+        self.charged = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.refused = 0
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Claim room for one paid call, or raise BudgetExceeded.
+
+        Calls already in flight are counted at this run's average cost per
+        charged call, so parallel workers stop close to the cap instead of
+        each starting one more call after the money is gone. Free calls
+        (queue polls, task_get) don't count toward the average - they would
+        drag it down and let queue-mode runs overshoot.
+        """
+        with self._lock:
+            if self.budget is not None:
+                average = self.spent / self.charged if self.charged else 0.0
+                projected = self.spent + self.in_flight * average
+                if projected >= self.budget and (self.charged or self.budget <= 0):
+                    self.refused += 1
+                    raise BudgetExceeded(
+                        f"{self.play}: budget ${self.budget:.2f} used up (spent ${self.spent:.4f}, "
+                        f"{self.in_flight} calls in flight)"
+                    )
+            self.in_flight += 1
+
+    def release(self):
+        """Give back a reservation whose call never went out."""
+        with self._lock:
+            self.in_flight -= 1
+
+    def settle(self, cost: float, cached: bool, failed: bool, reserved: bool):
+        with self._lock:
+            if reserved:
+                self.in_flight -= 1
+            self.calls += 1
+            self.charged += int(cost > 0)
+            self.spent += cost
+            self.cache_hits += int(cached)
+            self.errors += int(failed)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "play": self.play,
+            "budget": self.budget,
+            "estimate": self.estimate,
+            "spent": round(self.spent, 6),
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "refused": self.refused,
+            "seconds": round(time.time() - self.started_at, 1),
+        }
+
+
+def current_run() -> Optional[Run]:
+    """The innermost run open in this context, if any."""
+    runs = _runs.get()
+    return runs[-1] if runs else None
+
+
+def reserve_call() -> Tuple[Run, ...]:
+    """Check every open run's budget before a paid call; returns the runs to settle."""
+    runs = _runs.get()
+    for i, run in enumerate(runs):
+        try:
+            run.reserve()
+        except BudgetExceeded:
+            for reserved in runs[:i]:
+                reserved.release()
+            raise
+    return runs
+
+
+def record_call(
+    endpoint: str,
+    latency: float = 0.0,
+    status_code: Optional[int] = None,
+    cost: float = 0.0,
+    tasks: int = 0,
+    task_errors: int = 0,
+    cached: bool = False,
+    error: Optional[str] = None,
+    runs: Optional[Tuple[Run, ...]] = None
+):
+    """
+    Add one call to the ledger and to the totals of every open run.
+
+    Args:
+        endpoint: "<api group>.<sdk method>"
+        latency: Seconds the call took
+        status_code: Top-level DataForSEO (or HTTP) status code
+        cost: Dollars DataForSEO charged (0 for cache hits)
+        tasks / task_errors: Tasks in the response / tasks with a non-20000 status
+        cached: Served from the response cache
+        error: Exception text if the call raised
+        runs: Runs returned by reserve_call() (default: the runs open now, unreserved)
+    """
+    reserved = runs is not None
+    runs = _runs.get() if runs is None else runs
+    for run in runs:
+        run.settle(cost, cached, bool(error or task_errors), reserved)
+    run = runs[-1] if runs else None
+    db = _db()
+    with _db_lock:
+        db.execute(
+            "INSERT INTO calls (run_id, play, endpoint, called_at, latency_ms, status_code, cost, "
+            "tasks, task_errors, cached, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run.run_id if run else "", run.play if run else "", endpoint, time.time(),
+             round(latency * 1000, 1), status_code, cost, tasks, task_errors, int(cached), error)
+        )
+        db.commit()
+
+
+def _save_run(run: Run, status: str):
+    db = _db()
+    with _db_lock:
+        db.execute(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run.run_id, run.play, run.started_at, time.time() if status != "running" else None,
+             run.budget, run.estimate, run.spent, run.calls, run.cache_hits, run.errors, status)
+        )
+        db.commit()
+
+
+@contextmanager
+def metered_run(play: str, budget: Optional[float] = None) -> Iterator[Run]:
+    """
+    Count every API call made inside the block as one run of `play`.
+
+    Args:
+        play: Name the calls are filed under in the ledger
+        budget: Dollar cap for the run (default: settings.RUN_BUDGET, 0 = no cap)
+
+    Example:
+        >>> with metered_run("rank_check", budget=0.50) as run:
+        ...     rank_check("yourblog.com", keywords)
+        >>> run.summary()["spent"]
+    """
+    if budget is None:
+        budget = settings.RUN_BUDGET or None
+    run = Run(play, budget)
+    _save_run(run, "running")
+    token = _runs.set(_runs.get() + (run,))
+    status = "failed"
+    try:
+        yield run
+        # Workers' BudgetExceeded errors are usually collected, not raised
+        status = "over_budget" if run.refused else "done"
+    except BudgetExceeded:
+        status = "over_budget"
+        raise
+    finally:
+        _runs.reset(token)
+        _save_run(run, status)
+
+
+def metered(play: str) -> Callable:
+    """
+    Decorator: each call of a play function is one metered run.
+
+    The wrapped function accepts an extra `budget=` keyword (dollars) that
+    caps the run; see metered_run().
+    """
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, budget: Optional[float] = None, **kwargs):
+            with metered_run(play, budget=budget):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def preflight(estimate: float, label: str = ""):
+    """
+    Check a play's up-front cost estimate against the open runs' budgets.
+
+    Call it once the play knows how much work it has (cities, keywords...)
+    and before the first paid call. Raises BudgetExceeded if the estimate
+    plus what a run already spent goes over its budget.
+
+    Example:
+        >>> preflight(len(pending) * 0.002, f"{len(pending)} cities")
+    """
+    for run in _runs.get():
+        if run.estimate is None:
+            run.estimate = estimate
+        if run.budget is not None and run.spent + estimate > run.budget:
+            raise BudgetExceeded(
+                f"{run.play}: estimated ${estimate:.4f}{f' for {label}' if label else ''} "
+                f"is over the ${run.budget:.2f} budget (already spent ${run.spent:.4f})"
+            )
+
+
+def usage_report(days: int = 30, play: Optional[str] = None, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Summarize the ledger: spend, calls, cache hits and latency by play and endpoint.
+
+    Args:
+        days: Look back this many days
+        play: Only this play
+        verbose: Print the report
+
+    Returns:
+        Dict with totals, by_play, by_endpoint and the latest runs
+    """
+    since = time.time() - days * 86400
+    where, params = "called_at >= ?", [since]
+    if play:
+        where += " AND play = ?"
+        params.append(play)
+    columns = ("calls", "cache_hits", "cost", "avg_latency_ms", "errors")
+    aggregates = ("COUNT(*), SUM(cached), ROUND(SUM(cost), 6), ROUND(AVG(CASE WHEN cached = 0 "
+                  "THEN latency_ms END), 1), SUM(error IS NOT NULL OR task_errors > 0)")
+
+    db = _db()
+    with _db_lock:
+        totals = db.execute(f"SELECT {aggregates} FROM calls WHERE {where}", params).fetchone()
+        by_play = db.execute(
+            f"SELECT play, {aggregates} FROM calls WHERE {where} GROUP BY play ORDER BY SUM(cost) DESC",
+            params
+        ).fetchall()
+        by_endpoint = db.execute(
+            f"SELECT endpoint, {aggregates} FROM calls WHERE {where} GROUP BY endpoint ORDER BY SUM(cost) DESC",
+            params
+        ).fetchall()
+        runs = db.execute(
+            "SELECT run_id, play, started_at, finished_at, budget, estimate, spent, calls, cache_hits, "
+            "errors, status FROM runs WHERE started_at >= ?" + (" AND play = ?" if play else "") +
+            " ORDER BY started_at DESC LIMIT 20",
+            params
+        ).fetchall()
+
+    def row(values) -> Dict[str, Any]:
+        return {name: value or 0 for name, value in zip(columns, values)}
+
+    report = {
+        "days": days,
+        "totals": row(totals),
+        "by_play": [dict(play=r[0] or "(no play)", **row(r[1:])) for r in by_play],
+        "by_endpoint": [dict(endpoint=r[0], **row(r[1:])) for r in by_endpoint],
+        "runs": [dict(zip(("run_id", "play", "started_at", "finished_at", "budget", "estimate", "spent",
+                           "calls", "cache_hits", "errors", "status"), r)) for r in runs],
+    }
+    if verbose:
+        t = report["totals"]
+        print(f"DataForSEO usage, last {days} days: ${t['cost']:.4f} over {t['calls']} calls "
+              f"({t['cache_hits']} cache hits, {t['errors']} errors)")
+        for p in report["by_play"]:
+            print(f"  {p['play']:<30} ${p['cost']:>9.4f}  calls={p['calls']} cached={p['cache_hits']} "
+                  f"avg={p['avg_latency_ms']}ms errors={p['errors']}")
+    return report
+
+
+def run_usage(run_id: str) -> List[Dict[str, Any]]:
+    """Every ledgered call of one run, oldest first."""
+    db = _db()
+    with _db_lock:
+        rows = db.execute(
+            "SELECT endpoint, called_at, latency_ms, status_code, cost, tasks, task_errors, cached, error "
+            "FROM calls WHERE run_id = ? ORDER BY id", (run_id,)
+        ).fetchall()
+    names = ("endpoint", "called_at", "latency_ms", "status_code", "cost", "tasks", "task_errors", "cached", "error")
+    return [dict(zip(names, r)) for r in rows]
@@ -28,6 +28,7 @@ All results are automatically saved to the /results directory with timestamps.
     play6: market_gap_finder(niche)
     play7: local_business_scraper(business_type, cities, state)
     play8: local_pack_intel(keyword, city)
+           local_grid_scan(keywords, center, business, grid_size)
     play9: expired_domain_finder(niche_keywords, dr_floor, max_spam)
     play10: bvs_score_domains(csv_path, target_site)
 
@@ -37,55 +38,122 @@ All results are automatically saved to the /results directory with timestamps.
     youtube_gap_finder(topic)
     trend_watch(topics, location)
 """
+import functools
+import importlib
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import all API modules
-from api.keywords_data import (
-    get_search_volume,
-    get_keywords_for_site,
-    get_ad_traffic_by_keywords,
-    get_keywords_for_keywords
-)
-from api.labs import (
-    get_keyword_overview,
-    get_keyword_suggestions,
-    get_keyword_ideas,
-    get_related_keywords,
-    get_bulk_keyword_difficulty,
-    get_historical_search_volume,
-    get_search_intent,
-    get_domain_keywords,
-    get_competitors,
-    get_keywords_for_site as get_labs_keywords_for_site
-)
-from api.serp import (
-    get_google_serp,
-    get_youtube_serp,
-    get_google_maps_serp,
-    get_google_news_serp,
-    get_google_images_serp,
-    get_featured_snippet
-)
-from api.trends import (
-    get_trends_explore,
-    get_youtube_trends,
-    get_news_trends,
-    get_shopping_trends,
-    compare_keyword_trends,
-    get_trending_now
-)
-from core.storage import list_results, load_result, get_latest_result, save_result
+# API, core and play functions are bound to lazy stubs: `import main` (and
+# `from main import *`) stays cheap, and each module - with the SDK behind
+# it - is imported the first time one of its functions is called.
+_LAZY_EXPORTS = {
+    "api.keywords_data": (
+        "get_search_volume",
+        "get_keywords_for_site",
+        "get_ad_traffic_by_keywords",
+        "get_keywords_for_keywords",
+    ),
+    "api.labs": (
+        "get_keyword_overview",
+        "get_keyword_suggestions",
+        "get_keyword_ideas",
+        "get_related_keywords",
+        "get_bulk_keyword_difficulty",
+        "get_historical_search_volume",
+        "get_search_intent",
+        "get_domain_keywords",
+        "get_competitors",
+        ("get_labs_keywords_for_site", "get_keywords_for_site"),
+    ),
+    "api.serp": (
+        "get_google_serp",
+        "get_youtube_serp",
+        "get_google_maps_serp",
+        "get_google_news_serp",
+        "get_google_images_serp",
+        "get_featured_snippet",
+    ),
+    "api.trends": (
+        "get_trends_explore",
+        "get_youtube_trends",
+        "get_news_trends",
+        "get_shopping_trends",
+        "compare_keyword_trends",
+        "get_trending_now",
+    ),
+    "core.cache": ("cache_report",),
+    "core.clustering": ("cluster_keywords",),
+    "core.rank_history": (("set_rank_schedule", "set_schedule"), ("rank_history", "keyword_history")),
+    "core.executor": ("fan_out", "run_concurrent"),
+    "core.usage": ("usage_report", "metered_run"),
+    "core.storage": ("list_results", "load_result", "get_latest_result", "save_result"),
+    "play1_affiliate_kw": ("affiliate_keyword_miner",),
+    "play4_competitor_teardown": ("competitor_teardown",),
+    "play7_local_scraper": ("local_business_scraper",),
+    "play8_local_pack": ("local_grid_scan",),
+    "play9_expired_domains": ("expired_domain_finder",),
+    "play10_bvs_scorer": ("bvs_score_domains",),
+}
+
+
+class _LazyFunction:
+    """Stands in for a function until first call, then imports and forwards to it."""
+
+    __slots__ = ("_module", "_name", "_target")
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        # __wrapped__ lets inspect.signature()/help() see the real function
+        if attr == "__wrapped__":
+            return self._resolve()
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<lazy {self._module}.{self._name} ({state})>"
+
+
+for _module, _names in _LAZY_EXPORTS.items():
+    for _entry in _names:
+        _alias, _name = _entry if isinstance(_entry, tuple) else (_entry, _entry)
+        globals()[_alias] = _LazyFunction(_module, _name)
+del _module, _names, _entry, _alias, _name
+
+
+def _metered(play: str):
+    """Meter each call as one run of `play` (see core.usage.metered) without importing core at startup."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, budget: Optional[float] = None, **kwargs):
+            from core.usage import metered_run
+            with metered_run(play, budget=budget):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
 
 
 # ============================================================================
 # HIGH-LEVEL CONVENIENCE FUNCTIONS
 # ============================================================================
 
+@_metered("keyword_research")
 def keyword_research(
     keyword: str,
     location_name: str = None,
@@ -153,6 +221,7 @@ def keyword_research(
     return results
 
 
+@_metered("youtube_keyword_research")
 def youtube_keyword_research(
     keyword: str,
     location_name: str = None,
@@ -218,6 +287,7 @@ def youtube_keyword_research(
     return results
 
 
+@_metered("landing_page_keyword_research")
 def landing_page_keyword_research(
     keywords: List[str],
     competitor_domain: str = None,
@@ -291,6 +361,7 @@ def landing_page_keyword_research(
     return results
 
 
+@_metered("full_keyword_analysis")
 def full_keyword_analysis(
     keywords: List[str],
     location_name: str = None,
@@ -315,58 +386,42 @@ def full_keyword_analysis(
         include_trends: Include Google Trends data
 
     Returns:
-        Dict with comprehensive keyword analysis
+        Dict with one entry per analysis; lookups that failed or timed out are
+        left out and listed under "errors"
 
     Example:
         >>> result = full_keyword_analysis(["ai writing tools", "chatgpt alternatives"])
     """
     print(f"\n📊 Full keyword analysis: {keywords}")
-    results = {}
-
-    print("  → Getting keyword overview...")
-    results["overview"] = get_keyword_overview(
-        keywords=keywords,
-        location_name=location_name,
-        include_serp_info=True
-    )
-
-    print("  → Getting keyword difficulty...")
-    results["difficulty"] = get_bulk_keyword_difficulty(
-        keywords=keywords,
-        location_name=location_name
-    )
 
-    print("  → Getting search intent...")
-    results["search_intent"] = get_search_intent(
-        keywords=keywords,
-        location_name=location_name
-    )
-
-    print("  → Getting keyword ideas...")
-    results["keyword_ideas"] = get_keyword_ideas(
-        keywords=keywords,
-        location_name=location_name,
-        limit=100
-    )
-
-    if include_historical:
-        print("  → Getting historical search volume...")
-        results["historical"] = get_historical_search_volume(
-            keywords=keywords,
-            location_name=location_name
-        )
-
-    if include_trends:
-        print("  → Getting Google Trends data...")
-        results["trends"] = get_trends_explore(
-            keywords=keywords[:5],
-            location_name=location_name
-        )
+    # The six lookups are independent - run them at once, keep whatever succeeds
+    def report(name, value, error):
+        print(f"  ⚠️  {name} failed: {error}" if error else f"  → {name} done")
+
+    results, errors = fan_out({
+        "overview": lambda: get_keyword_overview(
+            keywords=keywords, location_name=location_name, include_serp_info=True
+        ),
+        "difficulty": lambda: get_bulk_keyword_difficulty(keywords=keywords, location_name=location_name),
+        "search_intent": lambda: get_search_intent(keywords=keywords, location_name=location_name),
+        "keyword_ideas": lambda: get_keyword_ideas(keywords=keywords, location_name=location_name, limit=100),
+        "historical": (lambda: get_historical_search_volume(
+            keywords=keywords, location_name=location_name
+        )) if include_historical else None,
+        "trends": (lambda: get_trends_explore(
+            keywords=keywords[:5], location_name=location_name
+        )) if include_trends else None,
+    }, on_result=report)
+    if errors and not results:
+        raise next(iter(errors.values()))
+    if errors:
+        results["errors"] = {name: str(error) for name, error in errors.items()}
 
     print(f"✅ Full analysis complete\n")
     return results
 
 
+@_metered("competitor_analysis")
 def competitor_analysis(
     domain: str,
     keywords: List[str] = None,
@@ -413,6 +468,7 @@ def competitor_analysis(
     return results
 
 
+@_metered("trending_topics")
 def trending_topics(
     location_name: str = None
 ) -> Dict[str, Any]:
@@ -466,6 +522,16 @@ def load_latest(category: str, operation: str = None) -> Optional[Dict]:
     return get_latest_result(category=category, operation=operation)
 
 
+def response_cache_report() -> Dict[str, Any]:
+    """
+    Print and return the API response cache hit-rate report.
+
+    Returns:
+        Dict with overall and per-endpoint hits, misses and hit rate
+    """
+    return cache_report()
+
+
 # ============================================================================
 # QUICK ACCESS - Direct API function exports
 # ============================================================================
@@ -478,65 +544,11 @@ def load_latest(category: str, operation: str = None) -> Optional[Dict]:
 # from api.backlinks import get_backlinks_summary, get_referring_domains
 
 
-# ============================================================================
-# PLAY IMPORTS - Outcome-oriented workflows
-# ============================================================================
-
-try:
-    from play1_affiliate_kw import affiliate_keyword_miner
-except ImportError as e:
-    def affiliate_keyword_miner(*a, **kw): raise ImportError(f"Play 1 not available: {e}")
-
-try:
-    from play4_competitor_teardown import competitor_teardown
-except ImportError as e:
-    def competitor_teardown(*a, **kw): raise ImportError(f"Play 4 not available: {e}")
-
-try:
-    from play7_local_scraper import local_business_scraper
-except ImportError as e:
-    def local_business_scraper(*a, **kw): raise ImportError(f"Play 7 not available: {e}")
-
-try:
-    from play9_expired_domains import expired_domain_finder
-except ImportError as e:
-    def expired_domain_finder(*a, **kw): raise ImportError(f"Play 9 not available: {e}")
-
-try:
-    from play10_bvs_scorer import bvs_score_domains
-except ImportError as e:
-    def bvs_score_domains(*a, **kw): raise ImportError(f"Play 10 not available: {e}")
-
-try:
-    from play2_content_calendar import build_content_calendar as _play2_calendar
-except ImportError:
-    _play2_calendar = None
-
-try:
-    from play3_serp_features import serp_feature_sniper as _play3_sniper
-except ImportError:
-    _play3_sniper = None
-
-try:
-    from play5_backlink_gap import backlink_gap_finder as _play5_gap
-except ImportError:
-    _play5_gap = None
-
-try:
-    from play6_market_gap import market_gap_finder as _play6_market
-except ImportError:
-    _play6_market = None
-
-try:
-    from play8_local_pack import local_pack_intel as _play8_pack
-except ImportError:
-    _play8_pack = None
-
-
 # ============================================================================
 # INLINE PLAYS (2, 3, 5, 6, 8) - Lighter workflows using existing API functions
 # ============================================================================
 
+@_metered("content_calendar")
 def content_calendar(
     domain_or_niche: str,
     months: int = 3,
@@ -557,6 +569,8 @@ def content_calendar(
     """
     from api.labs import get_keywords_for_site as _labs_kw_site, get_keyword_ideas
     from api.trends import get_trends_explore
+    from core.clustering import cached_serp_urls, collapse_variants
+    from core.items import LABS_KEYWORD, iter_rows
     from datetime import datetime, timedelta
     import calendar
 
@@ -573,36 +587,25 @@ def content_calendar(
         print("   Pulling keyword ideas for niche...")
         raw = get_keyword_ideas(keywords=[domain_or_niche], location_name=location, limit=200)
 
-    # Extract keywords
-    keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    kd = item.get("keyword_data", item)
-                    ki = kd.get("keyword_info", {}) or {}
-                    kw_text = kd.get("keyword", item.get("keyword", ""))
-                    volume = ki.get("search_volume", item.get("search_volume", 0)) or 0
-                    cpc = ki.get("cpc", item.get("cpc", 0)) or 0
-                    kd_score = kd.get("keyword_properties", {}).get("keyword_difficulty",
-                               item.get("keyword_difficulty", 50)) or 50
-                    if kw_text and volume > 0:
-                        priority = (volume * max(cpc, 0.1)) / max(kd_score, 1)
-                        keywords.append({
-                            "keyword": kw_text,
-                            "volume": volume,
-                            "cpc": round(cpc, 2),
-                            "kd": kd_score,
-                            "priority": round(priority, 2)
-                        })
-    except Exception as e:
-        print(f"   ⚠️  Keyword extraction error: {e}")
-
-    keywords.sort(key=lambda x: x["priority"], reverse=True)
-    top_keywords = keywords[:months * 8]  # ~8 posts per month
+    # Score keywords as they stream out of the response
+    def scored():
+        for kw in iter_rows(raw, LABS_KEYWORD, where=lambda r: r["keyword"] and r["volume"] > 0):
+            kd_score = kw["kd"] or 50
+            yield {
+                "keyword": kw["keyword"],
+                "volume": kw["volume"],
+                "cpc": round(kw["cpc"], 2),
+                "kd": kd_score,
+                "priority": round((kw["volume"] * max(kw["cpc"], 0.1)) / max(kd_score, 1), 2)
+            }
+
+    # One post per topic: variants ("best X", "X best", "best X 2026") share a slot
+    keywords = list(scored())
+    topics = collapse_variants(
+        keywords, score=lambda k: k["priority"],
+        serp_urls=cached_serp_urls([k["keyword"] for k in keywords], location_name=location)
+    )
+    top_keywords = topics[:months * 8]
 
     # Assign to months
     now = datetime.now()
@@ -617,16 +620,18 @@ def content_calendar(
     # Build markdown
     lines = [f"# Content Calendar: {domain_or_niche}", f""]
     for month, kws in calendar_data.items():
-        lines.extend([f"## {month}", f"", f"| Post | Keyword | Volume | CPC | KD |",
-                      f"|------|---------|--------|-----|----|"])
+        lines.extend([f"## {month}", f"", f"| Post | Keyword | Volume | CPC | KD | Variants |",
+                      f"|------|---------|--------|-----|----|----------|"])
         for j, kw in enumerate(kws, 1):
-            lines.append(f"| Post {j} | {kw['keyword']} | {kw['volume']:,} | ${kw['cpc']} | {kw['kd']} |")
+            lines.append(f"| Post {j} | {kw['keyword']} | {kw['volume']:,} | ${kw['cpc']} | {kw['kd']} | "
+                         f"{len(kw['variants'])} |")
         lines.append("")
 
     result = {
         "domain_or_niche": domain_or_niche,
         "months": months,
         "total_keywords": len(keywords),
+        "topics": len(topics),
         "calendar": calendar_data,
         "markdown": "\n".join(lines)
     }
@@ -635,6 +640,7 @@ def content_calendar(
     return result
 
 
+@_metered("serp_sniper")
 def serp_feature_sniper(
     topic: str,
     keyword_list: Optional[List[str]] = None,
@@ -655,6 +661,7 @@ def serp_feature_sniper(
     """
     from api.labs import get_keyword_suggestions
     from api.serp import get_google_serp
+    from core.items import KEYWORD, iter_items
     import re
 
     location = location_name or "United States"
@@ -666,34 +673,29 @@ def serp_feature_sniper(
     else:
         print("   Getting keyword suggestions...")
         sugg_raw = get_keyword_suggestions(keyword=topic, location_name=location, limit=20)
-        keywords_to_check = [topic]
-        try:
-            tasks = sugg_raw.get("tasks", []) if isinstance(sugg_raw, dict) else []
-            for task in tasks:
-                for result in task.get("result", []) or []:
-                    for item in result.get("items", []) or []:
-                        if isinstance(item, dict):
-                            kw = item.get("keyword", "")
-                            if kw and kw != topic:
-                                keywords_to_check.append(kw)
-        except Exception:
-            pass
-        keywords_to_check = keywords_to_check[:8]
+        suggestions = (kw for kw in map(KEYWORD, iter_items(sugg_raw)) if kw and kw != topic)
+        keywords_to_check = [topic] + list(islice(suggestions, 7))
 
     paa_questions = []
     featured_snippets = []
     image_packs = []
 
-    for kw in keywords_to_check:
-        print(f"   Checking SERP for: {kw}...")
-        try:
-            serp_raw = get_google_serp(kw, location_name=location, depth=10, save=False)
-            features = _extract_serp_features(serp_raw, kw)
+    def check(kw: str) -> Dict:
+        serp_raw = get_google_serp(kw, location_name=location, depth=10, save=False)
+        return _extract_serp_features(serp_raw, kw)
+
+    def report(i, kw, features, error):
+        if error is None:
+            print(f"   Checked SERP for: {kw}")
+        else:
+            print(f"   ⚠️  '{kw}' failed: {error}")
+
+    print(f"   Checking {len(keywords_to_check)} SERPs...")
+    for features, error in run_concurrent(check, keywords_to_check, on_result=report):
+        if error is None:
             paa_questions.extend(features["paa"])
             featured_snippets.extend(features["featured_snippets"])
             image_packs.extend(features["image_packs"])
-        except Exception as e:
-            print(f"   ⚠️  Failed: {e}")
 
     # Deduplicate PAA
     seen_paa = set()
@@ -731,46 +733,38 @@ def serp_feature_sniper(
 
 def _extract_serp_features(serp_raw: Dict, keyword: str) -> Dict:
     """Extract SERP features from organic SERP response."""
+    from core.items import iter_items
+
     features = {"paa": [], "featured_snippets": [], "image_packs": []}
-    try:
-        tasks = serp_raw.get("tasks", []) if isinstance(serp_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    item_type = item.get("type", "")
-
-                    if item_type == "people_also_ask":
-                        items = item.get("items", []) or []
-                        for paa_item in items:
-                            if isinstance(paa_item, dict):
-                                q = paa_item.get("title", paa_item.get("question", ""))
-                                if q:
-                                    features["paa"].append({
-                                        "question": q,
-                                        "keyword": keyword,
-                                        "featured_title": paa_item.get("featured_title", ""),
-                                        "url": paa_item.get("url", "")
-                                    })
-
-                    elif item_type == "featured_snippet":
-                        holder_url = item.get("url", "")
-                        holder_domain = item.get("domain", "")
-                        features["featured_snippets"].append({
+    for item in iter_items(serp_raw, types={"people_also_ask", "featured_snippet", "images"}):
+        item_type = item["type"]
+
+        if item_type == "people_also_ask":
+            for paa_item in item.get("items", []) or []:
+                if isinstance(paa_item, dict):
+                    q = paa_item.get("title", paa_item.get("question", ""))
+                    if q:
+                        features["paa"].append({
+                            "question": q,
                             "keyword": keyword,
-                            "holder_url": holder_url,
-                            "holder_domain": holder_domain,
-                            "snippet_text": item.get("description", "")[:200]
+                            "featured_title": paa_item.get("featured_title", ""),
+                            "url": paa_item.get("url", "")
                         })
 
-                    elif item_type == "images":
-                        features["image_packs"].append({"keyword": keyword})
-    except Exception:
-        pass
+        elif item_type == "featured_snippet":
+            features["featured_snippets"].append({
+                "keyword": keyword,
+                "holder_url": item.get("url", ""),
+                "holder_domain": item.get("domain", ""),
+                "snippet_text": (item.get("description") or "")[:200]
+            })
+
+        else:
+            features["image_packs"].append({"keyword": keyword})
     return features
 
 
+@_metered("backlink_gap")
 def backlink_gap_finder(
     your_domain: str,
     competitor_domain: str
@@ -788,27 +782,18 @@ def backlink_gap_finder(
     Cost: ~$0.04 ($0.02 x 2 summaries)
     """
     from api.backlinks import get_domain_intersection, get_backlinks_summary
+    from core.items import Field, Projection, iter_items
 
     print(f"\n🔗 Backlink Gap Finder: {competitor_domain} vs {your_domain}")
 
     try:
         gap_raw = get_domain_intersection(your_domain, competitor_domain)
-        gap_domains = []
-        try:
-            tasks = gap_raw.get("tasks", []) if isinstance(gap_raw, dict) else []
-            for task in tasks:
-                for result in task.get("result", []) or []:
-                    for item in result.get("items", []) or []:
-                        if isinstance(item, dict):
-                            gap_domains.append({
-                                "domain": item.get("domain", ""),
-                                "rank": item.get("rank", 0),
-                                "backlinks_to_competitor": item.get("backlinks", 0)
-                            })
-        except Exception as e:
-            print(f"   ⚠️  Gap extraction error: {e}")
-
-        gap_domains.sort(key=lambda x: x.get("rank", 0), reverse=True)
+        gap_row = Projection(
+            domain=Field("domain", default=""),
+            rank=Field("rank", default=0),
+            backlinks_to_competitor=Field("backlinks", default=0),
+        )
+        gap_domains = sorted(map(gap_row, iter_items(gap_raw)), key=lambda x: x["rank"], reverse=True)
 
         lines = [
             f"# Backlink Gap: {competitor_domain} vs {your_domain}",
@@ -838,6 +823,7 @@ def backlink_gap_finder(
         return {"error": str(e), "gap_domains": []}
 
 
+@_metered("market_gap")
 def market_gap_finder(
     niche: str,
     location_name: str = None,
@@ -852,11 +838,13 @@ def market_gap_finder(
         limit: Max keyword ideas to fetch
 
     Returns:
-        Dict with top 20 gap opportunities ranked by opportunity score
+        Dict with top 20 gap opportunities (one per keyword topic) ranked by opportunity score
 
     Cost: ~$0.01-0.04
     """
     from api.labs import get_keyword_ideas, get_search_intent
+    from core.clustering import cached_serp_urls, collapse_variants
+    from core.items import LABS_KEYWORD, iter_rows
 
     location = location_name or "United States"
     print(f"\n🗺️  Market Gap Finder: '{niche}'")
@@ -865,64 +853,51 @@ def market_gap_finder(
     ideas_raw = get_keyword_ideas(keywords=[niche], location_name=location, limit=limit)
 
     keywords = []
-    try:
-        tasks = ideas_raw.get("tasks", []) if isinstance(ideas_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    ki = item.get("keyword_info", {}) or {}
-                    volume = ki.get("search_volume", item.get("search_volume", 0)) or 0
-                    cpc = ki.get("cpc", item.get("cpc", 0)) or 0
-                    kd = item.get("keyword_properties", {}).get("keyword_difficulty",
-                         item.get("keyword_difficulty", 100)) or 100
-                    if volume > 0:
-                        opp = (volume * max(cpc, 0.1)) / max(kd, 1)
-                        keywords.append({
-                            "keyword": item.get("keyword", ""),
-                            "volume": volume,
-                            "cpc": round(cpc, 2),
-                            "kd": kd,
-                            "opportunity_score": round(opp, 2),
-                            "competition": ki.get("competition_level", "")
-                        })
-    except Exception as e:
-        print(f"   ⚠️  Extraction error: {e}")
+    for kw in iter_rows(ideas_raw, LABS_KEYWORD, where=lambda r: r["volume"] > 0):
+        kw["kd"] = kw["kd"] or 100
+        kw["cpc"] = round(kw["cpc"], 2)
+        kw["opportunity_score"] = round((kw["volume"] * max(kw["cpc"], 0.1)) / max(kw["kd"], 1), 2)
+        keywords.append(kw)
 
-    # Find gaps: high opp score, reasonable KD
+    # Find gaps: high opp score, reasonable KD - then one opportunity per topic, not per variant
     gaps = [k for k in keywords if k["kd"] <= 40 and k["volume"] >= 100]
-    gaps.sort(key=lambda x: x["opportunity_score"], reverse=True)
-    top_20 = gaps[:20]
+    gap_topics = collapse_variants(
+        gaps, score=lambda k: k["opportunity_score"],
+        serp_urls=cached_serp_urls([k["keyword"] for k in gaps], location_name=location)
+    )
+    top_20 = gap_topics[:20]
 
     lines = [
         f"# Market Gap Finder: {niche}",
         f"",
         f"**Total keywords analyzed:** {len(keywords)}",
-        f"**Gap opportunities (KD <= 40, Vol >= 100):** {len(gaps)}",
+        f"**Gap opportunities (KD <= 40, Vol >= 100):** {len(gaps)} keywords in {len(gap_topics)} topics",
         f"",
         f"## Top 20 Gap Opportunities",
         f"",
-        f"| # | Keyword | Volume | CPC | KD | Opp Score |",
-        f"|---|---------|--------|-----|----|-----------|",
+        f"| # | Keyword | Volume | CPC | KD | Opp Score | Topic Volume | Variants |",
+        f"|---|---------|--------|-----|----|-----------|--------------|----------|",
     ]
     for i, kw in enumerate(top_20, 1):
         lines.append(
-            f"| {i} | {kw['keyword']} | {kw['volume']:,} | ${kw['cpc']} | {kw['kd']} | {kw['opportunity_score']:.0f} |"
+            f"| {i} | {kw['keyword']} | {kw['volume']:,} | ${kw['cpc']} | {kw['kd']} | {kw['opportunity_score']:.0f} | "
+            f"{kw['cluster_volume']:,} | {len(kw['variants'])} |"
         )
 
     result = {
         "niche": niche,
         "total_keywords": len(keywords),
         "gaps": gaps,
+        "gap_topics": len(gap_topics),
         "top_20": top_20,
         "report": "\n".join(lines)
     }
     save_result(result, category="plays", operation="market_gap", keyword=niche)
-    print(f"✅ Found {len(gaps)} gap opportunities, top 20 in report")
+    print(f"✅ Found {len(gaps)} gap opportunities in {len(gap_topics)} topics, top 20 in report")
     return result
 
 
+@_metered("local_pack")
 def local_pack_intel(
     keyword: str,
     city: str,
@@ -942,6 +917,7 @@ def local_pack_intel(
     Cost: ~$0.004 (maps + organic SERP)
     """
     from api.serp import get_google_maps_serp, get_google_serp
+    from core.items import iter_items
 
     maps_keyword = f"{keyword} {city}"
     print(f"\n🗺️  Local Pack Intel: '{keyword}' in {city}")
@@ -955,26 +931,18 @@ def local_pack_intel(
 
     # Extract local pack
     local_results = []
-    try:
-        tasks = maps_raw.get("tasks", []) if isinstance(maps_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict) or item.get("type") == "maps_search_ad":
-                        continue
-                    rating = item.get("rating", {}) or {}
-                    local_results.append({
-                        "rank": item.get("rank_group", 0),
-                        "name": item.get("title", ""),
-                        "website": item.get("url", ""),
-                        "phone": item.get("phone", ""),
-                        "rating": rating.get("value", "") if isinstance(rating, dict) else str(rating),
-                        "reviews": rating.get("votes_count", "") if isinstance(rating, dict) else "",
-                        "is_claimed": item.get("is_claimed", False),
-                        "address": (item.get("address_info", {}) or {}).get("address", ""),
-                    })
-    except Exception as e:
-        print(f"   ⚠️  Maps extraction error: {e}")
+    for item in iter_items(maps_raw, exclude={"maps_search_ad"}):
+        rating = item.get("rating", {}) or {}
+        local_results.append({
+            "rank": item.get("rank_group", 0),
+            "name": item.get("title", ""),
+            "website": item.get("url", ""),
+            "phone": item.get("phone", ""),
+            "rating": rating.get("value", "") if isinstance(rating, dict) else str(rating),
+            "reviews": rating.get("votes_count", "") if isinstance(rating, dict) else "",
+            "is_claimed": item.get("is_claimed", False),
+            "address": (item.get("address_info", {}) or {}).get("address", ""),
+        })
 
     # Find gaps
     no_website = [b for b in local_results if not b.get("website")]
@@ -1020,64 +988,191 @@ def local_pack_intel(
 # ALWAYS-ON UTILITIES
 # ============================================================================
 
+@_metered("rank_check")
 def rank_check(
-    domain: str,
+    domain: Union[str, List[str]],
     keywords: List[str],
-    location_name: str = None
+    location_name: str = None,
+    queue: bool = False,
+    due_only: bool = True
 ) -> Dict[str, Any]:
     """
-    Check current rankings for a domain + keyword list.
+    Check current rankings for a domain (or several) + keyword list.
+
+    Pass your site plus competitors as a list to rank them all from the same
+    SERPs - one SERP per keyword no matter how many domains are tracked.
+    Domains match on label boundaries: "site.com" covers blog.site.com but
+    not mysite.com; "site.com/pets" only covers that section.
+
+    Every check is recorded in the rank history (results/rank_history.sqlite3),
+    which rank_movement() and rank_history() read from.
 
     Args:
-        domain: Your domain to check
+        domain: Your domain, or a list of domains (yours first, then competitors)
         keywords: Keywords to check rankings for
         location_name: Target location
+        queue: Use the standard queue instead of live SERPs - much cheaper for
+            big keyword lists, results arrive within minutes. An interrupted
+            run resumes when called again with the same arguments.
+        due_only: Only pull SERPs for keywords due under their schedule (see
+            set_rank_schedule; unscheduled keywords are due daily). The rest are
+            reported from their last stored check. Pass False to re-check every
+            keyword now.
 
     Returns:
-        Dict with ranking positions per keyword
+        Dict with ranking position, ranking URL and SERP features per keyword
+        for the first domain, and the same per domain under "by_domain"
 
-    Cost: ~$0.002/keyword
+    Cost: ~$0.002/keyword (live), ~$0.0006/keyword (queue) - independent of the number of domains
+
+    Example:
+        >>> rank_check(["yourblog.com", "rival1.com", "rival2.com"], keywords)
     """
-    location = location_name or "United States"
-    print(f"\n📍 Rank Check: {domain} for {len(keywords)} keywords")
+    from core.cache import cache_bypass
+    from core.domains import DomainIndex
+    from core.rank_history import due_keywords, latest_rankings, record_rankings
+    from core.usage import preflight
 
-    rankings = []
-    for kw in keywords:
-        try:
+    domains = list(dict.fromkeys([domain] if isinstance(domain, str) else domain))
+    index = DomainIndex(domains)
+    location = location_name or "United States"
+    label = domains[0] if len(domains) == 1 else f"{domains[0]} (+{len(domains) - 1} competitors)"
+    print(f"\n📍 Rank Check: {label} for {len(keywords)} keywords")
+
+    # A keyword is pulled if it's due for any tracked domain
+    due = set()
+    for d in domains:
+        due.update(due_keywords(d, keywords, location) if due_only else keywords)
+    to_check = [kw for kw in keywords if kw in due]
+    if due_only:
+        print(f"   {len(to_check)} due, {len(keywords) - len(to_check)} checked recently (from history)")
+    preflight(len(to_check) * (0.0006 if queue else 0.002), f"{len(to_check)} SERPs")
+
+    def check(kw: str) -> Dict:
+        # Rankings must be fresh - don't answer from the response cache
+        with cache_bypass():
             serp_raw = get_google_serp(kw, location_name=location, depth=100, save=False)
-            position = _find_domain_position(serp_raw, domain)
-            rankings.append({
-                "keyword": kw,
-                "position": position,
-                "ranking": "Not found in top 100" if position == -1 else f"#{position}"
-            })
-            print(f"   '{kw}' -> {rankings[-1]['ranking']}")
-        except Exception as e:
-            rankings.append({"keyword": kw, "position": -1, "error": str(e)})
-
-    result = {"domain": domain, "keywords": keywords, "rankings": rankings}
-    save_result(result, category="plays", operation="rank_check", keyword=domain)
+        return _rank_snapshot(serp_raw, index)
+
+    def report(i, kw, snapshot, error):
+        if error is not None:
+            return
+        positions = [snapshot["positions"][d]["position"] for d in domains]
+        if len(domains) == 1:
+            print(f"   '{kw}' -> {_ranking_label(positions[0])}")
+        else:
+            print(f"   '{kw}' -> " + ", ".join(
+                f"{d} {'-' if p == -1 else f'#{p}'}" for d, p in zip(domains, positions)))
+
+    if queue:
+        from core.task_queue import run_queued
+        requests = [{"keyword": kw, "location_name": location, "depth": 100, "device": "desktop"}
+                    for kw in to_check]
+        outcomes = run_queued(
+            "google_organic", requests,
+            func=lambda i, serp_raw: _rank_snapshot(serp_raw, index),
+            on_result=lambda i, request, snapshot, error: report(i, to_check[i], snapshot, error)
+        )
+    else:
+        outcomes = run_concurrent(check, to_check, on_result=report)
+
+    by_domain = {}
+    for d in domains:
+        checked = {}
+        for kw, (snapshot, error) in zip(to_check, outcomes):
+            if error is None:
+                checked[kw] = {"keyword": kw, **snapshot["positions"][d], "features": snapshot["features"]}
+            else:
+                checked[kw] = {"keyword": kw, "position": -1, "error": str(error)}
+        record_rankings(d, location, [r for r in checked.values() if "error" not in r])
+
+        skipped = [kw for kw in keywords if kw not in checked]
+        stored = latest_rankings(d, skipped, location) if skipped else {}
+        rankings = []
+        for kw in keywords:
+            entry = checked.get(kw)
+            if entry is None:
+                previous = stored.get(kw)
+                if previous is None:
+                    continue
+                entry = dict(previous, keyword=kw, position=previous["position"] or -1)
+            if "error" not in entry:
+                entry["ranking"] = _ranking_label(entry["position"])
+            rankings.append(entry)
+        by_domain[d] = rankings
+
+    result = {"domain": domains[0], "keywords": keywords, "rankings": by_domain[domains[0]]}
+    if len(domains) > 1:
+        result["domains"] = domains
+        result["by_domain"] = by_domain
+    save_result(result, category="plays", operation="rank_check", keyword=domains[0])
     return result
 
 
-def _find_domain_position(serp_raw: Dict, domain: str) -> int:
-    """Find domain position in SERP results. Returns -1 if not found."""
-    try:
-        tasks = serp_raw.get("tasks", []) if isinstance(serp_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    item_domain = item.get("domain", "") or ""
-                    item_url = item.get("url", "") or ""
-                    if domain in item_domain or domain in item_url:
-                        return item.get("rank_group", item.get("position", -1))
-    except Exception:
-        pass
-    return -1
+def _ranking_label(position: int) -> str:
+    return "Not found in top 100" if position == -1 else f"#{position}"
+
+
+def _rank_snapshot(serp_raw: Dict, index) -> Dict[str, Any]:
+    """
+    Every tracked domain's position and ranking URL in one SERP (-1 / None if
+    not found), plus the SERP's feature types. `index` is a core.domains.DomainIndex.
+    """
+    from core.items import iter_items
+
+    positions = {d: {"position": -1, "url": None} for d in index.domains}
+    features = set()
+    for item in iter_items(serp_raw):
+        item_type = item.get("type", "")
+        if item_type and item_type != "organic":
+            features.add(item_type)
+        tracked = index.match(url=item.get("url") or "", domain=item.get("domain") or "")
+        if tracked is not None and positions[tracked]["position"] == -1:
+            positions[tracked] = {
+                "position": item.get("rank_group", item.get("position", -1)),
+                "url": item.get("url") or None,
+            }
+    return {"positions": positions, "features": sorted(features)}
+
+
+def rank_movement(
+    domain: str,
+    days: int = 7,
+    location_name: str = None,
+    limit: int = 20
+) -> Dict[str, Any]:
+    """
+    Winners and losers over the last N days, straight from the rank history.
 
+    Args:
+        domain: Tracked domain
+        days: Compare the latest check with the one N days ago
+        location_name: Target location
+        limit: Max keywords per list
+
+    Returns:
+        Dict with winners, losers, new, lost (see core.rank_history.movement_report)
 
+    Cost: free (no API calls)
+    """
+    from core.rank_history import movement_report
+
+    location = location_name or "United States"
+    report = movement_report(domain, days=days, location=location, limit=limit)
+    print(f"\n📈 Rank movement for {domain}, last {days} days ({report['tracked']} keywords tracked)")
+    for title, key in (("Winners", "winners"), ("Losers", "losers")):
+        if report[key]:
+            print(f"   {title}:")
+            for e in report[key]:
+                print(f"     {e['keyword']}: #{e['previous']} -> #{e['position']} ({e['change']:+d})")
+    if report["new"]:
+        print(f"   New in top 100: {', '.join(e['keyword'] for e in report['new'])}")
+    if report["lost"]:
+        print(f"   Dropped out: {', '.join(e['keyword'] for e in report['lost'])}")
+    return report
+
+
+@_metered("youtube_gap")
 def youtube_gap_finder(
     topic: str,
     location_name: str = None
@@ -1094,6 +1189,7 @@ def youtube_gap_finder(
     """
     from api.serp import get_youtube_serp
     from api.labs import get_keyword_suggestions
+    from core.items import KEYWORD, iter_items, iter_results
 
     location = location_name or "United States"
     print(f"\n🎬 YouTube Gap Finder: '{topic}'")
@@ -1101,40 +1197,29 @@ def youtube_gap_finder(
     print("   Getting keyword suggestions...")
     sugg_raw = get_keyword_suggestions(keyword=topic, location_name=location, limit=30)
 
-    keywords = [topic]
-    try:
-        tasks = sugg_raw.get("tasks", []) if isinstance(sugg_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if isinstance(item, dict):
-                        kw = item.get("keyword", "")
-                        if kw:
-                            keywords.append(kw)
-    except Exception:
-        pass
-
-    keywords = keywords[:10]
+    keywords = [topic] + list(islice((kw for kw in map(KEYWORD, iter_items(sugg_raw)) if kw), 9))
+
+    def count_videos(kw: str) -> int:
+        yt_raw = get_youtube_serp(kw, location_name=location, depth=10, save=False)
+        video_count = 0
+        for result in iter_results(yt_raw):
+            video_count = len(result.get("items") or [])
+        return video_count
+
+    def report(i, kw, video_count, error):
+        if error is None:
+            print(f"   '{kw}' -> {video_count} videos in top 10")
+        else:
+            print(f"   ⚠️  '{kw}' failed: {error}")
+
     gaps = []
-    for kw in keywords:
-        try:
-            yt_raw = get_youtube_serp(kw, location_name=location, depth=10, save=False)
-            video_count = 0
-            try:
-                tasks = yt_raw.get("tasks", []) if isinstance(yt_raw, dict) else []
-                for task in tasks:
-                    for result in task.get("result", []) or []:
-                        video_count = len(result.get("items", []))
-            except Exception:
-                pass
+    for kw, (video_count, error) in zip(keywords, run_concurrent(count_videos, keywords, on_result=report)):
+        if error is None:
             gaps.append({
                 "keyword": kw,
                 "video_count_top10": video_count,
                 "gap_score": max(0, 10 - video_count) * 10
             })
-            print(f"   '{kw}' -> {video_count} videos in top 10")
-        except Exception as e:
-            print(f"   ⚠️  '{kw}' failed: {e}")
 
     gaps.sort(key=lambda x: x["gap_score"], reverse=True)
     result = {"topic": topic, "youtube_gaps": gaps}
@@ -1142,6 +1227,7 @@ def youtube_gap_finder(
     return result
 
 
+@_metered("trend_watch")
 def trend_watch(
     topics: List[str],
     location_name: str = None
@@ -1150,48 +1236,47 @@ def trend_watch(
     Get trending data for content ideas.
 
     Args:
-        topics: List of topics to track (max 5 per Trends task)
+        topics: List of topics to track (any number, all on one 0-100 scale)
         location_name: Target location
 
     Returns:
         Dict with trend data per topic
 
-    Cost: ~$0.001/5 keywords
+    Cost: ~$0.001 per Trends batch (5 topics, then 4 + a shared anchor)
     """
     from api.trends import get_trends_explore
+    from core.items import iter_items
 
     location = location_name or "United States"
     print(f"\n📈 Trend Watch: {topics}")
 
     results = {}
-    # Process in batches of 5 (Trends API limit)
-    for i in range(0, len(topics), 5):
-        batch = topics[i:i+5]
-        try:
-            trends_raw = get_trends_explore(keywords=batch, location_name=location)
-            try:
-                tasks = trends_raw.get("tasks", []) if isinstance(trends_raw, dict) else []
-                for task in tasks:
-                    for result in task.get("result", []) or []:
-                        kw = result.get("keyword", "")
-                        data = result.get("data", []) or []
-                        if kw and data:
-                            peak = max(data, key=lambda x: (x.get("values", [0]) or [0])[0])
-                            results[kw] = {
-                                "peak_month": peak.get("date_to", "")[:7],
-                                "current_value": (data[-1].get("values", [0]) or [0])[0] if data else 0,
-                                "peak_value": (peak.get("values", [0]) or [0])[0],
-                            }
-            except Exception:
-                pass
-        except Exception as e:
-            print(f"   ⚠️  Trends batch failed: {e}")
+    # One call for any number of topics: batches of 5 share an anchor so values are comparable
+    try:
+        trends_raw = get_trends_explore(keywords=topics, location_name=location)
+        for item in iter_items(trends_raw, types={"google_trends_graph"}):
+            data = item.get("data", []) or []
+            for i, kw in enumerate(item.get("keywords", []) or []):
+                series = [(row, (row.get("values") or [])[i] if i < len(row.get("values") or []) else None)
+                          for row in data]
+                series = [(row, v) for row, v in series if v is not None]
+                if not series:
+                    continue
+                peak_row, peak_value = max(series, key=lambda x: x[1])
+                results[kw] = {
+                    "peak_month": (peak_row.get("date_to") or "")[:7],
+                    "current_value": series[-1][1],
+                    "peak_value": peak_value,
+                }
+    except Exception as e:
+        print(f"   ⚠️  Trends failed: {e}")
 
     result = {"topics": topics, "trends": results}
     save_result(result, category="plays", operation="trend_watch", keyword=topics[0] if topics else "batch")
     return result
 
 
+@_metered("onpage_audit")
 def onpage_audit(url: str) -> Dict[str, Any]:
     """
     Basic technical SEO audit via OnPage API.
@@ -1251,6 +1336,7 @@ PLAYS (outcome-oriented):
   play6: market_gap_finder("home decor")
   play7: local_business_scraper("church", state="Minnesota")
   play8: local_pack_intel("dispensary", "Minneapolis, MN")
+         local_grid_scan("dispensary", "Green Leaf Dispensary Minneapolis MN", grid_size=5)
   play9: expired_domain_finder("home organization blog")
   play10: bvs_score_domains("leads.csv")
 
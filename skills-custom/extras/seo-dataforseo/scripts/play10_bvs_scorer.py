@@ -9,24 +9,36 @@ Usage:
     result = bvs_score_domains("churches.csv")
     result = bvs_score_domains("leads.csv", target_site="fifti-fifti.net")
 
-Input CSV must have a column named: domain, website, or url
+Input CSV must have a column named: domain, website, or url. It is streamed,
+so lists of any size run in flat memory.
 """
 import sys
+import os
 import csv
+import heapq
+import sqlite3
 import asyncio
 import aiohttp
 import ssl
 import re
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from api.backlinks import get_backlinks_summary
+from api.backlinks import BULK_TARGETS_LIMIT, get_backlink_metrics
+from core.cache import cache_key
+from core.domains import normalize_domain
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
+try:
+    import aiodns  # lets aiohttp resolve DNS asynchronously instead of in a thread pool
+except ImportError:
+    aiodns = None
+
 # BVS Scoring weights
 PILLAR_WEIGHTS = {
     "web_presence": 0.25,    # Has website, SSL, mobile-friendly
@@ -44,99 +56,361 @@ TIER_MAP = [
 ]
 
 
+# HTTP crawl tuning
+MAX_BODY_BYTES = 256 * 1024      # signals live in <head>, nav and footer - no need for the whole page
+DOMAIN_TIMEOUT = 10.0            # seconds per domain, https and http attempts together
+HTTP_FALLBACK_DELAY = 1.5        # start the http attempt if https hasn't answered by then
+DNS_CACHE_SECONDS = 3600
+MAX_CONCURRENT_CHECKS = 500
+MIN_CONCURRENT_CHECKS = 5
+# Adaptive concurrency: every window of finished checks, halve if more than
+# this share timed out (we're saturating the link/resolver), else grow
+CONCURRENCY_WINDOW = 50
+MAX_TIMEOUT_RATE = 0.2
+
+# Streaming pipeline
+QUEUE_SIZE = 2000                # domains buffered between stages
+BACKLINK_FLUSH_SECONDS = 5.0     # send a partial bulk batch this long after its first domain
+BACKLINK_BATCHES_IN_FLIGHT = 2
+SORT_IN_MEMORY_LIMIT = 100_000   # up to this many domains the output is sorted and returned in full
+
+SCORED_FIELDS = ["domain", "tier", "bvs", "dr", "rd", "spam_score",
+                 "pillar_web", "pillar_content", "pillar_social", "pillar_authority",
+                 "has_ssl", "has_blog", "has_contact", "has_staff", "has_newsletter",
+                 "facebook", "instagram", "website", "http_status", "error"]
+_NUMBER_FIELDS = ("bvs", "dr", "rd", "spam_score", "pillar_web", "pillar_content",
+                  "pillar_social", "pillar_authority", "http_status")
+_FLAG_FIELDS = ("has_ssl", "has_blog", "has_contact", "has_staff", "has_newsletter",
+                "facebook", "instagram", "website")
+
+# Page text (lowercased) that turns on each signal
+SIGNAL_KEYWORDS = {
+    "has_blog": ("/blog", "/news", "/articles", "/posts", "blog."),
+    "has_contact_form": ("contact", "contact-us", "get in touch", "reach us"),
+    "has_staff_page": ("staff", "team", "pastor", "leadership", "about-us", "meet"),
+    "has_newsletter": ("newsletter", "subscribe", "mailing list", "email list"),
+    "has_facebook": ("facebook.com",),
+    "has_instagram": ("instagram.com",),
+    "has_twitter": ("twitter.com", "x.com"),
+    "has_youtube": ("youtube.com",),
+    "mobile_friendly": ("viewport",),  # basic check for the viewport meta tag
+}
+_SIGNAL_OF = {kw.encode(): signal for signal, kws in SIGNAL_KEYWORDS.items() for kw in kws}
+# One pass over the body finds every keyword: a zero-width lookahead tries all
+# alternatives at each position, so overlapping hits ("/newsletter" is both
+# "/news" and "newsletter") are all seen. Longest first, so of two keywords
+# starting at the same spot the longer one is reported.
+_SIGNAL_RE = re.compile(
+    b"(?=(" + b"|".join(re.escape(kw) for kw in sorted(_SIGNAL_OF, key=len, reverse=True)) + b"))"
+)
+
+
+def _match_signals(body: bytes) -> set:
+    """Signals whose keywords appear anywhere in the (already lowercased) body."""
+    found = set()
+    for match in _SIGNAL_RE.finditer(body):
+        found.add(_SIGNAL_OF[match.group(1)])
+        if len(found) == len(SIGNAL_KEYWORDS):
+            break
+    return found
+
+
+def _empty_signals(domain: str) -> Dict:
+    signals = {"domain": domain, "has_website": False, "has_ssl": False}
+    signals.update((signal, False) for signal in SIGNAL_KEYWORDS)
+    signals.update(http_status=0, error=None)
+    return signals
+
+
+async def _fetch_signals(session: aiohttp.ClientSession, url: str) -> Dict:
+    """GET one URL and read at most MAX_BODY_BYTES of it into signal flags."""
+    async with session.get(url, allow_redirects=True, max_redirects=5) as resp:
+        result = {
+            "http_status": resp.status,
+            "has_website": resp.status < 400,
+            "has_ssl": str(resp.url).startswith("https"),
+        }
+        if resp.status < 400:
+            body = bytearray()
+            try:
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if len(body) >= MAX_BODY_BYTES:
+                        break
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass  # score whatever arrived
+            for signal in _match_signals(bytes(body[:MAX_BODY_BYTES]).lower()):
+                result[signal] = True
+        return result
+
+
 async def _check_domain_http(session: aiohttp.ClientSession, domain: str) -> Dict:
-    """Check a domain for web presence signals via HTTP."""
-    signals = {
-        "domain": domain,
-        "has_website": False,
-        "has_ssl": False,
-        "has_blog": False,
-        "has_contact_form": False,
-        "has_staff_page": False,
-        "has_newsletter": False,
-        "has_facebook": False,
-        "has_instagram": False,
-        "has_twitter": False,
-        "has_youtube": False,
-        "mobile_friendly": False,
-        "http_status": 0,
-        "error": None
-    }
+    """
+    Check a domain for web presence signals via HTTP.
 
-    # Normalize domain
-    domain = domain.strip().lstrip("https://").lstrip("http://").lstrip("www.").rstrip("/")
-    if not domain:
+    https goes first; http starts alongside it if https fails or is still
+    silent after HTTP_FALLBACK_DELAY, and the first good (< 400) answer wins.
+    Both attempts share one DOMAIN_TIMEOUT budget.
+    """
+    signals = _empty_signals(domain)
+    host = normalize_domain(domain)
+    if not host:
         return signals
 
-    # Try HTTPS first, then HTTP
-    for protocol in ["https", "http"]:
-        url = f"{protocol}://{domain}"
-        try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with session.get(url, timeout=timeout, allow_redirects=True,
-                                   ssl=False, max_redirects=5) as resp:
-                signals["http_status"] = resp.status
-                signals["has_website"] = resp.status < 400
-                signals["has_ssl"] = str(resp.url).startswith("https")
-
-                if resp.status < 400:
-                    try:
-                        html = await resp.text(encoding="utf-8", errors="replace")
-                        html_lower = html.lower()
-
-                        # Content signals
-                        signals["has_blog"] = any(x in html_lower for x in [
-                            "/blog", "/news", "/articles", "/posts", "blog."])
-                        signals["has_contact_form"] = any(x in html_lower for x in [
-                            "contact", "contact-us", "get in touch", "reach us"])
-                        signals["has_staff_page"] = any(x in html_lower for x in [
-                            "staff", "team", "pastor", "leadership", "about-us", "meet"])
-                        signals["has_newsletter"] = any(x in html_lower for x in [
-                            "newsletter", "subscribe", "mailing list", "email list"])
-
-                        # Social signals
-                        signals["has_facebook"] = "facebook.com" in html_lower
-                        signals["has_instagram"] = "instagram.com" in html_lower
-                        signals["has_twitter"] = "twitter.com" in html_lower or "x.com" in html_lower
-                        signals["has_youtube"] = "youtube.com" in html_lower
-
-                        # Mobile friendly (basic check for viewport meta)
-                        signals["mobile_friendly"] = "viewport" in html_lower
-
-                    except Exception:
-                        pass
-                    break  # Got a good response, don't try http
-
-        except asyncio.TimeoutError:
-            signals["error"] = "timeout"
-        except Exception as e:
-            signals["error"] = str(e)[:100]
-
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    deadline = started + DOMAIN_TIMEOUT
+    https = asyncio.ensure_future(_fetch_signals(session, f"https://{host}"))
+    http = None
+    pending = {https}
+    outcomes: Dict[Any, Any] = {}
+    try:
+        while pending:
+            now = loop.time()
+            wake = deadline if http else min(deadline, started + HTTP_FALLBACK_DELAY)
+            done, pending = await asyncio.wait(pending, timeout=max(0.0, wake - now),
+                                               return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                outcomes[task] = task.exception() or task.result()
+            good = [t for t in (https, http) if isinstance(outcomes.get(t), dict) and outcomes[t]["has_website"]]
+            if good:
+                signals.update(outcomes[good[0]])
+                return signals
+            if http is None and (done or loop.time() >= started + HTTP_FALLBACK_DELAY):
+                http = asyncio.ensure_future(_fetch_signals(session, f"http://{host}"))
+                pending.add(http)
+            if loop.time() >= deadline:
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+
+    # No good answer: report a response if there was one (http's, like a plain fallback), else the error
+    for task in (http, https):
+        if isinstance(outcomes.get(task), dict):
+            signals.update(outcomes[task])
+            return signals
+    errors = [outcomes[t] for t in (https, http) if isinstance(outcomes.get(t), BaseException)]
+    timed_out = pending or not errors or isinstance(errors[-1], asyncio.TimeoutError)
+    signals["error"] = "timeout" if timed_out else str(errors[-1])[:100]
     return signals
 
 
-async def _check_all_domains(domains: List[str], concurrent: int = 5) -> List[Dict]:
-    """Async check all domains concurrently."""
-    connector = aiohttp.TCPConnector(limit=concurrent, ssl=False)
+class _AdaptiveLimit:
+    """Concurrency cap for the crawl that follows the timeout rate (AIMD-style)."""
+
+    def __init__(self, start: int):
+        self.limit = max(MIN_CONCURRENT_CHECKS, min(start, MAX_CONCURRENT_CHECKS))
+        self.active = 0
+        self._finished = 0
+        self._timeouts = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self, timed_out: bool):
+        async with self._cond:
+            self.active -= 1
+            self._finished += 1
+            self._timeouts += timed_out
+            if self._finished >= CONCURRENCY_WINDOW:
+                if self._timeouts > MAX_TIMEOUT_RATE * self._finished:
+                    self.limit = max(MIN_CONCURRENT_CHECKS, self.limit // 2)
+                else:
+                    self.limit = min(MAX_CONCURRENT_CHECKS, self.limit + max(1, self.limit // 4))
+                self._finished = self._timeouts = 0
+            self._cond.notify_all()
+
+
+class _SeenDomains:
+    """Disk-backed set of the domains taken from the input, so deduping a huge list stays flat in memory."""
+
+    def __init__(self):
+        self._db = sqlite3.connect("")  # private temporary database, spills to disk as it grows
+        self._db.execute("CREATE TABLE seen (domain TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def add(self, domain: str) -> bool:
+        """Remember a domain; False if it was already seen."""
+        return self._db.execute("INSERT OR IGNORE INTO seen VALUES (?)", (domain,)).rowcount == 1
+
+    def close(self):
+        self._db.close()
+
+
+class _ScoredCsv:
+    """Append-only scored-domains CSV, flushed after every batch so a crash loses nothing written."""
+
+    def __init__(self, path: Path):
+        fresh = not path.exists() or path.stat().st_size == 0
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=SCORED_FIELDS, extrasaction="ignore")
+        if fresh:
+            self._writer.writeheader()
+        self.written = 0
+
+    def write(self, rows: List[Dict]):
+        for row in rows:
+            # One row per line, so a torn tail is always just the last line
+            row["error"] = " ".join(str(row.get("error") or "").split())
+        self._writer.writerows(rows)
+        self._file.flush()
+        self.written += len(rows)
+
+    def close(self):
+        self._file.close()
+
+
+def _http_session() -> aiohttp.ClientSession:
+    """
+    One session for the whole crawl.
+
+    DNS answers are cached for the run (through aiodns when it's installed),
+    and connections are not kept alive since every host is visited once.
+    """
+    resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+    connector = aiohttp.TCPConnector(
+        limit=0, ssl=False, force_close=True, resolver=resolver,
+        use_dns_cache=True, ttl_dns_cache=DNS_CACHE_SECONDS
+    )
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; BottiSEO/1.0; outreach-research)"
     }
+    timeout = aiohttp.ClientTimeout(total=DOMAIN_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout)
+
+
+async def _score_stream(
+    domains: Iterable[str],
+    out: _ScoredCsv,
+    concurrent: int = 50,
+    skip_http: bool = False,
+    skip_backlinks: bool = False
+) -> Dict[str, int]:
+    """
+    Score domains through overlapping stages, appending rows to `out` as they finish.
 
-    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
-        semaphore = asyncio.Semaphore(concurrent)
+    reader -> HTTP checks -> bulk backlink batches -> scoring/CSV, joined by
+    bounded queues: a slow stage makes the ones before it wait instead of
+    buffering, so memory stays flat for any input size. HTTP concurrency
+    starts at `concurrent` and adapts to the timeout rate between MIN_ and
+    MAX_CONCURRENT_CHECKS. Backlink batches go out when they reach
+    BULK_TARGETS_LIMIT domains or BACKLINK_FLUSH_SECONDS after their first.
 
-        async def check_with_sem(domain):
-            async with semaphore:
-                return await _check_domain_http(session, domain)
+    Domains whose backlink lookups all failed are not written, so a re-run
+    picks them up.
 
-        tasks = [check_with_sem(d) for d in domains]
-        results = []
-        for i, coro in enumerate(asyncio.as_completed(tasks)):
-            result = await coro
-            results.append(result)
-            if (i + 1) % 10 == 0:
-                print(f"      HTTP checked: {i+1}/{len(domains)}")
-        return results
+    Returns:
+        Dict with queued (domains read) and retry (domains left for a re-run)
+    """
+    loop = asyncio.get_running_loop()
+    to_http: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+    to_score: asyncio.Queue = asyncio.Queue(QUEUE_SIZE)
+    stats = {"queued": 0, "retry": 0, "concurrency": 0}
+
+    async def read():
+        for domain in domains:
+            stats["queued"] += 1
+            await to_http.put(domain)
+        await to_http.put(None)
+
+    async def crawl():
+        if skip_http:
+            while True:
+                domain = await to_http.get()
+                if domain is None:
+                    break
+                await to_score.put({"domain": domain})
+            await to_score.put(None)
+            return
+
+        limit = _AdaptiveLimit(concurrent)
+        async with _http_session() as session:
+
+            async def check(domain):
+                try:
+                    result = await _check_domain_http(session, domain)
+                except Exception as e:  # never lose a domain to an unexpected error
+                    result = _empty_signals(domain)
+                    result["error"] = str(e)[:100]
+                await limit.release(timed_out=result["error"] == "timeout")
+                stats["concurrency"] = limit.limit
+                await to_score.put(result)
+
+            tasks = set()
+            while True:
+                domain = await to_http.get()
+                if domain is None:
+                    break
+                await limit.acquire()
+                task = asyncio.ensure_future(check(domain))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.wait(tasks)
+        await to_score.put(None)
+
+    async def lookup(batch):
+        metrics: Dict[str, Dict] = {}
+        try:
+            if not skip_backlinks:
+                metrics = await asyncio.to_thread(get_backlink_metrics, [h["domain"] for h in batch])
+        finally:
+            slots.release()
+        rows = [_score_domain(h, metrics.get(h["domain"], {}))
+                for h in batch if skip_backlinks or metrics.get(h["domain"])]
+        stats["retry"] += len(batch) - len(rows)  # {} = every lookup failed, retry next run
+        before = out.written
+        out.write(rows)
+        if out.written // 1000 > before // 1000 or not before:
+            concurrency = f", HTTP concurrency {stats['concurrency']}" if stats["concurrency"] else ""
+            print(f"      Scored {out.written:,}/{stats['queued']:,} read{concurrency}")
+
+    slots = asyncio.Semaphore(BACKLINK_BATCHES_IN_FLIGHT)
+    lookups = set()
+
+    async def flush(batch):
+        for task in [t for t in lookups if t.done()]:
+            lookups.discard(task)
+            task.result()  # surface a failed batch now rather than at the end
+        await slots.acquire()
+        lookups.add(asyncio.ensure_future(lookup(batch)))
+
+    async def enrich():
+        batch: List[Dict] = []
+        flush_at = 0.0
+        getter = None
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(to_score.get())
+            # The pending get() is kept across waits - cancelling it could drop an item
+            timeout = max(0.0, flush_at - loop.time()) if batch else None
+            done, _ = await asyncio.wait({getter}, timeout=timeout)
+            if done:
+                item, getter = getter.result(), None
+                if item is None:
+                    break
+                if not batch:
+                    flush_at = loop.time() + BACKLINK_FLUSH_SECONDS
+                batch.append(item)
+                if len(batch) < BULK_TARGETS_LIMIT:
+                    continue
+            await flush(batch)
+            batch = []
+        if batch:
+            await flush(batch)
+        if lookups:
+            await asyncio.gather(*lookups)
+
+    stages = [asyncio.ensure_future(stage) for stage in (read(), crawl(), enrich())]
+    try:
+        await asyncio.gather(*stages)
+    finally:
+        for stage in stages:
+            stage.cancel()
+    return {"queued": stats["queued"], "retry": stats["retry"]}
 
 
 def _score_domain(http_signals: Dict, bl_metrics: Dict) -> Dict:
@@ -244,31 +518,44 @@ def _score_domain(http_signals: Dict, bl_metrics: Dict) -> Dict:
     }
 
 
+@metered("bvs_scorer")
 def bvs_score_domains(
     csv_input_path: str,
     target_site: Optional[str] = None,
-    concurrent: int = 5,
+    concurrent: int = 50,
     skip_http: bool = False,
     skip_backlinks: bool = False
 ) -> Dict[str, Any]:
     """
     Score a list of domains for outreach/acquisition value.
 
+    The input CSV is read lazily and each domain is streamed through HTTP
+    checks, bulk backlink lookups and scoring, with scored rows appended to
+    the output CSV as they finish - memory stays flat for million-row lists
+    and the first rows land within seconds.
+
     Args:
         csv_input_path: Path to input CSV with domain/website/url column
         target_site: Optional - your site (for context in report, future relevance scoring)
-        concurrent: Concurrent HTTP checks (default 5)
+        concurrent: Starting number of concurrent HTTP checks (default 50); adapts
+            to the timeout rate, up to MAX_CONCURRENT_CHECKS
         skip_http: Skip HTTP scraping (faster, less signal)
         skip_backlinks: Skip backlink check (faster, cheaper)
 
     Returns:
         Dict with:
-            - scored: list of all domains with BVS scores + tier
-            - by_tier: dict of gold/silver/bronze/skip lists
-            - csv_path: path to enriched output CSV
+            - total: number of domains scored
+            - scored: list of all domains with BVS scores + tier, best first
+              (only up to SORT_IN_MEMORY_LIMIT domains)
+            - by_tier: dict of gold/silver/bronze/skip lists (same limit)
+            - tier_counts: domains per tier
+            - top: the 20 best domains
+            - retry: domains without backlink data, scored on the next run
+            - csv_path: path to enriched output CSV (sorted by BVS up to
+              SORT_IN_MEMORY_LIMIT domains, in completion order beyond)
             - summary: markdown summary
 
-    Cost estimate: $0.02/domain for backlinks (HTTP is free)
+    Cost estimate: a few bulk backlink requests per 1000 domains (HTTP is free)
 
     Example:
         >>> result = bvs_score_domains("leads/churches.csv")
@@ -278,82 +565,86 @@ def bvs_score_domains(
     results_dir = Path(__file__).parent / "results" / "plays"
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load input CSV
     input_path = Path(csv_input_path)
     if not input_path.exists():
         raise FileNotFoundError(f"Input CSV not found: {csv_input_path}")
 
-    domains = _load_domains_from_csv(input_path)
+    # The partial output CSV doubles as the resume journal: a re-run on the same
+    # input skips every domain already in it
+    stat = input_path.stat()
+    run_id = cache_key("bvs_scorer", {
+        "input": str(input_path.resolve()), "size": stat.st_size, "mtime": stat.st_mtime,
+        "skip_http": skip_http, "skip_backlinks": skip_backlinks
+    })[:16]
+    partial_path = results_dir / f"bvs__{input_path.stem}__{run_id}.partial.csv"
+
     print(f"\n📊 BVS Domain Scorer")
-    print(f"   Input: {len(domains)} domains from {input_path.name}")
+    print(f"   Input: {input_path.name}")
     if target_site:
         print(f"   Target site: {target_site}")
-    print(f"   Est. cost: ${len(domains) * 0.02:.2f} (backlinks)")
-
-    # HTTP checks
-    http_results: Dict[str, Dict] = {}
-    if not skip_http:
-        print(f"\n[1/3] HTTP scanning {len(domains)} domains (concurrent={concurrent})...")
-        raw_http = asyncio.run(_check_all_domains(domains, concurrent=concurrent))
-        for item in raw_http:
-            http_results[item["domain"]] = item
-        print(f"      Done. {sum(1 for v in http_results.values() if v.get('has_website'))} have active websites")
-    else:
-        print("\n[1/3] Skipping HTTP scan (skip_http=True)")
-        for d in domains:
-            http_results[d] = {"domain": d}
-
-    # Backlink checks
-    bl_results: Dict[str, Dict] = {}
-    if not skip_backlinks:
-        print(f"\n[2/3] Backlink checks for {len(domains)} domains...")
-        for i, domain in enumerate(domains):
-            print(f"   [{i+1}/{len(domains)}] {domain}...")
-            try:
-                bl_raw = get_backlinks_summary(domain, save=False)
-                bl_results[domain] = _extract_bl_metrics(bl_raw)
-            except Exception as e:
-                print(f"      ⚠️  Failed: {e}")
-                bl_results[domain] = {}
+
+    seen = _SeenDomains()
+    resumed = _resume_scored_csv(partial_path, seen)
+    if resumed:
+        print(f"   Resuming: {resumed:,} domains already scored in {partial_path.name}")
+
+    http_stage = "Skipping HTTP scan" if skip_http else f"HTTP checks (concurrent={concurrent})"
+    bl_stage = "skipping backlinks" if skip_backlinks else f"bulk backlinks ({BULK_TARGETS_LIMIT}/batch)"
+    print(f"\n[1/2] Streaming: {http_stage} → {bl_stage} → scoring...")
+    out = _ScoredCsv(partial_path)
+    try:
+        pending = (d for d in _iter_domains_from_csv(input_path) if seen.add(d))
+        stats = asyncio.run(_score_stream(pending, out, concurrent, skip_http, skip_backlinks))
+    finally:
+        out.close()
+        seen.close()
+    total = resumed + out.written
+    print(f"      Done. {out.written:,} domains scored this run")
+    if stats["retry"]:
+        print(f"      ⚠️  {stats['retry']:,} domains got no backlink data - run again to retry them")
+
+    # Rank: small runs are sorted in memory, big ones stream for tier counts and the top 20
+    print(f"\n[2/2] Ranking {total:,} scored domains...")
+    csv_path = results_dir / f"{timestamp}__bvs__{input_path.stem}.csv"
+    ranked: Dict[str, Any] = {}
+    if total <= SORT_IN_MEMORY_LIMIT:
+        scored = sorted(_read_scored_csv(partial_path), key=lambda x: x.get("bvs", 0), reverse=True)
+        by_tier = {tier: [] for _, tier in TIER_MAP}
+        for s in scored:
+            by_tier[s.get("tier", "skip")].append(s)
+        tier_counts = {tier: len(items) for tier, items in by_tier.items()}
+        top = scored[:20]
+        _save_scored_csv(scored, csv_path)
+        ranked = {"scored": scored, "by_tier": by_tier}
+        if not stats["retry"]:
+            partial_path.unlink()
     else:
-        print("\n[2/3] Skipping backlink check (skip_backlinks=True)")
-        for d in domains:
-            bl_results[d] = {}
-
-    # Score all domains
-    print("\n[3/3] Scoring all domains...")
-    scored = []
-    for domain in domains:
-        http = http_results.get(domain, {"domain": domain})
-        bl = bl_results.get(domain, {})
-        score = _score_domain(http, bl)
-        scored.append(score)
-
-    # Sort by BVS
-    scored.sort(key=lambda x: x.get("bvs", 0), reverse=True)
-
-    # Group by tier
-    by_tier = {"gold": [], "silver": [], "bronze": [], "skip": []}
-    for s in scored:
-        tier = s.get("tier", "skip")
-        by_tier[tier].append(s)
+        tier_counts = {tier: 0 for _, tier in TIER_MAP}
 
-    print(f"\n   Tier breakdown:")
-    for tier, items in by_tier.items():
-        print(f"   {tier.upper()}: {len(items)}")
+        def counted():
+            for s in _read_scored_csv(partial_path):
+                tier_counts[s["tier"]] = tier_counts.get(s["tier"], 0) + 1
+                yield s
+
+        top = heapq.nlargest(20, counted(), key=lambda x: x.get("bvs", 0))
+        if stats["retry"]:
+            csv_path = partial_path  # still the resume journal
+        else:
+            partial_path.replace(csv_path)
 
-    # Save output CSV
-    output_name = f"{timestamp}__bvs__{input_path.stem}.csv"
-    csv_path = results_dir / output_name
-    _save_scored_csv(scored, csv_path)
+    print(f"\n   Tier breakdown:")
+    for tier, count in tier_counts.items():
+        print(f"   {tier.upper()}: {count:,}")
 
     # Build summary
-    summary = _build_bvs_summary(scored, by_tier, target_site)
+    summary = _build_bvs_summary(top, tier_counts, target_site)
 
     full_result = {
-        "total": len(scored),
-        "scored": scored,
-        "by_tier": by_tier,
+        "total": total,
+        **ranked,
+        "tier_counts": tier_counts,
+        "top": top,
+        "retry": stats["retry"],
         "csv_path": str(csv_path),
         "summary": summary
     }
@@ -365,11 +656,10 @@ def bvs_score_domains(
     return full_result
 
 
-def _load_domains_from_csv(path: Path) -> List[str]:
-    """Load domains from CSV, detecting column name automatically."""
-    domains = []
+def _iter_domains_from_csv(path: Path) -> Iterator[str]:
+    """Yield bare domains from a CSV row by row, detecting the column name automatically."""
     possible_cols = ["domain", "website", "url", "Domain", "Website", "URL"]
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
         reader = csv.DictReader(f)
         fieldnames = reader.fieldnames or []
         domain_col = None
@@ -384,51 +674,64 @@ def _load_domains_from_csv(path: Path) -> List[str]:
             raise ValueError(f"No domain/website/url column found in {path.name}")
 
         for row in reader:
-            val = row.get(domain_col, "").strip()
+            # Normalize to bare domain
+            val = normalize_domain(row.get(domain_col) or "")
             if val:
-                # Normalize to bare domain
-                val = re.sub(r"^https?://", "", val)
-                val = re.sub(r"^www\.", "", val)
-                val = val.rstrip("/").split("/")[0]
-                if val:
-                    domains.append(val)
-
-    return list(dict.fromkeys(domains))  # Deduplicate while preserving order
-
-
-def _extract_bl_metrics(raw: Dict) -> Dict:
-    """Extract backlink metrics from summary response."""
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                if isinstance(result, dict):
-                    return {
-                        "rank": result.get("rank", 0) or 0,
-                        "backlinks": result.get("backlinks", 0) or 0,
-                        "referring_domains": result.get("referring_domains", 0) or 0,
-                        "spam_score": result.get("spam_score", 0) or 0,
-                    }
-    except Exception:
-        pass
-    return {}
+                yield val
+
+
+def _resume_scored_csv(path: Path, seen: _SeenDomains) -> int:
+    """Mark the domains an interrupted run already wrote to `path` as seen; returns how many."""
+    if not path.exists():
+        return 0
+    # A crash mid-write can leave a torn last line - cut back to the last full one
+    with open(path, "rb+") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            step = min(64 * 1024, pos)
+            pos -= step
+            f.seek(pos)
+            newline = f.read(step).rfind(b"\n")
+            if newline >= 0:
+                f.truncate(pos + newline + 1)
+                break
+        else:
+            f.truncate(0)
+
+    count = 0
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            seen.add(row["domain"])
+            count += 1
+    return count
+
+
+def _read_scored_csv(path: Path) -> Iterator[Dict]:
+    """Stream scored rows back from CSV with their numbers and flags typed again."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for field in _NUMBER_FIELDS:
+                try:
+                    value = float(row.get(field) or 0)
+                except ValueError:
+                    value = 0.0
+                row[field] = value if field == "bvs" or not value.is_integer() else int(value)
+            for field in _FLAG_FIELDS:
+                row[field] = row.get(field) == "True"
+            yield row
 
 
 def _save_scored_csv(scored: List[Dict], path: Path):
     """Save scored domains to CSV."""
     if not scored:
         return
-    fieldnames = ["domain", "tier", "bvs", "dr", "rd", "spam_score",
-                  "pillar_web", "pillar_content", "pillar_social", "pillar_authority",
-                  "has_ssl", "has_blog", "has_contact", "has_staff", "has_newsletter",
-                  "facebook", "instagram", "website", "http_status", "error"]
     with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer = csv.DictWriter(f, fieldnames=SCORED_FIELDS, extrasaction="ignore")
         writer.writeheader()
         writer.writerows(scored)
 
 
-def _build_bvs_summary(scored: List[Dict], by_tier: Dict, target_site: Optional[str]) -> str:
+def _build_bvs_summary(top: List[Dict], tier_counts: Dict[str, int], target_site: Optional[str]) -> str:
     """Build markdown BVS summary."""
     lines = [
         f"# BVS Domain Scoring Report",
@@ -439,17 +742,17 @@ def _build_bvs_summary(scored: List[Dict], by_tier: Dict, target_site: Optional[
         f"",
         f"| Tier | Count | Action |",
         f"|------|-------|--------|",
-        f"| 🥇 Gold (75+) | {len(by_tier['gold'])} | Priority outreach |",
-        f"| 🥈 Silver (50-74) | {len(by_tier['silver'])} | Standard outreach |",
-        f"| 🥉 Bronze (30-49) | {len(by_tier['bronze'])} | Low priority |",
-        f"| ⛔ Skip (<30) | {len(by_tier['skip'])} | Skip |",
+        f"| 🥇 Gold (75+) | {tier_counts['gold']:,} | Priority outreach |",
+        f"| 🥈 Silver (50-74) | {tier_counts['silver']:,} | Standard outreach |",
+        f"| 🥉 Bronze (30-49) | {tier_counts['bronze']:,} | Low priority |",
+        f"| ⛔ Skip (<30) | {tier_counts['skip']:,} | Skip |",
         f"",
         f"## Top 20 by BVS Score",
         f"",
         f"| Domain | BVS | Tier | DR | RD | Blog | Contact | Newsletter |",
         f"|--------|-----|------|----|----|------|---------|-----------|",
     ]
-    for s in scored[:20]:
+    for s in top[:20]:
         tier_emoji = {"gold": "🥇", "silver": "🥈", "bronze": "🥉", "skip": "⛔"}.get(s.get("tier", "skip"), "")
         lines.append(
             f"| {s.get('domain', '')} | {s.get('bvs', 0)} | {tier_emoji} | "
@@ -10,6 +10,7 @@ Usage:
 """
 import sys
 import csv
+import heapq
 import json
 import math
 from pathlib import Path
@@ -21,7 +22,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 from api.labs import get_keyword_ideas, get_bulk_keyword_difficulty
 from api.serp import get_google_serp
 from api.trends import get_trends_explore
+from core.executor import run_concurrent
+from core.items import LABS_KEYWORD, iter_items, iter_results
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
 # Affiliate network signal domains - if these appear in top 10, it's a proven play
@@ -40,6 +44,7 @@ REVIEW_SIGNALS = [
 ]
 
 
+@metered("affiliate_kw")
 def affiliate_keyword_miner(
     topic: str,
     cpc_floor: float = 1.0,
@@ -90,20 +95,18 @@ def affiliate_keyword_miner(
         save=True
     )
 
-    # Extract keyword items from nested response
-    keywords = _extract_keywords_from_ideas(ideas_raw)
-    print(f"      Got {len(keywords)} keyword ideas")
-
-    # Step 2: Filter by CPC + volume (KD comes from overview data)
+    # Step 2: Filter by CPC + volume + KD, streaming the idea items straight through
     print(f"\n[2/4] Filtering by CPC >= ${cpc_floor}...")
+    total_ideas = 0
     filtered = []
-    for kw in keywords:
-        # Nested structure: keyword_info.cpc, keyword_info.search_volume, keyword_properties.keyword_difficulty
-        ki = kw.get("keyword_info", {}) or {}
-        kp = kw.get("keyword_properties", {}) or {}
-        cpc = float(ki.get("cpc", 0) or kw.get("cpc", 0) or 0)
-        volume = int(ki.get("search_volume", 0) or kw.get("search_volume", 0) or 0)
-        kd = int(kp.get("keyword_difficulty", kw.get("keyword_difficulty", 100)) or 0)
+    for item in iter_items(ideas_raw):
+        total_ideas += 1
+        kw = LABS_KEYWORD(item)
+        cpc, volume = kw["cpc"], kw["volume"]
+        kd = kw["kd"]
+        if kd is None and not _reports_kd(item):
+            kd = 100  # No difficulty data at all - treat as too hard
+        kd = kd or 0
         if kd == 0 and volume > 0:
             kd = 20  # Default moderate KD if missing
 
@@ -111,37 +114,42 @@ def affiliate_keyword_miner(
             # Affiliate viability score: volume * CPC / max(KD, 1)
             avs = (volume * cpc) / max(kd, 1)
             filtered.append({
-                "keyword": kw.get("keyword", ""),
+                "keyword": kw["keyword"],
                 "volume": volume,
                 "cpc": round(cpc, 2),
                 "kd": kd,
                 "avs": round(avs, 2),
-                "competition": ki.get("competition_level", kw.get("competition", "")),
+                "competition": kw["competition"],
                 "affiliate_signals": 0,
                 "serp_checked": False
             })
 
     filtered.sort(key=lambda x: x["avs"], reverse=True)
-    print(f"      {len(filtered)} keywords pass CPC + KD filters")
+    print(f"      {len(filtered)} of {total_ideas} keyword ideas pass CPC + KD filters")
 
     # Step 3: Check SERP for top candidates for affiliate signals
     if check_serp and filtered:
         top_candidates = filtered[:15]  # Check top 15 to save cost
         print(f"\n[3/4] Checking SERP for affiliate signals (top {len(top_candidates)})...")
 
-        for i, kw_data in enumerate(top_candidates):
-            kw = kw_data["keyword"]
-            print(f"      [{i+1}/{len(top_candidates)}] {kw}...")
-            try:
-                serp_raw = get_google_serp(kw, location_name=location, depth=10, save=False)
-                signal_count, signal_domains = _count_affiliate_signals(serp_raw)
-                kw_data["affiliate_signals"] = signal_count
-                kw_data["signal_domains"] = signal_domains
+        def check(kw_data: Dict) -> tuple:
+            serp_raw = get_google_serp(kw_data["keyword"], location_name=location, depth=10, save=False)
+            return _count_affiliate_signals(serp_raw)
+
+        done = []
+
+        def report(i, kw_data, signals, error):
+            done.append(i)
+            print(f"      [{len(done)}/{len(top_candidates)}] {kw_data['keyword']}")
+            if error is not None:
+                print(f"         ⚠️  SERP check failed: {error}")
+            elif signals[0] > 0:
+                print(f"         ✅ {signals[0]} affiliate signals: {signals[1][:2]}")
+
+        for kw_data, (signals, error) in zip(top_candidates, run_concurrent(check, top_candidates, on_result=report)):
+            if error is None:
+                kw_data["affiliate_signals"], kw_data["signal_domains"] = signals
                 kw_data["serp_checked"] = True
-                if signal_count > 0:
-                    print(f"         ✅ {signal_count} affiliate signals: {signal_domains[:2]}")
-            except Exception as e:
-                print(f"         ⚠️  SERP check failed: {e}")
     else:
         print("\n[3/4] Skipping SERP check (check_serp=False)")
 
@@ -163,8 +171,7 @@ def affiliate_keyword_miner(
         if kw_data["keyword"] in trend_data:
             kw_data["trend_peak"] = trend_data[kw_data["keyword"]]
 
-    filtered.sort(key=lambda x: x["avs"], reverse=True)
-    top_20 = filtered[:20]
+    top_20 = heapq.nlargest(20, filtered, key=lambda x: x["avs"])
 
     # Save CSV
     csv_path = results_dir / f"{timestamp}__affiliate_keywords__{topic.replace(' ', '_')}.csv"
@@ -178,7 +185,7 @@ def affiliate_keyword_miner(
     full_result = {
         "topic": topic,
         "filters": {"cpc_floor": cpc_floor, "kd_ceiling": kd_ceiling},
-        "total_ideas": len(keywords),
+        "total_ideas": total_ideas,
         "total_filtered": len(filtered),
         "top_20": top_20,
         "csv_path": str(csv_path),
@@ -190,65 +197,38 @@ def affiliate_keyword_miner(
     return full_result
 
 
-def _extract_keywords_from_ideas(raw: Dict) -> List[Dict]:
-    """Extract keyword items from Labs API response."""
-    keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            if not isinstance(task, dict):
-                continue
-            for result in task.get("result", []) or []:
-                if not isinstance(result, dict):
-                    continue
-                for item in result.get("items", []) or []:
-                    if isinstance(item, dict):
-                        keywords.append(item)
-    except Exception as e:
-        print(f"      ⚠️  Could not extract keywords: {e}")
-    return keywords
+def _reports_kd(item: Dict) -> bool:
+    """Whether an idea item carries a keyword_difficulty field at all (even null)."""
+    return "keyword_difficulty" in (item.get("keyword_properties") or {}) or "keyword_difficulty" in item
 
 
 def _count_affiliate_signals(serp_raw: Dict) -> tuple:
     """Count affiliate signals in top 10 SERP results."""
     count = 0
     found_domains = []
-    try:
-        tasks = serp_raw.get("tasks", []) if isinstance(serp_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    url = item.get("url", "") or ""
-                    domain = item.get("domain", "") or ""
-                    rank = item.get("rank_group", 99) or 99
-                    if rank > 10:
-                        continue
-                    for signal in AFFILIATE_SIGNALS + REVIEW_SIGNALS:
-                        if signal in url or signal in domain:
-                            count += 1
-                            if signal not in found_domains:
-                                found_domains.append(signal)
-    except Exception:
-        pass
+    for item in iter_items(serp_raw):
+        rank = item.get("rank_group", 99) or 99
+        if rank > 10:
+            continue
+        url = item.get("url", "") or ""
+        domain = item.get("domain", "") or ""
+        for signal in AFFILIATE_SIGNALS + REVIEW_SIGNALS:
+            if signal in url or signal in domain:
+                count += 1
+                if signal not in found_domains:
+                    found_domains.append(signal)
     return count, found_domains
 
 
 def _extract_trend_data(trends_raw: Dict) -> Dict:
     """Extract trend peak month per keyword."""
     trend_map = {}
-    try:
-        tasks = trends_raw.get("tasks", []) if isinstance(trends_raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                kw = result.get("keyword", "")
-                data = result.get("data", []) or []
-                if data and kw:
-                    peak = max(data, key=lambda x: x.get("values", [0])[0] if x.get("values") else 0)
-                    trend_map[kw] = peak.get("date_to", "")[:7]
-    except Exception:
-        pass
+    for result in iter_results(trends_raw):
+        kw = result.get("keyword", "")
+        data = [row for row in result.get("data") or [] if isinstance(row, dict)]
+        if data and kw:
+            peak = max(data, key=lambda x: (x.get("values") or [0])[0] or 0)
+            trend_map[kw] = (peak.get("date_to") or "")[:7]
     return trend_map
 
 
@@ -12,6 +12,7 @@ Usage:
 """
 import sys
 import csv
+import heapq
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -22,7 +23,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from api.labs import get_keyword_ideas, get_bulk_keyword_difficulty, get_search_intent, get_keywords_for_site
 from api.trends import get_trends_explore
+from core.clustering import cached_serp_urls, collapse_variants
+from core.items import LABS_KEYWORD, Field, iter_items, iter_rows
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
 # Content type thresholds
@@ -30,6 +34,7 @@ PILLAR_VOLUME = 5000    # Broad/hub topic (1000+ volume, informational intent)
 SPOKE_KD_MAX = 35       # Spoke articles - keep it achievable
 
 
+@metered("content_calendar")
 def content_calendar_builder(
     domain: str,
     seed_topics: Optional[List[str]] = None,
@@ -109,19 +114,19 @@ def content_calendar_builder(
         except Exception as e:
             print(f"      ⚠️  Failed for '{topic}': {e}")
 
-    # Deduplicate
-    seen = set()
-    unique_keywords = []
-    for kw in all_keywords:
-        if kw.get("keyword") and kw["keyword"] not in seen:
-            seen.add(kw["keyword"])
-            unique_keywords.append(kw)
+    # Collapse variants ("best X", "X best", "best X 2026") into one candidate per topic,
+    # represented by its highest-volume keyword
+    unique_keywords = collapse_variants(
+        all_keywords, score=lambda k: k["volume"],
+        serp_urls=cached_serp_urls([k["keyword"] for k in all_keywords], location_name=location)
+    )
+    keyword_count = len({k["keyword"] for k in all_keywords})
 
-    print(f"      Total unique keywords: {len(unique_keywords)}")
+    print(f"      Total unique keywords: {keyword_count} in {len(unique_keywords)} topics")
 
     if dry_run:
-        print(f"\n[DRY RUN] Would process {len(unique_keywords)} keywords into {days}-day calendar")
-        return {"dry_run": True, "keyword_count": len(unique_keywords)}
+        print(f"\n[DRY RUN] Would process {len(unique_keywords)} keyword topics into {days}-day calendar")
+        return {"dry_run": True, "keyword_count": keyword_count, "topic_count": len(unique_keywords)}
 
     # Step 3: Get search intent for top candidates
     top_candidates = _filter_calendar_candidates(unique_keywords, limit=60)
@@ -171,18 +176,12 @@ def _extract_top_topics(raw: Dict) -> List[str]:
     topics = []
     stop_words = {"the", "a", "an", "and", "or", "for", "of", "in", "on", "to", "how", "what", "is", "are"}
     word_freq = defaultdict(int)
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    kw = item.get("keyword", "")
-                    if kw:
-                        words = [w.lower() for w in kw.split() if w.lower() not in stop_words and len(w) > 3]
-                        for w in words:
-                            word_freq[w] += 1
-    except Exception:
-        pass
+    for item in iter_items(raw):
+        kw = item.get("keyword", "")
+        if kw:
+            words = [w.lower() for w in kw.split() if w.lower() not in stop_words and len(w) > 3]
+            for w in words:
+                word_freq[w] += 1
 
     # Get top 5 most common words as seed topics
     sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
@@ -192,56 +191,37 @@ def _extract_top_topics(raw: Dict) -> List[str]:
 def _extract_keyword_items(raw: Dict) -> List[Dict]:
     """Extract keyword items from Labs API response."""
     keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if isinstance(item, dict) and item.get("keyword"):
-                        ki = item.get("keyword_info", {}) or {}
-                        kp = item.get("keyword_properties", {}) or {}
-                        keywords.append({
-                            "keyword": item["keyword"],
-                            "volume": int(ki.get("search_volume", 0) or 0),
-                            "cpc": float(ki.get("cpc", 0) or 0),
-                            "kd": int(kp.get("keyword_difficulty", 50) or 50),
-                            "competition": ki.get("competition_level", "medium")
-                        })
-    except Exception as e:
-        print(f"      ⚠️  Could not extract keywords: {e}")
+    for row in iter_rows(raw, LABS_KEYWORD, where=lambda r: r["keyword"]):
+        row["kd"] = row["kd"] or 50
+        row["competition"] = row["competition"] or "medium"
+        keywords.append(row)
     return keywords
 
 
 def _filter_calendar_candidates(keywords: List[Dict], limit: int = 60) -> List[Dict]:
     """Filter and rank keywords for calendar candidacy."""
-    # Remove duplicates, require at least some volume
-    filtered = [k for k in keywords if k.get("volume", 0) > 50]
+    # Require at least some volume; keep only the best `limit` by score
+    filtered = (k for k in keywords if k.get("volume", 0) > 50)
 
     # Score: volume * (1 / max(kd, 1)) - balance traffic potential vs difficulty
-    for kw in filtered:
+    def score(kw):
         kd = kw.get("kd", 50) or 50
-        vol = kw.get("volume", 0)
-        kw["calendar_score"] = (vol ** 0.5) / max(kd / 10, 1)
+        kw["calendar_score"] = (kw.get("volume", 0) ** 0.5) / max(kd / 10, 1)
+        return kw["calendar_score"]
 
-    filtered.sort(key=lambda x: x.get("calendar_score", 0), reverse=True)
-    return filtered[:limit]
+    return heapq.nlargest(limit, filtered, key=score)
+
+
+_INTENT_LABEL = Field("keyword_intent.label", default="informational")
 
 
 def _extract_intent_map(raw: Dict) -> Dict[str, str]:
     """Build keyword -> intent mapping from intent API response."""
     intent_map = {}
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    kw = item.get("keyword", "")
-                    intent_data = item.get("keyword_intent", {}) or {}
-                    intent = intent_data.get("label", "informational")
-                    if kw:
-                        intent_map[kw] = intent
-    except Exception:
-        pass
+    for item in iter_items(raw):
+        kw = item.get("keyword", "")
+        if kw:
+            intent_map[kw] = _INTENT_LABEL(item)
     return intent_map
 
 
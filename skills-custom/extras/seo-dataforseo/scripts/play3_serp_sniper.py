@@ -20,7 +20,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from api.serp import get_google_serp, get_featured_snippet
 from api.labs import get_keyword_ideas, get_domain_keywords
+from core.domains import DomainIndex
+from core.executor import run_concurrent
+from core.items import KEYWORD, iter_items
 from core.storage import save_result
+from core.usage import metered, preflight
 from config.settings import settings
 
 # SERP feature types we care about
@@ -41,6 +45,7 @@ SNIPPET_TRIGGERS = ["how to", "what is", "how do", "why does", "best way to", "s
                     "types of", "benefits of", "how long", "how much", "what are"]
 
 
+@metered("serp_sniper")
 def serp_feature_sniper(
     keywords: Optional[List[str]] = None,
     domain: Optional[str] = None,
@@ -101,7 +106,7 @@ def serp_feature_sniper(
                     limit=min(limit * 2, 200),
                     save=True
                 )
-                keywords = _extract_domain_kws(kw_raw)
+                keywords = _extract_keywords(kw_raw)
                 print(f"      Got {len(keywords)} domain keywords")
             except Exception as e:
                 print(f"      ⚠️  Could not get domain keywords: {e}")
@@ -112,7 +117,7 @@ def serp_feature_sniper(
                 domain_name = domain.replace("www.", "").split(".")[0].replace("-", " ")
                 try:
                     ideas_raw = get_keyword_ideas(keywords=[domain_name], location_name=location, limit=100, save=True)
-                    extra = _extract_ideas_kws(ideas_raw)
+                    extra = _extract_keywords(ideas_raw)
                     keywords.extend(extra[:50])
                     print(f"      Total keywords: {len(keywords)}")
                 except Exception as e:
@@ -124,10 +129,11 @@ def serp_feature_sniper(
     # Prioritize snippet-trigger keywords
     keywords = _prioritize_snippet_triggers(keywords)[:min(limit, 100)]
 
+    estimated_cost = len(keywords) * 0.01
     if dry_run:
-        estimated_cost = len(keywords) * 0.01
         print(f"\n[DRY RUN] Would check {len(keywords)} keywords. Estimated cost: ~${estimated_cost:.2f}")
         return {"dry_run": True, "keywords_to_check": len(keywords), "estimated_cost": estimated_cost}
+    preflight(estimated_cost, f"{len(keywords)} keywords")
 
     # Step 2: Check SERP features for each keyword
     print(f"\n[2/3] Scanning {len(keywords)} keywords for SERP features...")
@@ -136,11 +142,25 @@ def serp_feature_sniper(
     you_own = []
     all_features_found = []
 
-    for i, kw in enumerate(keywords):
-        print(f"      [{i+1}/{len(keywords)}] {kw}...")
+    def check(kw: str) -> Dict:
+        serp_raw = get_featured_snippet(kw, location_name=location, save=False)
+        return _extract_serp_features(serp_raw, kw, domain)
+
+    done = []
+
+    def report(i, kw, features, error):
+        done.append(kw)
+        if error is None:
+            print(f"      [{len(done)}/{len(keywords)}] {kw}")
+        else:
+            print(f"      [{len(done)}/{len(keywords)}] {kw} ⚠️  Failed: {error}")
+
+    serp_results = run_concurrent(check, keywords, on_result=report)
+
+    for kw, (features, error) in zip(keywords, serp_results):
+        if error is not None:
+            continue
         try:
-            serp_raw = get_featured_snippet(kw, location_name=location, save=False)
-            features = _extract_serp_features(serp_raw, kw, domain)
             all_features_found.append(features)
 
             if features.get("has_featured_snippet"):
@@ -200,36 +220,9 @@ def serp_feature_sniper(
     return full_result
 
 
-def _extract_domain_kws(raw: Dict) -> List[str]:
-    """Extract keywords from domain keywords response."""
-    keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    kw = item.get("keyword", "")
-                    if kw and kw not in keywords:
-                        keywords.append(kw)
-    except Exception:
-        pass
-    return keywords
-
-
-def _extract_ideas_kws(raw: Dict) -> List[str]:
-    """Extract keywords from ideas response."""
-    keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    kw = item.get("keyword", "")
-                    if kw and kw not in keywords:
-                        keywords.append(kw)
-    except Exception:
-        pass
-    return keywords
+def _extract_keywords(raw: Dict) -> List[str]:
+    """Extract keywords from a domain keywords / ideas response, in order, without duplicates."""
+    return list(dict.fromkeys(kw for kw in map(KEYWORD, iter_items(raw)) if kw))
 
 
 def _prioritize_snippet_triggers(keywords: List[str]) -> List[str]:
@@ -259,47 +252,41 @@ def _extract_serp_features(raw: Dict, keyword: str, domain: Optional[str]) -> Di
         "features_present": []
     }
 
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for task_result in task.get("result", []) or []:
-                items = task_result.get("items", []) or []
-                for item in items:
-                    item_type = item.get("type", "")
-
-                    # Featured snippet
-                    if item_type == "featured_snippet":
-                        result["has_featured_snippet"] = True
-                        result["snippet_type"] = item.get("featured_snippet_type", "paragraph")
-                        url = item.get("url", "") or ""
-                        result["snippet_owner"] = item.get("domain", url.split("/")[2] if "//" in url else url)
-                        result["snippet_owner_domain"] = result["snippet_owner"]
-                        result["features_present"].append("featured_snippet")
-
-                    # PAA (People Also Ask)
-                    elif item_type == "people_also_ask":
-                        result["has_paa"] = True
-                        result["features_present"].append("people_also_ask")
-                        for paa_item in item.get("items", []) or []:
-                            q = paa_item.get("question", "") or paa_item.get("title", "")
-                            if q:
-                                result["paa_questions"].append(q)
-
-                    # Your rank
-                    elif item_type == "organic" and domain:
-                        item_domain = item.get("domain", "")
-                        if domain in item_domain or item_domain in domain:
-                            rank = item.get("rank_absolute", 0)
-                            if result["your_rank"] is None or rank < result["your_rank"]:
-                                result["your_rank"] = rank
-
-                    # Track all features
-                    if item_type in TARGET_FEATURES:
-                        if item_type not in result["features_present"]:
-                            result["features_present"].append(item_type)
-
-    except Exception as e:
-        print(f"         ⚠️  Feature extraction error: {e}")
+    index = DomainIndex([domain]) if domain else None
+    for item in iter_items(raw):
+        item_type = item.get("type", "")
+
+        # Featured snippet
+        if item_type == "featured_snippet":
+            result["has_featured_snippet"] = True
+            result["snippet_type"] = item.get("featured_snippet_type", "paragraph")
+            url = item.get("url", "") or ""
+            result["snippet_owner"] = item.get("domain", url.split("/")[2] if "//" in url else url)
+            result["snippet_owner_domain"] = result["snippet_owner"]
+            result["features_present"].append("featured_snippet")
+
+        # PAA (People Also Ask)
+        elif item_type == "people_also_ask":
+            result["has_paa"] = True
+            result["features_present"].append("people_also_ask")
+            for paa_item in item.get("items", []) or []:
+                if not isinstance(paa_item, dict):
+                    continue
+                q = paa_item.get("question", "") or paa_item.get("title", "")
+                if q:
+                    result["paa_questions"].append(q)
+
+        # Your rank
+        elif item_type == "organic" and index is not None:
+            if index.match(url=item.get("url") or "", domain=item.get("domain") or ""):
+                rank = item.get("rank_absolute", 0)
+                if result["your_rank"] is None or rank < result["your_rank"]:
+                    result["your_rank"] = rank
+
+        # Track all features
+        if item_type in TARGET_FEATURES:
+            if item_type not in result["features_present"]:
+                result["features_present"].append(item_type)
 
     return result
 
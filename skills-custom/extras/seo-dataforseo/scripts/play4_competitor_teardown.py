@@ -18,10 +18,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from api.labs import get_domain_keywords, get_keyword_overview
 from api.backlinks import get_backlinks_summary, get_domain_pages
+from core.executor import fan_out
+from core.items import CPC, KEYWORD, KEYWORD_DIFFICULTY, SEARCH_VOLUME, Field, Projection, iter_items, iter_results
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
 
+@metered("teardown")
 def competitor_teardown(
     competitor_domain: str,
     your_domain: Optional[str] = None,
@@ -62,54 +66,57 @@ def competitor_teardown(
     results_dir = Path(__file__).parent / "results" / "plays"
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    # The four pulls are independent - run them at once
+    print("\n   Pulling keywords, backlink profile and top pages in parallel...")
+    fetched, errors = fan_out({
+        "competitor_keywords": lambda: get_domain_keywords(
+            target_domain=competitor_domain, location_name=location, limit=kw_limit, save=True
+        ),
+        "your_keywords": (lambda: get_domain_keywords(
+            target_domain=your_domain, location_name=location, limit=kw_limit, save=True
+        )) if your_domain else None,
+        "backlink_profile": lambda: get_backlinks_summary(competitor_domain, save=True),
+        "top_pages": lambda: get_domain_pages(competitor_domain, limit=pages_limit, save=True),
+    })
+    if "competitor_keywords" in errors:
+        raise errors["competitor_keywords"]
+
     # Step 1: Keywords they rank for
-    print("\n[1/4] Pulling their organic keyword rankings...")
-    comp_keywords_raw = get_domain_keywords(
-        target_domain=competitor_domain,
-        location_name=location,
-        limit=kw_limit,
-        save=True
-    )
-    comp_keywords = _extract_domain_keywords(comp_keywords_raw)
+    print("\n[1/4] Their organic keyword rankings...")
+    comp_keywords = _extract_domain_keywords(fetched["competitor_keywords"])
     print(f"      Got {len(comp_keywords)} keywords")
 
     # Step 2: Your keywords (for gap analysis)
     your_keywords = set()
-    if your_domain:
-        print(f"\n[2/4] Pulling your keyword rankings ({your_domain})...")
-        your_kw_raw = get_domain_keywords(
-            target_domain=your_domain,
-            location_name=location,
-            limit=kw_limit,
-            save=True
-        )
-        your_kw_list = _extract_domain_keywords(your_kw_raw)
+    if not your_domain:
+        print("\n[2/4] Skipping gap analysis (no your_domain provided)")
+    elif "your_keywords" in errors:
+        print(f"\n[2/4] ⚠️  Your keyword rankings failed: {errors['your_keywords']}")
+    else:
+        print(f"\n[2/4] Your keyword rankings ({your_domain})...")
+        your_kw_list = _extract_domain_keywords(fetched["your_keywords"])
         your_keywords = {k["keyword"] for k in your_kw_list}
         print(f"      Got {len(your_keywords)} of your keywords")
-    else:
-        print("\n[2/4] Skipping gap analysis (no your_domain provided)")
 
     # Step 3: Backlink profile
-    print("\n[3/4] Pulling backlink profile...")
+    print("\n[3/4] Backlink profile...")
     backlink_profile = {}
-    try:
-        bl_raw = get_backlinks_summary(competitor_domain, save=True)
-        backlink_profile = _extract_backlink_summary(bl_raw)
+    if "backlink_profile" in errors:
+        print(f"      ⚠️  Backlink profile failed: {errors['backlink_profile']}")
+    else:
+        backlink_profile = _extract_backlink_summary(fetched["backlink_profile"])
         print(f"      DR: {backlink_profile.get('rank', 'N/A')} | "
               f"RD: {backlink_profile.get('referring_domains', 'N/A')} | "
               f"Spam: {backlink_profile.get('spam_score', 'N/A')}")
-    except Exception as e:
-        print(f"      ⚠️  Backlink profile failed: {e}")
 
     # Step 4: Top pages
-    print("\n[4/4] Pulling top pages...")
+    print("\n[4/4] Top pages...")
     top_pages = []
-    try:
-        pages_raw = get_domain_pages(competitor_domain, limit=pages_limit, save=True)
-        top_pages = _extract_top_pages(pages_raw)
+    if "top_pages" in errors:
+        print(f"      ⚠️  Top pages failed: {errors['top_pages']}")
+    else:
+        top_pages = _extract_top_pages(fetched["top_pages"])
         print(f"      Got {len(top_pages)} top pages")
-    except Exception as e:
-        print(f"      ⚠️  Top pages failed: {e}")
 
     # Gap analysis
     gaps = []
@@ -142,70 +149,46 @@ def competitor_teardown(
     return full_result
 
 
+_RANKED_KEYWORD = Projection(
+    keyword=KEYWORD,
+    rank=Field("ranked_serp_element.serp_item.rank_group", default=0),
+    volume=SEARCH_VOLUME,
+    cpc=CPC,
+    traffic_percent=Field("traffic_percent", default=0),
+    kd=KEYWORD_DIFFICULTY.with_default(0),
+    url=Field("ranked_serp_element.serp_item.url", default=""),
+)
+
+_BACKLINK_SUMMARY = Projection(
+    rank=Field("rank", default=0),
+    backlinks=Field("backlinks", default=0),
+    referring_domains=Field("referring_domains", default=0),
+    referring_ips=Field("referring_ips", default=0),
+    spam_score=Field("spam_score", default=0),
+    is_lost=Field("lost_backlinks", default=0),
+)
+
+_TOP_PAGE = Projection(
+    url=Field("url", default=""),
+    backlinks=Field("backlinks", default=0),
+    referring_domains=Field("referring_domains", default=0),
+    rank=Field("rank", default=0),
+)
+
+
 def _extract_domain_keywords(raw: Dict) -> List[Dict]:
     """Extract keyword rankings from Labs domain keywords response."""
-    keywords = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    kd = item.get("keyword_data", {}) or {}
-                    metrics = kd.get("keyword_info", {}) or {}
-                    keywords.append({
-                        "keyword": kd.get("keyword", item.get("keyword", "")),
-                        "rank": item.get("ranked_serp_element", {}).get("serp_item", {}).get("rank_group", 0),
-                        "volume": metrics.get("search_volume", 0) or 0,
-                        "cpc": metrics.get("cpc", 0) or 0,
-                        "traffic_percent": item.get("traffic_percent", 0) or 0,
-                        "kd": kd.get("keyword_properties", {}).get("keyword_difficulty", 0) or 0,
-                        "url": item.get("ranked_serp_element", {}).get("serp_item", {}).get("url", "")
-                    })
-    except Exception as e:
-        print(f"      ⚠️  Keyword extraction error: {e}")
-    return keywords
+    return [_RANKED_KEYWORD(item) for item in iter_items(raw)]
 
 
 def _extract_backlink_summary(raw: Dict) -> Dict:
     """Extract key metrics from backlinks summary response."""
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                if isinstance(result, dict):
-                    return {
-                        "rank": result.get("rank", 0),
-                        "backlinks": result.get("backlinks", 0),
-                        "referring_domains": result.get("referring_domains", 0),
-                        "referring_ips": result.get("referring_ips", 0),
-                        "spam_score": result.get("spam_score", 0),
-                        "is_lost": result.get("lost_backlinks", 0)
-                    }
-    except Exception:
-        pass
-    return {}
+    return next((_BACKLINK_SUMMARY(result) for result in iter_results(raw)), {})
 
 
 def _extract_top_pages(raw: Dict) -> List[Dict]:
     """Extract top pages from domain pages response."""
-    pages = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if isinstance(item, dict):
-                        pages.append({
-                            "url": item.get("url", ""),
-                            "backlinks": item.get("backlinks", 0),
-                            "referring_domains": item.get("referring_domains", 0),
-                            "rank": item.get("rank", 0)
-                        })
-    except Exception:
-        pass
-    return pages
+    return [_TOP_PAGE(item) for item in iter_items(raw)]
 
 
 def _build_report(competitor: str, your_domain: Optional[str], keywords: List[Dict],
@@ -21,7 +21,9 @@ from urllib.parse import urlparse
 sys.path.insert(0, str(Path(__file__).parent))
 
 from api.backlinks import get_bulk_backlinks_summary, get_referring_domains, get_backlinks_summary, get_domain_intersection
+from core.items import iter_items
 from core.storage import save_result
+from core.usage import metered, preflight
 from config.settings import settings
 
 MIN_DR_THRESHOLD = 10
@@ -33,22 +35,20 @@ def _get_referring_domain_set(domain: str, limit: int = 500) -> Dict[str, Dict]:
         if not result:
             return {}
         domains = {}
-        tasks = result.get("tasks", []) if isinstance(result, dict) else []
-        for task in tasks:
-            for res in task.get("result", []) or []:
-                for item in (res.get("items", []) or []):
-                    rd = item.get("domain", "") or item.get("referring_domain", "")
-                    if rd:
-                        domains[rd] = {
-                            "dr": item.get("rank", 0),
-                            "backlinks_to_target": item.get("backlinks", 1),
-                        }
+        for item in iter_items(result):
+            rd = item.get("domain", "") or item.get("referring_domain", "")
+            if rd:
+                domains[rd] = {
+                    "dr": item.get("rank", 0),
+                    "backlinks_to_target": item.get("backlinks", 1),
+                }
         return domains
     except Exception as e:
         print(f"  Error fetching referring domains for {domain}: {e}")
         return {}
 
 
+@metered("backlink_gap")
 def backlink_gap_finder(
     your_domain: str,
     competitor_domain: str,
@@ -80,6 +80,7 @@ def backlink_gap_finder(
     if dry_run:
         print(f"[DRY RUN] Would fetch RDs for 2 domains. Est. cost: ~$0.04-0.08")
         return {"dry_run": True, "estimated_cost": 0.06}
+    preflight(0.06, "2 domains")
 
     print(f"Fetching referring domains...")
     your_rds = _get_referring_domain_set(your_domain, limit=limit)
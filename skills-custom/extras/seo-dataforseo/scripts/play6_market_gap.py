@@ -24,6 +24,7 @@ from api.labs import get_keyword_ideas, get_search_intent, get_bulk_keyword_diff
 from api.serp import get_google_serp
 from api.backlinks import get_bulk_backlinks_summary
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
 # Domains that signal an affiliate-friendly SERP
@@ -106,6 +107,7 @@ def _check_serp_signals(keyword: str, location_name: str) -> Dict:
         return {"has_affiliate": False, "has_weak_comp": False, "top3_domains": [], "avg_dr": None}
 
 
+@metered("market_gap")
 def market_gap_finder(
     niche: str,
     min_volume: int = 300,
@@ -22,7 +22,13 @@ from typing import List, Dict, Any, Optional, Set
 sys.path.insert(0, str(Path(__file__).parent))
 
 from api.serp import get_google_maps_serp
+from core.business_index import register_businesses
+from core.checkpoint import Checkpoint
+from core.executor import run_concurrent
+from core.items import iter_items
+from core.task_queue import run_queued
 from core.storage import save_result
+from core.usage import metered, preflight
 from config.settings import settings
 
 # Major US cities by state for state-level scraping
@@ -53,14 +59,16 @@ US_CITIES_BY_STATE = {
 }
 
 
+@metered("local_scraper")
 def local_business_scraper(
     business_type: str,
     cities: Optional[List[str]] = None,
     state: Optional[str] = None,
     depth: int = 100,
     language_name: str = "English",
-    concurrent: int = 3,
-    deduplicate: bool = True
+    concurrent: Optional[int] = None,
+    deduplicate: bool = True,
+    queue: bool = False
 ) -> Dict[str, Any]:
     """
     Scrape any category of local businesses across a city list.
@@ -71,15 +79,23 @@ def local_business_scraper(
         state: US state name to use preset city list (e.g. "Minnesota")
         depth: Results per city, max 100 (default 100)
         language_name: Language (default "English")
-        concurrent: Concurrent API requests (default 3)
-        deduplicate: Remove duplicate businesses by place_id + website (default True)
+        concurrent: Concurrent API requests (default settings.MAX_CONCURRENT_REQUESTS);
+            the shared client keeps them under the account rate limit
+        deduplicate: Remove duplicate listings of one business - same place_id,
+            website, phone or name + street address (default True)
+        queue: Use the standard queue instead of live Maps calls - cheaper for
+            state-wide runs, results arrive within minutes and an interrupted
+            run resumes when called again with the same arguments
 
     Returns:
         Dict with:
-            - businesses: list of all unique businesses found
+            - businesses: list of all unique businesses found, each with first_seen
             - total: total count
+            - new_businesses: the ones no earlier scrape of this business type found
+            - new: their count
             - cities_scraped: list of cities processed
             - csv_path: path to saved CSV
+            - new_csv_path: path to a CSV of just the new businesses (None if none)
 
     Cost estimate: $0.002/city (100 results each)
 
@@ -95,7 +111,8 @@ def local_business_scraper(
         city_list = US_CITIES_BY_STATE.get(state, [])
         if not city_list:
             print(f"⚠️  State '{state}' not in preset list. Add it to US_CITIES_BY_STATE or pass cities= directly.")
-            return {"businesses": [], "total": 0, "cities_scraped": [], "csv_path": None}
+            return {"businesses": [], "total": 0, "new": 0, "new_businesses": [], "cities_scraped": [],
+                    "csv_path": None, "new_csv_path": None}
     else:
         raise ValueError("Provide either 'cities' list or 'state' name")
 
@@ -103,43 +120,75 @@ def local_business_scraper(
     results_dir = Path(__file__).parent / "results" / "plays"
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    # Finished cities are journaled, so an interrupted run resumes where it stopped
+    checkpoint = Checkpoint("local_scraper", {"business_type": business_type, "cities": city_list, "depth": depth})
+    pending = checkpoint.pending(city_list)
+
     print(f"\n🗺️  Local Business Scraper: '{business_type}'")
     print(f"   Cities: {len(city_list)} | Depth: {depth}/city")
-    print(f"   Est. cost: ${len(city_list) * 0.002:.3f}")
+    if checkpoint.resumed:
+        print(f"   Resuming: {len(city_list) - len(pending)}/{len(city_list)} cities already done")
+    print(f"   Est. cost: ${len(pending) * 0.002:.3f}")
+    preflight(len(pending) * 0.002, f"{len(pending)} cities")
 
     all_businesses = []
-    seen_ids: Set[str] = set()
-    cities_scraped = []
+    new_businesses = []
+    seen_ids: Set[int] = set()
 
-    # Process cities in batches
-    for i, city in enumerate(city_list):
+    def scrape_city(city: str) -> List[Dict]:
         # Embed city in keyword (Maps API doesn't accept location_name)
-        keyword = f"{business_type} {city}"
-        print(f"\n   [{i+1}/{len(city_list)}] {city}...")
-        try:
-            raw = get_google_maps_serp(
-                keyword=keyword,
-                depth=min(depth, 100),
-                save=False
-            )
-            businesses = _extract_businesses(raw, city)
-            new_count = 0
-            for biz in businesses:
-                dedup_key = biz.get("place_id") or biz.get("website") or biz.get("name", "")
-                if deduplicate and dedup_key and dedup_key in seen_ids:
-                    continue
-                if dedup_key:
-                    seen_ids.add(dedup_key)
-                all_businesses.append(biz)
-                new_count += 1
-            print(f"      {new_count} new businesses (total: {len(all_businesses)})")
-            cities_scraped.append(city)
-        except Exception as e:
-            print(f"      ⚠️  Failed: {e}")
+        raw = get_google_maps_serp(
+            keyword=f"{business_type} {city}",
+            depth=min(depth, 100),
+            save=False
+        )
+        return _extract_businesses(raw, city)
+
+    done = []
+
+    def report(i, city, businesses, error):
+        done.append(city)
+        if error is None:
+            checkpoint.record(city, businesses)
+            print(f"   [{len(done)}/{len(pending)}] {city}: {len(businesses)} listings")
+        else:
+            print(f"   [{len(done)}/{len(pending)}] {city}: ⚠️  Failed: {error}")
+
+    # Fan out across cities, then merge in city order so dedupe is deterministic
+    if queue:
+        requests = [{"keyword": f"{business_type} {city}", "location_code": settings.DEFAULT_LOCATION_CODE,
+                     "language_code": "en", "depth": min(depth, 100)} for city in pending]
+        city_results = run_queued(
+            "google_maps", requests,
+            func=lambda i, raw: _extract_businesses(raw, pending[i]),
+            on_result=lambda i, request, businesses, error: report(i, pending[i], businesses, error)
+        )
+    else:
+        city_results = run_concurrent(scrape_city, pending, max_workers=concurrent, on_result=report)
+    failed = [city for city, (_, error) in zip(pending, city_results) if error is not None]
+
+    # Match every listing against the persistent index: duplicates collapse onto one
+    # business id, and businesses no earlier run of this type found are new
+    cities_scraped = [city for city in city_list if city in checkpoint]
+    listings = [biz for city in cities_scraped for biz in checkpoint.get(city) or []]
+    for biz, entry in zip(listings, register_businesses(business_type, listings)):
+        if deduplicate and entry["business_id"] in seen_ids:
+            continue
+        seen_ids.add(entry["business_id"])
+        biz["first_seen"] = entry["first_seen"]
+        all_businesses.append(biz)
+        if entry["is_new"]:
+            new_businesses.append(biz)
 
     # Save CSV
     csv_path = results_dir / f"{timestamp}__local_scraper__{business_type.replace(' ', '_')}.csv"
     _save_businesses_csv(all_businesses, csv_path)
+    new_csv_path = None
+    if new_businesses and len(new_businesses) < len(all_businesses):
+        new_csv_path = csv_path.with_name(f"{csv_path.stem}__new.csv")
+        _save_businesses_csv(new_businesses, new_csv_path)
+    elif new_businesses:
+        new_csv_path = csv_path
 
     # Save JSON
     full_result = {
@@ -147,12 +196,23 @@ def local_business_scraper(
         "cities_scraped": cities_scraped,
         "total": len(all_businesses),
         "businesses": all_businesses,
-        "csv_path": str(csv_path)
+        "new": len(new_businesses),
+        "new_businesses": new_businesses,
+        "csv_path": str(csv_path),
+        "new_csv_path": str(new_csv_path) if new_csv_path else None
     }
     save_result(full_result, category="plays", operation="local_scraper", keyword=business_type)
+    if failed:
+        print(f"\n⚠️  {len(failed)} cities failed - run again with the same arguments to retry just those")
+        checkpoint.close()
+    else:
+        checkpoint.complete()
 
-    print(f"\n✅ Done! {len(all_businesses)} unique {business_type}s across {len(cities_scraped)} cities")
+    print(f"\n✅ Done! {len(all_businesses)} unique {business_type}s across {len(cities_scraped)} cities "
+          f"({len(new_businesses)} new since earlier scrapes)")
     print(f"   CSV: {csv_path.name}")
+    if new_csv_path and new_csv_path != csv_path:
+        print(f"   New only: {new_csv_path.name}")
 
     return full_result
 
@@ -160,41 +220,29 @@ def local_business_scraper(
 def _extract_businesses(raw: Dict, city: str) -> List[Dict]:
     """Extract business listings from Maps SERP response."""
     businesses = []
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    # Skip ads
-                    if item.get("type") == "maps_search_ad":
-                        continue
-
-                    address_info = item.get("address_info", {}) or {}
-                    rating_distribution = item.get("rating_distribution", {}) or {}
-
-                    biz = {
-                        "name": item.get("title", ""),
-                        "place_id": item.get("place_id", ""),
-                        "website": item.get("url", "") or item.get("domain", ""),
-                        "phone": item.get("phone", ""),
-                        "address": address_info.get("address", ""),
-                        "city": address_info.get("city", city.split(",")[0]),
-                        "state": address_info.get("region", ""),
-                        "zip": address_info.get("zip", ""),
-                        "rating": item.get("rating", {}).get("value", "") if isinstance(item.get("rating"), dict) else item.get("rating", ""),
-                        "reviews": item.get("rating", {}).get("votes_count", "") if isinstance(item.get("rating"), dict) else "",
-                        "latitude": item.get("latitude", ""),
-                        "longitude": item.get("longitude", ""),
-                        "category": item.get("category", ""),
-                        "rank": item.get("rank_group", ""),
-                        "scraped_city": city,
-                        "is_claimed": item.get("is_claimed", ""),
-                    }
-                    businesses.append(biz)
-    except Exception as e:
-        print(f"         ⚠️  Extraction error: {e}")
+    for item in iter_items(raw, exclude={"maps_search_ad"}):  # Skip ads
+        address_info = item.get("address_info", {}) or {}
+        rating = item.get("rating")
+
+        biz = {
+            "name": item.get("title", ""),
+            "place_id": item.get("place_id", ""),
+            "website": item.get("url", "") or item.get("domain", ""),
+            "phone": item.get("phone", ""),
+            "address": address_info.get("address", ""),
+            "city": address_info.get("city", city.split(",")[0]),
+            "state": address_info.get("region", ""),
+            "zip": address_info.get("zip", ""),
+            "rating": rating.get("value", "") if isinstance(rating, dict) else rating or "",
+            "reviews": rating.get("votes_count", "") if isinstance(rating, dict) else "",
+            "latitude": item.get("latitude", ""),
+            "longitude": item.get("longitude", ""),
+            "category": item.get("category", ""),
+            "rank": item.get("rank_group", ""),
+            "scraped_city": city,
+            "is_claimed": item.get("is_claimed", ""),
+        }
+        businesses.append(biz)
     return businesses
 
 
@@ -206,7 +254,7 @@ def _save_businesses_csv(businesses: List[Dict], path: Path):
 
     fieldnames = ["name", "website", "phone", "address", "city", "state", "zip",
                   "rating", "reviews", "category", "place_id", "latitude", "longitude",
-                  "rank", "scraped_city", "is_claimed"]
+                  "rank", "scraped_city", "is_claimed", "first_seen"]
 
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
@@ -10,20 +10,38 @@ Usage:
     result = local_pack_intel("vegan restaurant", "Minneapolis MN")
     result = local_pack_intel("cannabis dispensary", "Minneapolis MN", your_domain="mncannabishub.com")
     result = local_pack_intel("dog groomer", "Austin TX")
+
+    # Geo-grid: rank from a 5x5 grid of points around the business
+    result = local_grid_scan(["vegan restaurant", "vegan brunch"], "Green Leaf Cafe Minneapolis MN")
 """
 import sys
 import json
+import math
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from api.serp import get_google_maps_serp, get_google_serp
+from core.domains import normalize_domain
+from core.executor import run_concurrent
+from core.items import iter_items
 from core.storage import save_result
+from core.task_queue import run_queued
+from core.usage import metered, preflight
 from config.settings import settings
 
+# Geo-grid scan
+GRID_MAX_SIZE = 15
+# Grid points are rounded to ~10 m, so a re-scan (or another keyword) around
+# the same center sends identical requests and the response cache answers them
+GRID_COORD_DECIMALS = 4
+PACK_SIZE = 3                 # share of voice = share of grid points where a business is in the 3-pack
+GRID_COMPETITORS = 20         # competitors reported per keyword
+KM_PER_DEGREE_LAT = 111.32
+
 
 def _extract_maps_results(serp_raw: Dict) -> List[Dict]:
     """Pull structured data from a Google Maps SERP response."""
@@ -97,6 +115,7 @@ def _check_organic_local(keyword: str, city: str) -> List[Dict]:
         return []
 
 
+@metered("local_pack")
 def local_pack_intel(
     keyword: str,
     city: str,
@@ -225,3 +244,287 @@ def local_pack_intel(
             print(f"  {r['name']}: {', '.join(r['weaknesses'])}")
 
     return result
+
+
+def grid_points(center: Tuple[float, float], size: int = 5, spacing_km: float = 1.0) -> List[Tuple[float, float]]:
+    """
+    size x size (lat, lng) points `spacing_km` apart around a center point.
+
+    Row by row from the north-west corner; with an odd size the middle point
+    is the center itself.
+    """
+    lat, lng = center
+    half = (size - 1) / 2
+    dlat = spacing_km / KM_PER_DEGREE_LAT
+    dlng = spacing_km / (KM_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 0.01))
+    return [
+        (round(lat + (half - row) * dlat, GRID_COORD_DECIMALS),
+         round(lng + (col - half) * dlng, GRID_COORD_DECIMALS))
+        for row in range(size) for col in range(size)
+    ]
+
+
+def _grid_listings(raw: Dict, depth: int) -> List[Dict]:
+    """Maps listings at one grid point (ads skipped), keyed by place_id or name."""
+    listings = []
+    for item in iter_items(raw, exclude={"maps_search_ad"}):
+        name = item.get("title", "") or ""
+        listings.append({
+            "key": item.get("place_id") or name.lower(),
+            "name": name,
+            "place_id": item.get("place_id", "") or "",
+            "domain": normalize_domain(item.get("domain") or item.get("url") or ""),
+            "rank": item.get("rank_group") or len(listings) + 1,
+        })
+    return listings[:depth]
+
+
+def _is_business(listing: Dict, business: str) -> bool:
+    """Does a listing belong to `business` (a place_id, domain or name)?"""
+    business = business.strip()
+    if listing["place_id"] and listing["place_id"] == business:
+        return True
+    domain = normalize_domain(business)
+    if " " not in business and "." in domain:
+        return bool(listing["domain"]) and (listing["domain"] == domain or listing["domain"].endswith("." + domain))
+    return business.lower() in listing["name"].lower()
+
+
+def _heatmap(ranks: List[Optional[int]], size: int) -> List[List[Optional[int]]]:
+    return [ranks[row * size:(row + 1) * size] for row in range(size)]
+
+
+def _grid_keyword(keyword: str, point_listings: List[Optional[List[Dict]]], size: int,
+                  business: Optional[str]) -> Dict[str, Any]:
+    """Per-business rank grid, average rank and share of voice for one keyword."""
+    scanned = [i for i, listings in enumerate(point_listings) if listings is not None]
+    by_key: Dict[str, Dict] = {}
+    for i in scanned:
+        for listing in point_listings[i]:
+            entry = by_key.setdefault(listing["key"], {
+                "name": listing["name"], "domain": listing["domain"], "place_id": listing["place_id"],
+                "ranks": [None] * len(point_listings),
+            })
+            if entry["ranks"][i] is None:
+                entry["ranks"][i] = listing["rank"]
+
+    competitors = []
+    for entry in by_key.values():
+        found = [r for r in entry["ranks"] if r is not None]
+        competitors.append({
+            "name": entry["name"],
+            "domain": entry["domain"],
+            "place_id": entry["place_id"],
+            "points_found": len(found),
+            "avg_rank": round(sum(found) / len(found), 1),
+            "share_of_voice": round(sum(r <= PACK_SIZE for r in found) / len(scanned), 3),
+            "is_target": bool(business) and _is_business(entry, business),
+            "heatmap": _heatmap(entry["ranks"], size),
+        })
+    competitors.sort(key=lambda c: (-c["share_of_voice"], -c["points_found"], c["avg_rank"]))
+
+    target = next((c for c in competitors if c["is_target"]), None)
+    if target is None and business:
+        target = {"name": business, "domain": "", "place_id": "", "points_found": 0, "avg_rank": None,
+                  "share_of_voice": 0.0, "is_target": True, "heatmap": _heatmap([None] * len(point_listings), size)}
+    return {
+        "keyword": keyword,
+        "points_scanned": len(scanned),
+        "failed_points": [i for i, listings in enumerate(point_listings) if listings is None],
+        "target": target,
+        "competitors": competitors,
+    }
+
+
+@metered("local_grid")
+def local_grid_scan(
+    keywords: Union[str, List[str]],
+    center: Union[str, Tuple[float, float]],
+    business: Optional[str] = None,
+    grid_size: int = 5,
+    spacing_km: float = 1.0,
+    zoom: int = 15,
+    depth: int = 20,
+    queue: bool = False,
+    concurrent: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Geo-grid local rank scan: Maps rankings from a grid of points around a business.
+
+    Local rankings change block by block, so one search from the city center
+    says little. This samples a grid_size x grid_size grid of coordinates
+    around `center` and runs a Maps SERP from each point for every keyword,
+    all at once (run_concurrent, or the cheaper standard queue). The grid is
+    computed once and shared by every keyword; points are rounded to ~10 m so
+    re-scans around the same center are served by the response cache.
+
+    Args:
+        keywords: One keyword or a list (e.g. ["vegan restaurant", "vegan brunch"])
+        center: (lat, lng), or a Maps search for the business (e.g.
+            "Green Leaf Cafe Minneapolis MN") - its first listing's
+            location becomes the center and, without `business`, the tracked business
+        business: Business to track - place_id, domain or name (substring)
+        grid_size: Points per side (default 5 = 25 points, max GRID_MAX_SIZE)
+        spacing_km: Distance between neighboring points (default 1.0)
+        zoom: Maps zoom level for each search (default 15)
+        depth: Listings per point (default 20, max 100)
+        queue: Use the standard queue instead of live calls - much cheaper for
+            big grids, results within minutes, resumable if interrupted
+        concurrent: Concurrent live calls (default settings.MAX_CONCURRENT_REQUESTS)
+
+    Returns:
+        Dict with:
+            - center, grid_size, spacing_km, points: the grid, row by row from the north-west
+            - keywords: per keyword - target (heatmap, avg_rank, share_of_voice,
+              points_found), competitors (top GRID_COMPETITORS, same fields) and failed_points
+            - share_of_voice: competitors across all keywords, by mean share of voice
+            - report: markdown heat maps and leaderboard
+
+    Heat maps are grid_size rows of ranks (None = not in the top `depth` there).
+    Share of voice is the fraction of scanned points where a business is in the 3-pack.
+
+    Cost: one Maps SERP per keyword per point - $0.002 live, ~$0.0006 queued
+    (5x5 grid x 4 keywords = 100 SERPs)
+
+    Example:
+        >>> result = local_grid_scan("vegan restaurant", "Green Leaf Cafe Minneapolis MN")
+        >>> result = local_grid_scan(["dog groomer", "dog grooming"], (44.9778, -93.2650),
+        ...                          business="happytailsmn.com", grid_size=7, queue=True)
+    """
+    settings.validate()
+    keywords = list(dict.fromkeys([keywords] if isinstance(keywords, str) else keywords))
+    grid_size = max(1, min(int(grid_size), GRID_MAX_SIZE))
+    depth = max(1, min(int(depth), 100))
+    label = business
+
+    if isinstance(center, str):
+        raw = get_google_maps_serp(center, depth=10, save=False)
+        first = next((item for item in iter_items(raw, exclude={"maps_search_ad"})
+                      if item.get("latitude") is not None and item.get("longitude") is not None), None)
+        if first is None:
+            raise ValueError(f"No Maps listing with coordinates found for '{center}'")
+        if not business:
+            business = first.get("place_id") or first.get("title")
+            label = first.get("title") or business
+        print(f"   Centered on {first.get('title')} ({first['latitude']}, {first['longitude']})")
+        center = (float(first["latitude"]), float(first["longitude"]))
+
+    points = grid_points(center, grid_size, spacing_km)
+    coordinates = [f"{lat},{lng},{zoom}z" for lat, lng in points]
+    jobs = [(kw, p) for kw in keywords for p in range(len(points))]
+
+    print(f"\n🧭 Local Grid Scan: {len(keywords)} keyword(s) x {grid_size}x{grid_size} grid, {spacing_km:g} km apart")
+    print(f"   {len(jobs)} Maps SERPs ({'standard queue' if queue else 'live'}) | Tracking: {label or '-'}")
+    preflight(len(jobs) * (0.0006 if queue else 0.002), f"{len(jobs)} grid SERPs")
+
+    done = []
+
+    def report(i, job, listings, error):
+        done.append(i)
+        if error is not None:
+            kw, p = jobs[i]
+            print(f"   ⚠️  '{kw}' at {coordinates[p]}: {error}")
+        elif len(done) % 25 == 0 or len(done) == len(jobs):
+            print(f"   [{len(done)}/{len(jobs)}] grid points scanned")
+
+    if queue:
+        requests = [{"keyword": kw, "location_coordinate": coordinates[p], "language_code": "en", "depth": depth}
+                    for kw, p in jobs]
+        results = run_queued("google_maps", requests, func=lambda i, raw: _grid_listings(raw, depth),
+                             on_result=report)
+    else:
+        results = run_concurrent(
+            lambda job: _grid_listings(get_google_maps_serp(
+                job[0], depth=depth, save=False, location_coordinate=coordinates[job[1]]), depth),
+            jobs, max_workers=concurrent, on_result=report
+        )
+
+    point_listings = {kw: [None] * len(points) for kw in keywords}
+    for (kw, p), (listings, error) in zip(jobs, results):
+        if error is None:
+            point_listings[kw][p] = listings
+    per_keyword = [_grid_keyword(kw, point_listings[kw], grid_size, business) for kw in keywords]
+
+    # Share of voice across keywords: mean over keywords, 0 where a business never showed
+    overall: Dict[str, Dict] = {}
+    for kw_result in per_keyword:
+        for c in kw_result["competitors"]:
+            entry = overall.setdefault(c["place_id"] or c["name"].lower(), {
+                "name": c["name"], "domain": c["domain"], "is_target": c["is_target"],
+                "share_of_voice": 0.0, "ranks": [], "keywords_found": 0,
+            })
+            entry["share_of_voice"] += c["share_of_voice"] / len(per_keyword)
+            entry["ranks"].append(c["avg_rank"])
+            entry["keywords_found"] += 1
+    share_of_voice = sorted((
+        {"name": e["name"], "domain": e["domain"], "is_target": e["is_target"],
+         "share_of_voice": round(e["share_of_voice"], 3),
+         "avg_rank": round(sum(e["ranks"]) / len(e["ranks"]), 1), "keywords_found": e["keywords_found"]}
+        for e in overall.values()
+    ), key=lambda e: (-e["share_of_voice"], e["avg_rank"]))
+
+    for kw_result in per_keyword:
+        kw_result["competitors"] = kw_result["competitors"][:GRID_COMPETITORS]
+
+    result = {
+        "center": list(center),
+        "grid_size": grid_size,
+        "spacing_km": spacing_km,
+        "zoom": zoom,
+        "business": business,
+        "points": [list(point) for point in points],
+        "keywords": per_keyword,
+        "share_of_voice": share_of_voice[:GRID_COMPETITORS],
+        "report": _build_grid_report(per_keyword, share_of_voice, grid_size, label),
+        "timestamp": datetime.now().isoformat(),
+    }
+    save_result(result, category="plays", operation="local_grid",
+                keyword=f"{keywords[0]}_{label or 'grid'}".replace(" ", "_").lower())
+
+    print(f"\n✅ Grid scan complete: {sum(k['points_scanned'] for k in per_keyword)}/{len(jobs)} points")
+    print(result["report"][:1500])
+    return result
+
+
+def _build_grid_report(per_keyword: List[Dict], share_of_voice: List[Dict], size: int,
+                       business: Optional[str]) -> str:
+    """Markdown heat maps (tracked business per keyword) plus the share-of-voice leaderboard."""
+    lines = [f"# Local Grid Scan{': ' + business if business else ''}", ""]
+    for kw_result in per_keyword:
+        lines.extend([f"## {kw_result['keyword']}", ""])
+        target = kw_result["target"]
+        if target:
+            rank = f"avg rank {target['avg_rank']}" if target["avg_rank"] is not None else "not found"
+            lines.extend([
+                f"**{target['name']}:** {rank}, found at {target['points_found']}/{kw_result['points_scanned']} "
+                f"points, 3-pack share of voice {target['share_of_voice']:.0%}",
+                "",
+                "```",
+            ])
+            failed = set(kw_result["failed_points"])
+            for row, ranks in enumerate(target["heatmap"]):
+                cells = []
+                for col, r in enumerate(ranks):
+                    cells.append(" ??" if row * size + col in failed else " --" if r is None else f"{r:>3}")
+                lines.append(" ".join(cells))
+            lines.extend(["```", ""])
+        lines.extend([
+            "| Business | Share of voice | Avg rank | Points |",
+            "|----------|----------------|----------|--------|",
+        ])
+        for c in kw_result["competitors"][:10]:
+            marker = " ⭐" if c["is_target"] else ""
+            lines.append(f"| {c['name']}{marker} | {c['share_of_voice']:.0%} | {c['avg_rank']} | {c['points_found']} |")
+        lines.append("")
+
+    if len(per_keyword) > 1:
+        lines.extend([
+            "## Share of Voice (all keywords)",
+            "",
+            "| Business | Share of voice | Avg rank | Keywords |",
+            "|----------|----------------|----------|----------|",
+        ])
+        for c in share_of_voice[:10]:
+            marker = " ⭐" if c["is_target"] else ""
+            lines.append(f"| {c['name']}{marker} | {c['share_of_voice']:.0%} | {c['avg_rank']} | {c['keywords_found']} |")
+    return "\n".join(lines)
@@ -19,8 +19,11 @@ from typing import List, Dict, Any, Optional, Set
 sys.path.insert(0, str(Path(__file__).parent))
 
 from api.serp import get_google_serp
-from api.backlinks import get_backlinks_summary, get_bulk_backlinks_summary
+from api.backlinks import BULK_METRIC_ENDPOINTS, BULK_TARGETS_LIMIT, get_backlink_metrics
+from core.checkpoint import Checkpoint
+from core.items import iter_items
 from core.storage import save_result
+from core.usage import metered
 from config.settings import settings
 
 # Common patterns for expired/parked domains
@@ -38,6 +41,7 @@ HOSTED_SIGNALS = [
 ]
 
 
+@metered("expired_domains")
 def expired_domain_finder(
     niche_keywords: str,
     dr_floor: int = 10,
@@ -70,7 +74,7 @@ def expired_domain_finder(
             - csv_path: path to saved CSV
             - summary: markdown summary
 
-    Cost estimate: ~$0.002 (SERP) + $0.02/domain for backlinks = ~$0.02-0.62
+    Cost estimate: ~$0.002 (SERP) + a few bulk backlink requests per 1000 domains
 
     Example:
         >>> result = expired_domain_finder("home organization tips", dr_floor=15)
@@ -85,6 +89,16 @@ def expired_domain_finder(
     results_dir = Path(__file__).parent / "results" / "plays"
     results_dir.mkdir(parents=True, exist_ok=True)
 
+    # SERP pulls and backlink lookups are journaled as they finish, so a re-run
+    # with the same arguments after a crash only pays for what is left
+    checkpoint = Checkpoint("expired_domains", {
+        "niche_keywords": niche_keywords, "location": location,
+        "serp_depth": serp_depth, "check_domains": check_domains
+    })
+    if checkpoint.resumed:
+        print(f"   Resuming: {checkpoint.resumed} finished steps journaled")
+    failed = False
+
     # Step 1: Pull organic SERPs for multiple keyword variations
     print("\n[1/3] Pulling organic SERPs...")
     all_domains: Set[str] = set()
@@ -95,9 +109,14 @@ def expired_domain_finder(
     print(f"   Searching {len(search_terms)} keyword variations...")
 
     for term in search_terms:
+        unit = f"serp:{term}"
         try:
-            serp_raw = get_google_serp(term, location_name=location, depth=min(serp_depth, 100), save=False)
-            domains = _extract_domains_from_serp(serp_raw)
+            if unit in checkpoint:
+                domains = checkpoint.get(unit)
+            else:
+                serp_raw = get_google_serp(term, location_name=location, depth=min(serp_depth, 100), save=False)
+                domains = sorted(_extract_domains_from_serp(serp_raw))
+                checkpoint.record(unit, domains)
             for d in domains:
                 all_domains.add(d)
                 if d not in domain_keyword_map:
@@ -106,31 +125,40 @@ def expired_domain_finder(
                     domain_keyword_map[d].append(term)
             print(f"   '{term}' -> {len(domains)} domains")
         except Exception as e:
+            failed = True
             print(f"   ⚠️  SERP failed for '{term}': {e}")
 
     # Remove obviously irrelevant domains
     all_domains = _filter_irrelevant_domains(all_domains)
     print(f"\n   Found {len(all_domains)} unique domains total")
 
-    # Step 2: Get backlink profiles
-    domains_to_check = list(all_domains)[:check_domains]
+    # Step 2: Get backlink profiles (domains ranking for the most terms first, so
+    # the pick is stable across re-runs)
+    domains_to_check = sorted(all_domains, key=lambda d: (-len(domain_keyword_map.get(d, [])), d))[:check_domains]
+    to_fetch = [d for d in domains_to_check if f"backlinks:{d}" not in checkpoint]
     print(f"\n[2/3] Checking backlinks for {len(domains_to_check)} domains...")
-    print(f"   Est. cost: ${len(domains_to_check) * 0.02:.2f}")
+    print(f"   Bulk requests: {len(BULK_METRIC_ENDPOINTS) * -(-len(to_fetch) // BULK_TARGETS_LIMIT)}")
+
+    if to_fetch:
+        fetched = get_backlink_metrics(to_fetch)
+        for domain in to_fetch:
+            if fetched.get(domain):
+                checkpoint.record(f"backlinks:{domain}", fetched[domain])
+            else:  # {} = every lookup failed - keep the journal so the next run retries it
+                failed = True
+    bulk_metrics = {domain: checkpoint.get(f"backlinks:{domain}") for domain in domains_to_check}
 
     domain_metrics: Dict[str, Dict] = {}
-    for i, domain in enumerate(domains_to_check):
-        print(f"   [{i+1}/{len(domains_to_check)}] {domain}...")
-        try:
-            bl_raw = get_backlinks_summary(domain, save=False)
-            metrics = _extract_backlink_metrics(bl_raw)
-            metrics["domain"] = domain
-            metrics["ranking_keywords"] = domain_keyword_map.get(domain, [])
-            domain_metrics[domain] = metrics
-            print(f"      DR: {metrics.get('rank', '?')} | "
-                  f"RD: {metrics.get('referring_domains', '?')} | "
-                  f"Spam: {metrics.get('spam_score', '?')}")
-        except Exception as e:
-            print(f"      ⚠️  Failed: {e}")
+    for domain in domains_to_check:
+        found = bulk_metrics.get(domain)
+        if not found:
+            print(f"   ⚠️  {domain}: no backlink data")
+            continue
+        metrics = {field: found.get(field, 0) or 0 for field in BULK_METRIC_ENDPOINTS}
+        metrics["domain"] = domain
+        metrics["ranking_keywords"] = domain_keyword_map.get(domain, [])
+        domain_metrics[domain] = metrics
+    print(f"   Got metrics for {len(domain_metrics)}/{len(domains_to_check)} domains")
 
     # Step 3: Filter and score
     print(f"\n[3/3] Filtering and scoring candidates...")
@@ -173,6 +201,10 @@ def expired_domain_finder(
         "summary": summary
     }
     save_result(full_result, category="plays", operation="expired_domains", keyword=niche_keywords)
+    if failed:
+        checkpoint.close()
+    else:
+        checkpoint.complete()
 
     print(f"\n✅ Found {len(candidates)} domain candidates")
     print(summary[:800])
@@ -200,29 +232,23 @@ def _expand_keywords(keyword: str) -> List[str]:
     return result[:4]  # Keep to 4 to control cost
 
 
+_URL_HOST = re.compile(r"https?://(?:www\.)?([^/]+)")
+
+
 def _extract_domains_from_serp(raw: Dict) -> Set[str]:
     """Extract unique domains from SERP results."""
     domains = set()
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                for item in result.get("items", []) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    domain = item.get("domain", "") or ""
-                    url = item.get("url", "") or ""
-                    if not domain and url:
-                        # Extract domain from URL
-                        match = re.match(r"https?://(?:www\.)?([^/]+)", url)
-                        if match:
-                            domain = match.group(1)
-                    if domain:
-                        # Normalize - remove www
-                        domain = domain.lstrip("www.")
-                        domains.add(domain)
-    except Exception:
-        pass
+    for item in iter_items(raw):
+        domain = item.get("domain", "") or ""
+        url = item.get("url", "") or ""
+        if not domain and url:
+            # Extract domain from URL
+            match = _URL_HOST.match(url)
+            if match:
+                domain = match.group(1)
+        if domain:
+            # Normalize - remove www
+            domains.add(domain[4:] if domain.startswith("www.") else domain)
     return domains
 
 
@@ -247,24 +273,6 @@ def _filter_irrelevant_domains(domains: Set[str]) -> Set[str]:
     return filtered
 
 
-def _extract_backlink_metrics(raw: Dict) -> Dict:
-    """Extract metrics from backlinks summary response."""
-    try:
-        tasks = raw.get("tasks", []) if isinstance(raw, dict) else []
-        for task in tasks:
-            for result in task.get("result", []) or []:
-                if isinstance(result, dict):
-                    return {
-                        "rank": result.get("rank", 0) or 0,
-                        "backlinks": result.get("backlinks", 0) or 0,
-                        "referring_domains": result.get("referring_domains", 0) or 0,
-                        "spam_score": result.get("spam_score", 0) or 0,
-                    }
-    except Exception:
-        pass
-    return {"rank": 0, "backlinks": 0, "referring_domains": 0, "spam_score": 0}
-
-
 def _save_domains_csv(candidates: List[Dict], path: Path):
     """Save domain candidates to CSV."""
     if not candidates:
@@ -0,0 +1,111 @@
+"""
+Latency check for model selection (lib.models.get_models).
+
+Runs against a throwaway HOME, so the real ~/.cache/last30days is never
+touched, and with the model-listing request replaced by a slow stub, so no
+network is used. Measures:
+
+- warm: get_models() with a fresh model_selection.json - should cost a
+  stat(), not a file read, per call
+- stale: get_models() with the cache past its TTL - the stale selection must
+  come back immediately while the listing runs on a background thread
+
+Usage:
+    python3 bench_models.py                  # 5 runs of 2000 warm calls
+    python3 bench_models.py --runs 10 --calls 5000 --max-us 100
+
+Exits non-zero if the median warm call exceeds --max-us, or the stale call
+waits on the listing, so it can run as a CI/pre-commit gate.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# Simulated model-listing round trip for the stale call
+LISTING_DELAY = 0.5
+
+CONFIG = {"OPENAI_API_KEY": "sk-bench", "XAI_API_KEY": "xai-bench"}
+
+
+def _load_lib(home: str):
+    # lib.cache resolves its cache dir from HOME at import time
+    os.environ["HOME"] = home
+    sys.path.insert(0, str(SCRIPT_DIR))
+    from lib import cache, http, models
+    return cache, http, models
+
+
+def _stub_listing(http, calls: list):
+    def get(url, headers=None, **kwargs):
+        calls.append(url)
+        time.sleep(LISTING_DELAY)
+        raise http.HTTPError("network disabled in bench_models")
+    http.get = get
+
+
+def _bench_warm(models, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        models.get_models(CONFIG)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def _bench_stale(cache, models) -> tuple:
+    old = time.time() - (cache.MODEL_CACHE_TTL_DAYS + 1) * 86400
+    os.utime(cache.MODEL_CACHE_FILE, (old, old))
+    start = time.perf_counter()
+    selected = models.get_models(CONFIG)
+    elapsed = (time.perf_counter() - start) * 1000
+    for thread in threading.enumerate():
+        if thread.name.startswith("model-refresh-"):
+            thread.join()
+    return elapsed, selected
+
+
+def bench(runs: int, calls: int, max_us: float) -> bool:
+    with tempfile.TemporaryDirectory(prefix="last30days-bench-") as home:
+        cache, http, models = _load_lib(home)
+        listing_calls = []
+        _stub_listing(http, listing_calls)
+
+        cache.set_cached_model("openai", "gpt-5.2")
+        cache.set_cached_model("xai", "grok-4-1-fast")
+        _bench_warm(models, 100)  # warm the memo
+        samples = [_bench_warm(models, calls) for _ in range(runs)]
+        median = statistics.median(samples)
+        warm_listing = len(listing_calls)
+
+        stale_ms, selected = _bench_stale(cache, models)
+
+    print(f"warm get_models(): median {median:.1f} us/call  (min {min(samples):.1f}, "
+          f"max {max(samples):.1f}, {runs} x {calls} calls, limit {max_us:.0f} us)")
+    print(f"stale get_models(): {stale_ms:.1f} ms -> {selected['openai']}  "
+          f"(listing stub takes {LISTING_DELAY * 1000:.0f} ms, refreshed in background: "
+          f"{'yes' if len(listing_calls) > warm_listing else 'no'})")
+
+    ok = median <= max_us
+    if warm_listing:
+        ok = False
+        print(f"Warm calls hit the model listing {warm_listing} times")
+    if stale_ms >= LISTING_DELAY * 1000 or selected["openai"] != "gpt-5.2":
+        ok = False
+        print("Stale call waited on the model listing")
+    print("PASS" if ok else "FAIL")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Model selection latency benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--max-us", type=float, default=200.0)
+    args = parser.parse_args()
+
+    sys.exit(0 if bench(args.runs, args.calls, args.max_us) else 1)
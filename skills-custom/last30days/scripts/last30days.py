@@ -11,7 +11,10 @@ Options:
     --sources=MODE      Source selection: auto|reddit|x|both (default: auto)
     --quick             Faster research with fewer sources (8-12 each)
     --deep              Comprehensive research with more sources (50-70 Reddit, 40-60 X)
+    --stream            Stream the Reddit response; enrich threads as they arrive
     --debug             Enable verbose debug logging
+    --check-config      Validate configured API keys and exit
+    --comment-depth=N   Walk nested replies N levels deep for the top threads
 """
 
 import argparse
@@ -43,6 +46,14 @@ from lib import (
     xai_x,
 )
 
+# Concurrent thread fetches while streaming (reddit.com rate-limits aggressively)
+ENRICH_WORKERS = 4
+
+# With --comment-depth, only this many threads get the nested-reply walk
+DEEP_COMMENT_THREADS = 5
+# While streaming, thread ranking is unknown; walk the first threads at least this relevant
+DEEP_COMMENT_MIN_RELEVANCE = 0.7
+
 
 def load_fixture(name: str) -> dict:
     """Load a fixture file."""
@@ -116,6 +127,83 @@ def _search_reddit(
     return reddit_items, raw_openai, reddit_error
 
 
+def _stream_reddit(
+    topic: str,
+    config: dict,
+    selected_models: dict,
+    from_date: str,
+    to_date: str,
+    depth: str,
+    comment_depth: int = 0,
+) -> tuple:
+    """Stream Reddit via OpenAI and enrich each thread as soon as it is parsed.
+
+    Returns:
+        Tuple of (reddit_items, raw_openai, error) - items are already enriched
+    """
+    raw_openai = {}
+    reddit_error = None
+    reddit_items = []
+    futures = []
+    deep_threads = [0]  # Threads given the nested-reply walk so far
+
+    def stream_into_pool(query: str, final: dict, existing_urls: set):
+        for item in openai_reddit.stream_reddit(
+            config["OPENAI_API_KEY"],
+            selected_models["openai"],
+            query,
+            from_date,
+            to_date,
+            depth=depth,
+            final_response=final,
+        ):
+            if item["url"] in existing_urls:
+                continue
+            existing_urls.add(item["url"])
+            item["id"] = f"R{len(futures) + 1}"
+            item_depth = 0
+            if comment_depth and deep_threads[0] < DEEP_COMMENT_THREADS \
+                    and item.get("relevance", 0) >= DEEP_COMMENT_MIN_RELEVANCE:
+                deep_threads[0] += 1
+                item_depth = comment_depth
+            futures.append((item, pool.submit(
+                reddit_enrich.enrich_reddit_item, dict(item), comment_depth=item_depth,
+            )))
+
+    with ThreadPoolExecutor(max_workers=ENRICH_WORKERS) as pool:
+        seen_urls = set()
+        try:
+            stream_into_pool(topic, raw_openai, seen_urls)
+        except http.HTTPError as e:
+            raw_openai = {"error": str(e)}
+            reddit_error = f"API error: {e}"
+        except Exception as e:
+            raw_openai = {"error": str(e)}
+            reddit_error = f"{type(e).__name__}: {e}"
+        # An error event mid-stream ends the stream normally - don't report it as success
+        if not reddit_error and raw_openai.get("error"):
+            error = raw_openai["error"]
+            reddit_error = f"API error: {error.get('message', error) if isinstance(error, dict) else error}"
+
+        # Quick retry with simpler query if few results
+        if len(futures) < 5 and not reddit_error:
+            core = openai_reddit._extract_core_subject(topic)
+            if core.lower() != topic.lower():
+                try:
+                    stream_into_pool(core, {}, seen_urls)
+                except Exception:
+                    pass
+
+        for item, future in futures:
+            try:
+                reddit_items.append(future.result())
+            except Exception:
+                # Keep the unenriched item
+                reddit_items.append(item)
+
+    return reddit_items, raw_openai, reddit_error
+
+
 def _search_x(
     topic: str,
     config: dict,
@@ -127,6 +215,9 @@ def _search_x(
 ) -> tuple:
     """Search X via xAI (runs in thread).
 
+    Not streamed: X items need no per-item enrichment, so there is nothing
+    to overlap with generation.
+
     Returns:
         Tuple of (x_items, raw_xai, error)
     """
@@ -168,9 +259,15 @@ def run_research(
     depth: str = "default",
     mock: bool = False,
     progress: ui.ProgressDisplay = None,
+    stream: bool = False,
+    comment_depth: int = 0,
 ) -> tuple:
     """Run the research pipeline.
 
+    With stream=True (and not mock), the Reddit response is streamed and
+    threads are enriched as they are parsed, overlapping enrichment with
+    model generation. X is always fetched with a single request.
+
     Returns:
         Tuple of (reddit_items, x_items, web_needed, raw_openai, raw_xai, raw_reddit_enriched, reddit_error, x_error)
 
@@ -208,10 +305,16 @@ def run_research(
         if run_reddit:
             if progress:
                 progress.start_reddit()
-            reddit_future = executor.submit(
-                _search_reddit, topic, config, selected_models,
-                from_date, to_date, depth, mock
-            )
+            if stream and not mock:
+                reddit_future = executor.submit(
+                    _stream_reddit, topic, config, selected_models,
+                    from_date, to_date, depth, comment_depth
+                )
+            else:
+                reddit_future = executor.submit(
+                    _search_reddit, topic, config, selected_models,
+                    from_date, to_date, depth, mock
+                )
 
         if run_x:
             if progress:
@@ -246,21 +349,32 @@ def run_research(
             if progress:
                 progress.end_x(len(x_items))
 
+    # Streamed items were enriched while the response was still generating
+    if reddit_items and stream and not mock:
+        raw_reddit_enriched = list(reddit_items)
+
     # Enrich Reddit items with real data (sequential, but with error handling per-item)
-    if reddit_items:
+    elif reddit_items:
         if progress:
             progress.start_reddit_enrich(1, len(reddit_items))
 
+        # Most relevant threads get the (costlier) nested-reply walk
+        deep_ids = set()
+        if comment_depth:
+            ranked = sorted(reddit_items, key=lambda it: it.get("relevance", 0), reverse=True)
+            deep_ids = {id(it) for it in ranked[:DEEP_COMMENT_THREADS]}
+
         for i, item in enumerate(reddit_items):
             if progress and i > 0:
                 progress.update_reddit_enrich(i + 1, len(reddit_items))
 
+            item_depth = comment_depth if id(item) in deep_ids else 0
             try:
                 if mock:
                     mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
+                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread, comment_depth=item_depth)
                 else:
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item)
+                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, comment_depth=item_depth)
             except Exception as e:
                 # Log but don't crash - keep the unenriched item
                 if progress:
@@ -307,6 +421,23 @@ def main():
         action="store_true",
         help="Enable verbose debug logging",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the Reddit response and enrich threads as they arrive",
+    )
+    parser.add_argument(
+        "--check-config",
+        action="store_true",
+        help="Validate configured API keys (concurrently) and exit",
+    )
+    parser.add_argument(
+        "--comment-depth",
+        type=int,
+        default=0,
+        metavar="N",
+        help=f"Walk nested replies N levels deep for the top {DEEP_COMMENT_THREADS} threads",
+    )
     parser.add_argument(
         "--include-web",
         action="store_true",
@@ -322,6 +453,9 @@ def main():
         from lib import http as http_module
         http_module.DEBUG = True
 
+    if args.check_config:
+        sys.exit(check_config())
+
     # Determine depth
     if args.quick and args.deep:
         print("Error: Cannot use both --quick and --deep", file=sys.stderr)
@@ -420,6 +554,8 @@ def main():
         depth,
         args.mock,
         progress,
+        args.stream,
+        args.comment_depth,
     )
 
     # Processing phase
@@ -478,6 +614,21 @@ def main():
     output_result(report, args.emit, web_needed, args.topic, from_date, to_date, missing_keys)
 
 
+def check_config() -> int:
+    """Validate configured provider keys; returns the process exit code."""
+    config = env.get_config()
+    source = env.CONFIG_FILE if env.config_exists() else "environment only"
+    print(f"Config: {source}")
+
+    results = env.check_config(config)
+    for name, (ok, message) in results.items():
+        mark = "✓" if ok else "✗"
+        print(f"  {mark} {name}: {message}")
+
+    configured = [ok for ok, message in results.values() if message != "Not set"]
+    return 0 if configured and all(configured) else 1
+
+
 def output_result(
     report: schema.Report,
     emit_mode: str,
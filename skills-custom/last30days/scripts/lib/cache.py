@@ -3,6 +3,7 @@
 import hashlib
 import json
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -115,38 +116,91 @@ def clear_cache():
 # Model selection cache (longer TTL)
 MODEL_CACHE_FILE = CACHE_DIR / "model_selection.json"
 
+# In-process memo of model_selection.json, keyed by file mtime
+_model_cache_lock = threading.Lock()
+_model_cache_write_lock = threading.Lock()
+_model_cache_memo: Optional[dict] = None
+_model_cache_mtime: Optional[float] = None
 
-def load_model_cache() -> dict:
-    """Load model selection cache."""
-    if not is_cache_valid(MODEL_CACHE_FILE, MODEL_CACHE_TTL_DAYS * 24):
-        return {}
+
+def _read_model_cache_file() -> dict:
+    """Read model_selection.json through the in-process memo.
+
+    The file is only re-read when its mtime changes, so repeated lookups
+    in one run (and across topics in batch mode) cost a single stat().
+    """
+    global _model_cache_memo, _model_cache_mtime
 
     try:
-        with open(MODEL_CACHE_FILE, 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        mtime = MODEL_CACHE_FILE.stat().st_mtime
+    except OSError:
         return {}
 
+    with _model_cache_lock:
+        if _model_cache_memo is not None and _model_cache_mtime == mtime:
+            return _model_cache_memo
+
+        try:
+            with open(MODEL_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            data = {}
+
+        _model_cache_memo = data if isinstance(data, dict) else {}
+        _model_cache_mtime = mtime
+        return _model_cache_memo
+
+
+def is_model_cache_stale() -> bool:
+    """Check if the model selection cache is older than its TTL (or missing)."""
+    return not is_cache_valid(MODEL_CACHE_FILE, MODEL_CACHE_TTL_DAYS * 24)
+
+
+def load_model_cache(allow_stale: bool = False) -> dict:
+    """Load model selection cache.
+
+    Args:
+        allow_stale: Return entries past the TTL instead of an empty dict
+            (callers refresh them in the background)
+    """
+    if not allow_stale and is_model_cache_stale():
+        return {}
+    return dict(_read_model_cache_file())
+
 
 def save_model_cache(data: dict):
     """Save model selection cache."""
+    global _model_cache_memo, _model_cache_mtime
+
     ensure_cache_dir()
+    # Write-then-rename so a background refresh killed at exit never leaves a torn file
+    tmp_path = MODEL_CACHE_FILE.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
     try:
-        with open(MODEL_CACHE_FILE, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(data, f)
+        os.replace(tmp_path, MODEL_CACHE_FILE)
     except OSError:
-        pass
+        return
+
+    with _model_cache_lock:
+        _model_cache_memo = dict(data)
+        try:
+            _model_cache_mtime = MODEL_CACHE_FILE.stat().st_mtime
+        except OSError:
+            _model_cache_mtime = None
 
 
-def get_cached_model(provider: str) -> Optional[str]:
+def get_cached_model(provider: str, allow_stale: bool = False) -> Optional[str]:
     """Get cached model selection for a provider."""
-    cache = load_model_cache()
+    cache = load_model_cache(allow_stale=allow_stale)
     return cache.get(provider)
 
 
 def set_cached_model(provider: str, model: str):
     """Cache model selection for a provider."""
-    cache = load_model_cache()
-    cache[provider] = model
-    cache['updated_at'] = datetime.now(timezone.utc).isoformat()
-    save_model_cache(cache)
+    # Background refreshes may write concurrently; keep read-modify-write atomic
+    with _model_cache_write_lock:
+        cache = load_model_cache(allow_stale=True)
+        cache[provider] = model
+        cache['updated_at'] = datetime.now(timezone.utc).isoformat()
+        save_model_cache(cache)
@@ -1,15 +1,69 @@
 """Environment and API key management for last30days skill."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from . import http
 
 CONFIG_DIR = Path.home() / ".config" / "last30days"
 CONFIG_FILE = CONFIG_DIR / ".env"
 
+# Keys read from the environment / .env file
+CONFIG_KEYS = (
+    'OPENAI_API_KEY',
+    'XAI_API_KEY',
+    'OPENAI_MODEL_POLICY',
+    'OPENAI_MODEL_PIN',
+    'XAI_MODEL_POLICY',
+    'XAI_MODEL_PIN',
+)
+
+# Cheap authenticated endpoints used by check_config()
+PROVIDER_CHECK_URLS = {
+    'OPENAI_API_KEY': ("OpenAI", "https://api.openai.com/v1/models"),
+    'XAI_API_KEY': ("xAI", "https://api.x.ai/v1/models"),
+}
+
+# Parsed .env files keyed by path -> ((mtime_ns, size), env)
+_env_file_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+# Process-wide config, rebuilt only when the .env file or environment changes
+_config_lock = threading.Lock()
+_config: Optional[Dict[str, Any]] = None
+_config_key: Optional[tuple] = None
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 def load_env_file(path: Path) -> Dict[str, str]:
-    """Load environment variables from a file."""
+    """Load environment variables from a file.
+
+    Parsed results are cached by (mtime, size), so repeated calls only
+    stat() the file until it changes.
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        return {}
+
+    cached = _env_file_cache.get(path)
+    if cached and cached[0] == signature:
+        return dict(cached[1])
+
+    env = _parse_env_file(path)
+    _env_file_cache[path] = (signature, env)
+    return dict(env)
+
+
+def _parse_env_file(path: Path) -> Dict[str, str]:
     env = {}
     if not path.exists():
         return env
@@ -31,22 +85,74 @@ def load_env_file(path: Path) -> Dict[str, str]:
     return env
 
 
-def get_config() -> Dict[str, Any]:
-    """Load configuration from ~/.config/last30days/.env and environment."""
-    # Load from config file first
-    file_env = load_env_file(CONFIG_FILE)
+def get_config(refresh: bool = False) -> Dict[str, Any]:
+    """Load configuration from ~/.config/last30days/.env and environment.
+
+    Returns one process-wide config dict; it is only rebuilt when the .env
+    file changes on disk or one of the relevant environment variables does.
+    Treat it as read-only - copy before modifying.
+
+    Args:
+        refresh: Force a rebuild (e.g. after editing the .env file in-process)
+    """
+    global _config, _config_key
+
+    key = (_file_signature(CONFIG_FILE), tuple(os.environ.get(k) for k in CONFIG_KEYS))
+
+    with _config_lock:
+        if not refresh and _config is not None and key == _config_key:
+            return _config
+
+        # Load from config file first
+        file_env = load_env_file(CONFIG_FILE)
+
+        # Environment variables override file
+        _config = {
+            'OPENAI_API_KEY': os.environ.get('OPENAI_API_KEY') or file_env.get('OPENAI_API_KEY'),
+            'XAI_API_KEY': os.environ.get('XAI_API_KEY') or file_env.get('XAI_API_KEY'),
+            'OPENAI_MODEL_POLICY': os.environ.get('OPENAI_MODEL_POLICY') or file_env.get('OPENAI_MODEL_POLICY', 'auto'),
+            'OPENAI_MODEL_PIN': os.environ.get('OPENAI_MODEL_PIN') or file_env.get('OPENAI_MODEL_PIN'),
+            'XAI_MODEL_POLICY': os.environ.get('XAI_MODEL_POLICY') or file_env.get('XAI_MODEL_POLICY', 'latest'),
+            'XAI_MODEL_PIN': os.environ.get('XAI_MODEL_PIN') or file_env.get('XAI_MODEL_PIN'),
+        }
+        _config_key = key
+        return _config
+
+
+def _check_key(url: str, api_key: str) -> Tuple[bool, str]:
+    try:
+        http.get(url, headers={"Authorization": f"Bearer {api_key}"}, timeout=15, retries=1)
+        return True, "OK"
+    except http.HTTPError as e:
+        if e.status_code in (401, 403):
+            return False, f"Rejected ({e.status_code}) - check the key"
+        return False, str(e)
+
+
+def check_config(config: Dict[str, Any]) -> Dict[str, Tuple[bool, str]]:
+    """Validate all configured provider keys concurrently.
+
+    Each key is checked with an authenticated model-list request.
+
+    Returns:
+        Dict of provider name -> (ok, message); missing keys report (False, "Not set")
+    """
+    results = {}
+    futures = {}
+
+    with ThreadPoolExecutor(max_workers=len(PROVIDER_CHECK_URLS)) as executor:
+        for key, (name, url) in PROVIDER_CHECK_URLS.items():
+            api_key = config.get(key)
+            if not api_key:
+                results[name] = (False, "Not set")
+                continue
+            futures[name] = executor.submit(_check_key, url, api_key)
 
-    # Environment variables override file
-    config = {
-        'OPENAI_API_KEY': os.environ.get('OPENAI_API_KEY') or file_env.get('OPENAI_API_KEY'),
-        'XAI_API_KEY': os.environ.get('XAI_API_KEY') or file_env.get('XAI_API_KEY'),
-        'OPENAI_MODEL_POLICY': os.environ.get('OPENAI_MODEL_POLICY') or file_env.get('OPENAI_MODEL_POLICY', 'auto'),
-        'OPENAI_MODEL_PIN': os.environ.get('OPENAI_MODEL_PIN') or file_env.get('OPENAI_MODEL_PIN'),
-        'XAI_MODEL_POLICY': os.environ.get('XAI_MODEL_POLICY') or file_env.get('XAI_MODEL_POLICY', 'latest'),
-        'XAI_MODEL_PIN': os.environ.get('XAI_MODEL_PIN') or file_env.get('XAI_MODEL_PIN'),
-    }
+        for name, future in futures.items():
+            results[name] = future.result()
 
-    return config
+    # Report in declaration order regardless of completion order
+    return {name: results[name] for name, _ in PROVIDER_CHECK_URLS.values()}
 
 
 def config_exists() -> bool:
@@ -6,7 +6,7 @@ import sys
 import time
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urlencode
 
 DEFAULT_TIMEOUT = 30
@@ -124,6 +124,79 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
+def stream_sse(
+    url: str,
+    json_data: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> Iterator[Dict[str, Any]]:
+    """POST a JSON body and yield server-sent events as parsed JSON.
+
+    Only connection setup is covered by error handling; once events start
+    flowing, a dropped connection ends the stream with an HTTPError.
+
+    Args:
+        url: Request URL
+        json_data: JSON body (should request streaming from the provider)
+        headers: Optional headers dict
+        timeout: Socket timeout in seconds (per read, not total)
+
+    Yields:
+        Parsed `data:` payloads of each event
+
+    Raises:
+        HTTPError: On request failure
+    """
+    headers = headers or {}
+    headers.setdefault("User-Agent", USER_AGENT)
+    headers.setdefault("Content-Type", "application/json")
+    headers.setdefault("Accept", "text/event-stream")
+
+    data = json.dumps(json_data).encode('utf-8')
+    req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+
+    log(f"POST {url} (stream)")
+
+    try:
+        response = urllib.request.urlopen(req, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        body = None
+        try:
+            body = e.read().decode('utf-8')
+        except:
+            pass
+        log(f"HTTP Error {e.code}: {e.reason}")
+        raise HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
+    except urllib.error.URLError as e:
+        raise HTTPError(f"URL Error: {e.reason}")
+    except (OSError, TimeoutError) as e:
+        raise HTTPError(f"Connection error: {type(e).__name__}: {e}")
+
+    with response:
+        data_lines = []
+        try:
+            for raw_line in response:
+                line = raw_line.decode('utf-8').rstrip('\r\n')
+                if line.startswith('data:'):
+                    data_lines.append(line[5:].lstrip())
+                    continue
+                if line or not data_lines:
+                    continue  # event:/id: fields, comments, keep-alives
+
+                # Blank line terminates an event
+                payload = "\n".join(data_lines)
+                data_lines = []
+                if payload == "[DONE]":
+                    return
+                try:
+                    yield json.loads(payload)
+                except json.JSONDecodeError as e:
+                    log(f"Skipping malformed event: {e}")
+        except (OSError, TimeoutError) as e:
+            log(f"Stream error: {type(e).__name__}: {e}")
+            raise HTTPError(f"Stream interrupted: {type(e).__name__}: {e}")
+
+
 def get_reddit_json(path: str) -> Dict[str, Any]:
     """Fetch Reddit thread JSON.
 
@@ -150,3 +223,30 @@ def get_reddit_json(path: str) -> Dict[str, Any]:
     }
 
     return get(url, headers=headers)
+
+
+def get_reddit_more_children(link_id: str, children: List[str]) -> List[Dict[str, Any]]:
+    """Expand collapsed `more` comment stubs via Reddit's /api/morechildren.
+
+    Args:
+        link_id: Fullname of the submission (e.g., t3_abc123)
+        children: Comment ids from `more` stubs (max 100 per request)
+
+    Returns:
+        Flat list of things (t1 comments and further `more` stubs)
+    """
+    params = urlencode({
+        "api_type": "json",
+        "link_id": link_id,
+        "children": ",".join(children),
+        "raw_json": 1,
+    })
+    url = f"https://www.reddit.com/api/morechildren.json?{params}"
+
+    headers = {
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+    }
+
+    response = get(url, headers=headers)
+    return response.get("json", {}).get("data", {}).get("things", [])
@@ -0,0 +1,140 @@
+"""Incremental extraction of item objects from streamed model output."""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Start of the items array inside the model's JSON answer
+ITEMS_ARRAY_RE = re.compile(r'"items"\s*:\s*\[')
+
+# Keep this much unmatched text around so a key split across chunks still matches
+_KEY_LOOKBEHIND = 64
+
+
+class ItemStreamParser:
+    """Extract objects from a `{"items": [...]}` JSON text as it streams in.
+
+    Feed text chunks with `feed()`; each call returns the item dicts that
+    were completed by that chunk. Surrounding prose, markdown fences and a
+    truncated tail are tolerated - only fully closed objects are returned.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._obj_start = -1
+
+    @property
+    def done(self) -> bool:
+        """True once the closing bracket of the items array was seen."""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a text chunk and return any newly completed items."""
+        if self._done or not chunk:
+            return []
+
+        self._buf += chunk
+
+        if not self._in_array:
+            match = ITEMS_ARRAY_RE.search(self._buf, self._pos)
+            if not match:
+                self._pos = max(0, len(self._buf) - _KEY_LOOKBEHIND)
+                return []
+            self._in_array = True
+            self._buf = self._buf[match.end():]
+            self._pos = 0
+
+        return self._scan()
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        items = []
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+
+        while i < n:
+            ch = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                if self._depth == 0:
+                    self._obj_start = i
+                self._depth += 1
+            elif ch == '}' and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        obj = json.loads(buf[self._obj_start:i + 1])
+                    except json.JSONDecodeError:
+                        obj = None
+                    if isinstance(obj, dict):
+                        items.append(obj)
+                    self._obj_start = -1
+            elif ch == ']' and self._depth == 0:
+                self._done = True
+                break
+
+            i += 1
+
+        # Drop consumed text so the buffer only holds the open object
+        if self._depth > 0 and self._obj_start >= 0:
+            self._buf = buf[self._obj_start:]
+            self._pos = i - self._obj_start
+            self._obj_start = 0
+        else:
+            self._buf = ""
+            self._pos = 0
+
+        return items
+
+
+def iter_items(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield item dicts from an iterable of text chunks.
+
+    The iterable is always drained, even after the array closes, so that
+    wrappers like iter_output_text_deltas() still see the terminal event.
+    """
+    parser = ItemStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
+
+def extract_items(text: str) -> List[Dict[str, Any]]:
+    """Extract item dicts from a complete model output text."""
+    return list(iter_items([text]))
+
+
+def iter_output_text_deltas(events: Iterable[Dict[str, Any]], final: Dict[str, Any]) -> Iterator[str]:
+    """Yield output text deltas from Responses API stream events.
+
+    The terminal `response.completed` event carries the full response object;
+    it is copied into `final` so callers keep the raw response for output files.
+    Error events are copied into `final` as an `error` key.
+    """
+    for event in events:
+        etype = event.get("type", "")
+        if etype == "response.output_text.delta":
+            delta = event.get("delta")
+            if isinstance(delta, str):
+                yield delta
+        elif etype == "response.completed":
+            response = event.get("response")
+            if isinstance(response, dict):
+                final.update(response)
+        elif etype in ("error", "response.failed"):
+            error = event.get("error") or (event.get("response") or {}).get("error")
+            final["error"] = error or event
@@ -1,7 +1,8 @@
 """Model auto-selection for last30days skill."""
 
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
 from . import cache, http
 
@@ -17,6 +18,34 @@ XAI_ALIASES = {
 }
 
 
+# Providers with a background model-list refresh in flight
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _refresh_in_background(provider: str, refresh: Callable[[], object]):
+    """Run a cache refresh on a daemon thread (at most one per provider).
+
+    Used for stale-while-revalidate: the stale selection is returned right
+    away and the refreshed one is picked up by the next run.
+    """
+    with _refreshing_lock:
+        if provider in _refreshing:
+            return
+        _refreshing.add(provider)
+
+    def run():
+        try:
+            refresh()
+        except Exception as e:
+            http.log(f"Background model refresh for {provider} failed: {type(e).__name__}: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(provider)
+
+    threading.Thread(target=run, name=f"model-refresh-{provider}", daemon=True).start()
+
+
 def parse_version(model_id: str) -> Optional[Tuple[int, ...]]:
     """Parse semantic version from model ID.
 
@@ -68,11 +97,19 @@ def select_openai_model(
     if policy == "pinned" and pin:
         return pin
 
-    # Check cache first
-    cached = cache.get_cached_model("openai")
+    # Check cache first - a stale selection is still served, and refreshed
+    # in the background, so the model listing never blocks a run once cached
+    cached = cache.get_cached_model("openai", allow_stale=True)
     if cached:
+        if mock_models is None and cache.is_model_cache_stale():
+            _refresh_in_background("openai", lambda: _fetch_openai_model(api_key))
         return cached
 
+    return _fetch_openai_model(api_key, mock_models)
+
+
+def _fetch_openai_model(api_key: str, mock_models: Optional[List[Dict]] = None) -> str:
+    """List OpenAI models, pick the best mainline one and cache it."""
     # Fetch model list
     if mock_models is not None:
         models = mock_models
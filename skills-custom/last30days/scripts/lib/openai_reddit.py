@@ -3,9 +3,9 @@
 import json
 import re
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from . import http
+from . import http, jsonstream
 
 
 def _log_error(msg: str):
@@ -76,6 +76,45 @@ def _extract_core_subject(topic: str) -> str:
     return ' '.join(result[:3]) or topic  # Keep max 3 words
 
 
+def _headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _timeout(depth: str) -> int:
+    # Adjust timeout based on depth (generous for OpenAI web_search which can be slow)
+    return 90 if depth == "quick" else 120 if depth == "default" else 180
+
+
+def _build_payload(model: str, topic: str, from_date: str, to_date: str, depth: str) -> Dict[str, Any]:
+    """Build the Responses API request body."""
+    min_items, max_items = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
+
+    # Note: allowed_domains accepts base domain, not subdomains
+    # We rely on prompt to filter out developers.reddit.com, etc.
+    return {
+        "model": model,
+        "tools": [
+            {
+                "type": "web_search",
+                "filters": {
+                    "allowed_domains": ["reddit.com"]
+                }
+            }
+        ],
+        "include": ["web_search_call.action.sources"],
+        "input": REDDIT_SEARCH_PROMPT.format(
+            topic=topic,
+            from_date=from_date,
+            to_date=to_date,
+            min_items=min_items,
+            max_items=max_items,
+        ),
+    }
+
+
 def search_reddit(
     api_key: str,
     model: str,
@@ -103,39 +142,59 @@ def search_reddit(
     if mock_response is not None:
         return mock_response
 
-    min_items, max_items = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
+    payload = _build_payload(model, topic, from_date, to_date, depth)
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    return http.post(OPENAI_RESPONSES_URL, payload, headers=_headers(api_key), timeout=_timeout(depth))
 
-    # Adjust timeout based on depth (generous for OpenAI web_search which can be slow)
-    timeout = 90 if depth == "quick" else 120 if depth == "default" else 180
 
-    # Note: allowed_domains accepts base domain, not subdomains
-    # We rely on prompt to filter out developers.reddit.com, etc.
-    payload = {
-        "model": model,
-        "tools": [
-            {
-                "type": "web_search",
-                "filters": {
-                    "allowed_domains": ["reddit.com"]
-                }
-            }
-        ],
-        "include": ["web_search_call.action.sources"],
-        "input": REDDIT_SEARCH_PROMPT.format(
-            topic=topic,
-            from_date=from_date,
-            to_date=to_date,
-            min_items=min_items,
-            max_items=max_items,
-        ),
-    }
+def stream_reddit(
+    api_key: str,
+    model: str,
+    topic: str,
+    from_date: str,
+    to_date: str,
+    depth: str = "default",
+    final_response: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Stream Reddit items as the model generates them.
+
+    Same request as search_reddit() but with `stream: true`; items are
+    parsed out of the output text deltas and cleaned as soon as each
+    object closes, so enrichment can start before generation ends.
+
+    Args:
+        api_key: OpenAI API key
+        model: Model to use
+        topic: Search topic
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        depth: Research depth - "quick", "default", or "deep"
+        final_response: Optional dict filled with the completed raw response
 
-    return http.post(OPENAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    Yields:
+        Cleaned item dicts (same shape as parse_reddit_response)
+    """
+    final = final_response if final_response is not None else {}
+    payload = _build_payload(model, topic, from_date, to_date, depth)
+    payload["stream"] = True
+
+    events = http.stream_sse(
+        OPENAI_RESPONSES_URL, payload,
+        headers=_headers(api_key), timeout=_timeout(depth),
+    )
+    deltas = jsonstream.iter_output_text_deltas(events, final)
+
+    index = 0
+    for raw_item in jsonstream.iter_items(deltas):
+        clean_item = _clean_item(raw_item, index)
+        if clean_item:
+            index += 1
+            yield clean_item
+
+    if final.get("error"):
+        error = final["error"]
+        err_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+        _log_error(f"OpenAI API error: {err_msg}")
 
 
 def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -191,40 +250,41 @@ def parse_reddit_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
         print(f"[REDDIT WARNING] No output text found in OpenAI response. Keys present: {list(response.keys())}", flush=True)
         return items
 
-    # Extract JSON from the response
-    json_match = re.search(r'\{[\s\S]*"items"[\s\S]*\}', output_text)
-    if json_match:
-        try:
-            data = json.loads(json_match.group())
-            items = data.get("items", [])
-        except json.JSONDecodeError:
-            pass
+    # Extract items incrementally (tolerates prose around the JSON and a truncated tail)
+    items = jsonstream.extract_items(output_text)
 
     # Validate and clean items
     clean_items = []
-    for i, item in enumerate(items):
-        if not isinstance(item, dict):
-            continue
-
-        url = item.get("url", "")
-        if not url or "reddit.com" not in url:
-            continue
-
-        clean_item = {
-            "id": f"R{i+1}",
-            "title": str(item.get("title", "")).strip(),
-            "url": url,
-            "subreddit": str(item.get("subreddit", "")).strip().lstrip("r/"),
-            "date": item.get("date"),
-            "why_relevant": str(item.get("why_relevant", "")).strip(),
-            "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
-        }
-
-        # Validate date format
-        if clean_item["date"]:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
-                clean_item["date"] = None
-
-        clean_items.append(clean_item)
+    for item in items:
+        clean_item = _clean_item(item, len(clean_items))
+        if clean_item:
+            clean_items.append(clean_item)
 
     return clean_items
+
+
+def _clean_item(item: Any, index: int) -> Optional[Dict[str, Any]]:
+    """Validate and clean one raw item; returns None if it should be dropped."""
+    if not isinstance(item, dict):
+        return None
+
+    url = item.get("url", "")
+    if not url or "reddit.com" not in url:
+        return None
+
+    clean_item = {
+        "id": f"R{index+1}",
+        "title": str(item.get("title", "")).strip(),
+        "url": url,
+        "subreddit": str(item.get("subreddit", "")).strip().lstrip("r/"),
+        "date": item.get("date"),
+        "why_relevant": str(item.get("why_relevant", "")).strip(),
+        "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
+    }
+
+    # Validate date format
+    if clean_item["date"]:
+        if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
+            clean_item["date"] = None
+
+    return clean_item
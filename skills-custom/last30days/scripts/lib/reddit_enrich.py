@@ -1,11 +1,33 @@
 """Reddit thread enrichment with real engagement metrics."""
 
+import heapq
 import re
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import urlparse
 
 from . import http, dates
 
+# Number of top comments kept per thread
+TOP_COMMENTS = 10
+
+# Comment tree walking (opt-in, for a few high-value threads)
+DEFAULT_COMMENT_BUDGET = 500  # Max comments considered per thread
+MORE_CHILDREN_BATCH = 100  # Reddit's limit of ids per /api/morechildren call
+MORE_CHILDREN_CONCURRENCY = 3  # Parallel /api/morechildren calls per thread
+
+# Authors whose comments are never surfaced
+SKIPPED_AUTHORS = ("[deleted]", "[removed]")
+
+# Low-value comment bodies (matched at the start, case-insensitive)
+SKIP_RE = re.compile(
+    r'(?:this|same|agreed|exactly|yep|nope|yes|no|thanks|thank you)\.?$'
+    r'|lol|lmao|haha'
+    r'|\[deleted\]'
+    r'|\[removed\]',
+    re.IGNORECASE,
+)
+
 
 def extract_reddit_path(url: str) -> Optional[str]:
     """Extract the path from a Reddit URL.
@@ -49,11 +71,133 @@ def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Di
         return None
 
 
-def parse_thread_data(data: Any) -> Dict[str, Any]:
+def _make_comment(c_data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "score": c_data.get("score") or 0,
+        "created_utc": c_data.get("created_utc"),
+        "author": c_data.get("author", "[deleted]"),
+        "body": c_data["body"][:300],  # Truncate
+        "permalink": c_data.get("permalink"),
+    }
+
+
+def _comment_children(data: Any) -> List[Dict[str, Any]]:
+    if not isinstance(data, list) or len(data) < 2 or not isinstance(data[1], dict):
+        return []
+    return data[1].get("data", {}).get("children", [])
+
+
+def _iter_top_level_comments(data: Any) -> Iterator[Dict[str, Any]]:
+    for child in _comment_children(data):
+        if child.get("kind") == "t1":  # t1 = comment
+            yield child.get("data", {})
+
+
+def walk_comment_tree(
+    data: Any,
+    max_depth: int,
+    budget: int = DEFAULT_COMMENT_BUDGET,
+    fetch_more: bool = True,
+    concurrency: int = MORE_CHILDREN_CONCURRENCY,
+) -> Iterator[Dict[str, Any]]:
+    """Walk a thread's comment tree depth-first, down to max_depth.
+
+    Nested replies already present in the thread JSON are walked first.
+    Collapsed `more` stubs within the depth limit are then expanded through
+    /api/morechildren in batches of up to 100 ids, with at most
+    `concurrency` requests in flight, until the budget is spent.
+
+    Args:
+        data: Raw Reddit thread JSON (as returned by fetch_thread_data)
+        max_depth: Deepest reply level to include (0 = top-level only)
+        budget: Max comments yielded for this thread
+        fetch_more: Expand `more` stubs over the network
+        concurrency: Max parallel /api/morechildren requests
+
+    Yields:
+        Raw comment data dicts
+    """
+    more_ids = []
+    remaining = budget
+
+    # Explicit stack: (child, depth), reversed so output keeps thread order
+    stack = [(child, 0) for child in reversed(_comment_children(data))]
+    while stack and remaining > 0:
+        child, depth = stack.pop()
+        c_data = child.get("data", {})
+        if child.get("kind") == "more":
+            more_ids.extend(c_data.get("children", []))
+            continue
+        if child.get("kind") != "t1":
+            continue
+
+        remaining -= 1
+        yield c_data
+
+        replies = c_data.get("replies")
+        if depth < max_depth and isinstance(replies, dict):
+            nested = replies.get("data", {}).get("children", [])
+            stack.extend((reply, depth + 1) for reply in reversed(nested))
+
+    link_id = _submission_fullname(data)
+    if not fetch_more or not link_id:
+        return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while more_ids and remaining > 0:
+            # Never request more ids than the budget can still absorb
+            wanted = more_ids[:remaining]
+            more_ids = []
+            batches = [wanted[i:i + MORE_CHILDREN_BATCH] for i in range(0, len(wanted), MORE_CHILDREN_BATCH)]
+
+            for things in executor.map(lambda ids: _fetch_more_children(link_id, ids), batches):
+                for thing in things:
+                    t_data = thing.get("data", {})
+                    if t_data.get("depth", 0) > max_depth:
+                        continue
+                    if thing.get("kind") == "more":
+                        more_ids.extend(t_data.get("children", []))
+                    elif thing.get("kind") == "t1" and remaining > 0:
+                        remaining -= 1
+                        yield t_data
+
+
+def _submission_fullname(data: Any) -> Optional[str]:
+    if not isinstance(data, list) or not data or not isinstance(data[0], dict):
+        return None
+    children = data[0].get("data", {}).get("children", [])
+    if not children:
+        return None
+    sub_data = children[0].get("data", {})
+    if sub_data.get("name"):
+        return sub_data["name"]
+    return f"t3_{sub_data['id']}" if sub_data.get("id") else None
+
+
+def _fetch_more_children(link_id: str, ids: List[str]) -> List[Dict[str, Any]]:
+    try:
+        return http.get_reddit_more_children(link_id, ids)
+    except http.HTTPError:
+        return []
+
+
+def parse_thread_data(
+    data: Any,
+    top_k: Optional[int] = None,
+    comments: Optional[Iterable[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """Parse Reddit thread JSON into structured data.
 
+    Comments are scanned in a single pass. With `top_k`, only the k
+    highest-scoring comments from live authors are kept (via a bounded
+    heap), and only those are copied and truncated - the rest of a large
+    thread never becomes a dict.
+
     Args:
         data: Raw Reddit JSON response
+        top_k: Keep only the top-k comments by score, sorted descending
+        comments: Raw comment data to rank instead of the top-level
+            listing (e.g., from walk_comment_tree)
 
     Returns:
         Dict with submission and comments data
@@ -83,30 +227,34 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
             }
 
     # Second element is comments listing
-    if len(data) >= 2:
-        comments_listing = data[1]
-        if isinstance(comments_listing, dict):
-            children = comments_listing.get("data", {}).get("children", [])
-            for child in children:
-                if child.get("kind") != "t1":  # t1 = comment
-                    continue
-                c_data = child.get("data", {})
-                if not c_data.get("body"):
-                    continue
-
-                comment = {
-                    "score": c_data.get("score", 0),
-                    "created_utc": c_data.get("created_utc"),
-                    "author": c_data.get("author", "[deleted]"),
-                    "body": c_data.get("body", "")[:300],  # Truncate
-                    "permalink": c_data.get("permalink"),
-                }
-                result["comments"].append(comment)
+    if comments is None:
+        comments = _iter_top_level_comments(data)
+
+    if top_k is None:
+        for c_data in comments:
+            if not c_data.get("body"):
+                continue
+            result["comments"].append(_make_comment(c_data))
+        return result
 
+    # Min-heap of (score, -position, raw data); -position keeps earlier
+    # comments ahead on ties, matching a stable descending sort
+    heap = []
+    for position, c_data in enumerate(comments):
+        if not c_data.get("body") or c_data.get("author", "[deleted]") in SKIPPED_AUTHORS:
+            continue
+        entry = (c_data.get("score") or 0, -position, c_data)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    heap.sort(key=lambda e: e[:2], reverse=True)
+    result["comments"] = [_make_comment(c_data) for _, _, c_data in heap]
     return result
 
 
-def get_top_comments(comments: List[Dict], limit: int = 10) -> List[Dict[str, Any]]:
+def get_top_comments(comments: List[Dict], limit: int = TOP_COMMENTS) -> List[Dict[str, Any]]:
     """Get top comments sorted by score.
 
     Args:
@@ -117,12 +265,10 @@ def get_top_comments(comments: List[Dict], limit: int = 10) -> List[Dict[str, An
         Top comments sorted by score
     """
     # Filter out deleted/removed
-    valid = [c for c in comments if c.get("author") not in ("[deleted]", "[removed]")]
+    valid = (c for c in comments if c.get("author") not in SKIPPED_AUTHORS)
 
-    # Sort by score descending
-    sorted_comments = sorted(valid, key=lambda c: c.get("score", 0), reverse=True)
-
-    return sorted_comments[:limit]
+    # nlargest is stable for ties, like sorted(..., reverse=True)[:limit]
+    return heapq.nlargest(limit, valid, key=lambda c: c.get("score", 0))
 
 
 def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
@@ -148,13 +294,7 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
             continue
 
         # Skip low-value patterns
-        skip_patterns = [
-            r'^(this|same|agreed|exactly|yep|nope|yes|no|thanks|thank you)\.?$',
-            r'^lol|lmao|haha',
-            r'^\[deleted\]',
-            r'^\[removed\]',
-        ]
-        if any(re.match(p, body.lower()) for p in skip_patterns):
+        if SKIP_RE.match(body):
             continue
 
         # Truncate to first meaningful sentence or ~150 chars
@@ -178,12 +318,17 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
 def enrich_reddit_item(
     item: Dict[str, Any],
     mock_thread_data: Optional[Dict] = None,
+    comment_depth: int = 0,
+    comment_budget: int = DEFAULT_COMMENT_BUDGET,
 ) -> Dict[str, Any]:
     """Enrich a Reddit item with real engagement data.
 
     Args:
         item: Reddit item dict
         mock_thread_data: Mock data for testing
+        comment_depth: Also rank nested replies down to this depth, expanding
+            `more` stubs (0 = top-level comments only)
+        comment_budget: Max comments considered when comment_depth > 0
 
     Returns:
         Enriched item dict
@@ -195,9 +340,17 @@ def enrich_reddit_item(
     if not thread_data:
         return item
 
-    parsed = parse_thread_data(thread_data)
+    comments = None
+    if comment_depth > 0:
+        comments = walk_comment_tree(
+            thread_data,
+            comment_depth,
+            budget=comment_budget,
+            fetch_more=mock_thread_data is None,
+        )
+
+    parsed = parse_thread_data(thread_data, top_k=TOP_COMMENTS, comments=comments)
     submission = parsed.get("submission")
-    comments = parsed.get("comments", [])
 
     # Update engagement metrics
     if submission:
@@ -212,8 +365,8 @@ def enrich_reddit_item(
         if created_utc:
             item["date"] = dates.timestamp_to_date(created_utc)
 
-    # Get top comments
-    top_comments = get_top_comments(comments)
+    # Top comments (already selected and sorted by the parser)
+    top_comments = parsed.get("comments", [])
     item["top_comments"] = []
     for c in top_comments:
         permalink = c.get("permalink", "")
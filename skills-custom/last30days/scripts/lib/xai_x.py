@@ -5,7 +5,7 @@ import re
 import sys
 from typing import Any, Dict, List, Optional
 
-from . import http
+from . import http, jsonstream
 
 
 def _log_error(msg: str):
@@ -55,6 +55,43 @@ Rules:
 - Prefer posts with substantive content, not just links"""
 
 
+def _headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+def _timeout(depth: str) -> int:
+    # Adjust timeout based on depth (generous for API response time)
+    return 90 if depth == "quick" else 120 if depth == "default" else 180
+
+
+def _build_payload(model: str, topic: str, from_date: str, to_date: str, depth: str) -> Dict[str, Any]:
+    """Build the Responses API request body."""
+    min_items, max_items = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
+
+    # Use Agent Tools API with x_search tool
+    return {
+        "model": model,
+        "tools": [
+            {"type": "x_search"}
+        ],
+        "input": [
+            {
+                "role": "user",
+                "content": X_SEARCH_PROMPT.format(
+                    topic=topic,
+                    from_date=from_date,
+                    to_date=to_date,
+                    min_items=min_items,
+                    max_items=max_items,
+                ),
+            }
+        ],
+    }
+
+
 def search_x(
     api_key: str,
     model: str,
@@ -81,37 +118,9 @@ def search_x(
     if mock_response is not None:
         return mock_response
 
-    min_items, max_items = DEPTH_CONFIG.get(depth, DEPTH_CONFIG["default"])
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
+    payload = _build_payload(model, topic, from_date, to_date, depth)
 
-    # Adjust timeout based on depth (generous for API response time)
-    timeout = 90 if depth == "quick" else 120 if depth == "default" else 180
-
-    # Use Agent Tools API with x_search tool
-    payload = {
-        "model": model,
-        "tools": [
-            {"type": "x_search"}
-        ],
-        "input": [
-            {
-                "role": "user",
-                "content": X_SEARCH_PROMPT.format(
-                    topic=topic,
-                    from_date=from_date,
-                    to_date=to_date,
-                    min_items=min_items,
-                    max_items=max_items,
-                ),
-            }
-        ],
-    }
-
-    return http.post(XAI_RESPONSES_URL, payload, headers=headers, timeout=timeout)
+    return http.post(XAI_RESPONSES_URL, payload, headers=_headers(api_key), timeout=_timeout(depth))
 
 
 def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -166,52 +175,53 @@ def parse_x_response(response: Dict[str, Any]) -> List[Dict[str, Any]]:
     if not output_text:
         return items
 
-    # Extract JSON from the response
-    json_match = re.search(r'\{[\s\S]*"items"[\s\S]*\}', output_text)
-    if json_match:
-        try:
-            data = json.loads(json_match.group())
-            items = data.get("items", [])
-        except json.JSONDecodeError:
-            pass
+    # Extract items incrementally (tolerates prose around the JSON and a truncated tail)
+    items = jsonstream.extract_items(output_text)
 
     # Validate and clean items
     clean_items = []
-    for i, item in enumerate(items):
-        if not isinstance(item, dict):
-            continue
-
-        url = item.get("url", "")
-        if not url:
-            continue
-
-        # Parse engagement
-        engagement = None
-        eng_raw = item.get("engagement")
-        if isinstance(eng_raw, dict):
-            engagement = {
-                "likes": int(eng_raw.get("likes", 0)) if eng_raw.get("likes") else None,
-                "reposts": int(eng_raw.get("reposts", 0)) if eng_raw.get("reposts") else None,
-                "replies": int(eng_raw.get("replies", 0)) if eng_raw.get("replies") else None,
-                "quotes": int(eng_raw.get("quotes", 0)) if eng_raw.get("quotes") else None,
-            }
+    for item in items:
+        clean_item = _clean_item(item, len(clean_items))
+        if clean_item:
+            clean_items.append(clean_item)
+
+    return clean_items
 
-        clean_item = {
-            "id": f"X{i+1}",
-            "text": str(item.get("text", "")).strip()[:500],  # Truncate long text
-            "url": url,
-            "author_handle": str(item.get("author_handle", "")).strip().lstrip("@"),
-            "date": item.get("date"),
-            "engagement": engagement,
-            "why_relevant": str(item.get("why_relevant", "")).strip(),
-            "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
+
+def _clean_item(item: Any, index: int) -> Optional[Dict[str, Any]]:
+    """Validate and clean one raw item; returns None if it should be dropped."""
+    if not isinstance(item, dict):
+        return None
+
+    url = item.get("url", "")
+    if not url:
+        return None
+
+    # Parse engagement
+    engagement = None
+    eng_raw = item.get("engagement")
+    if isinstance(eng_raw, dict):
+        engagement = {
+            "likes": int(eng_raw.get("likes", 0)) if eng_raw.get("likes") else None,
+            "reposts": int(eng_raw.get("reposts", 0)) if eng_raw.get("reposts") else None,
+            "replies": int(eng_raw.get("replies", 0)) if eng_raw.get("replies") else None,
+            "quotes": int(eng_raw.get("quotes", 0)) if eng_raw.get("quotes") else None,
         }
 
-        # Validate date format
-        if clean_item["date"]:
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
-                clean_item["date"] = None
+    clean_item = {
+        "id": f"X{index+1}",
+        "text": str(item.get("text", "")).strip()[:500],  # Truncate long text
+        "url": url,
+        "author_handle": str(item.get("author_handle", "")).strip().lstrip("@"),
+        "date": item.get("date"),
+        "engagement": engagement,
+        "why_relevant": str(item.get("why_relevant", "")).strip(),
+        "relevance": min(1.0, max(0.0, float(item.get("relevance", 0.5)))),
+    }
 
-        clean_items.append(clean_item)
+    # Validate date format
+    if clean_item["date"]:
+        if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(clean_item["date"])):
+            clean_item["date"] = None
 
-    return clean_items
+    return clean_item